@@ -1,26 +1,130 @@
-from utils.syntax_tree import ASTNode
-from utils.ast_nodes import RangeNode, PrintNode, IdentifierNode, IntegerNode, StringNode
+import ast
+from typing import List, Optional, Tuple
+from utils.syntax_tree import ASTNode, NodeVisitor
+from utils.ast_nodes import ForLoopNode, BlockNode, RangeNode, PrintNode, IdentifierNode, IntegerNode, StringNode
+from utils.code_writer import CodeWriter
+from utils.diagnostic import Diagnostic
 from exceptions.semantic_exception import SemanticException
 
-class CodeGenerator:
+try:
+    import numpy
+except ImportError:  # NumPy é opcional; sem ele o backend 'numpy' gera loops Python comuns
+    numpy = None
+
+class CodeGenerator(NodeVisitor):
     """
     Classe responsável por gerar código a partir de uma árvore sintática.
+
+    Os corpos dos loops (que podem conter outros loops e blocos de declarações) são percorridos
+    sem recursão, por meio de `NodeVisitor`: ao entrar em um loop é gerado o seu cabeçalho, e ao
+    sair dele a indentação é restaurada. As linhas são acumuladas por um `CodeWriter`, que
+    controla a indentação, e o tempo de geração é linear no tamanho do código gerado. O mesmo
+    percurso constrói a árvore do módulo `ast` em `generate_ast`.
     """
 
+    # Nomes usados pelo código gerado no modo de saída com buffer
+    BUFFER_NAME = '_escreva_buffer'
+    FLUSH_NAME = '_escreva_flush'
+
+    # Função auxiliar e quantidade de valores formatados de uma vez pelo backend 'numpy'
+    FORMAT_NAME = '_escreva_format'
+    VECTOR_CHUNK = 65536
+
+    def __init__(self, buffered: bool = False, flush_size: int = 8192, backend: str = 'python'):
+        """
+        Inicializa o gerador com um escritor de código vazio.
+
+        Parameters:
+            buffered (bool, optional): Se True, o código gerado acumula as escritas de 'escreva' em um
+                buffer e as envia a `sys.stdout.write` em blocos, em vez de chamar `print` a cada
+                iteração. A saída produzida é idêntica. Padrão é False.
+            flush_size (int, optional): Quantidade de escritas acumuladas antes de cada envio. Padrão é 8192.
+            backend (str, optional): 'python' ou 'numpy'. Com 'numpy', loops 'para ... no intervalo(a, b)'
+                cujo corpo apenas escreve a variável do loop são gerados com `numpy.arange` e uma única
+                formatação vetorizada por bloco. Sem NumPy instalado, o loop Python é gerado. Padrão é 'python'.
+        """
+        if backend not in ('python', 'numpy'):
+            raise ValueError(f"Backend não suportado: {backend}")
+
+        self.code = CodeWriter()
+        self.buffered = buffered
+        self.flush_size = flush_size
+        self.backend = backend
+        self.vectorized = False
+
+        # Posição atribuída aos nós gerados por generate_ast
+        self.position = {'lineno': 1, 'col_offset': 0}
+
+        # Em generate_ast, as listas de declarações em construção, da mais externa à atual
+        self.__bodies = None
+
+        # Para cada loop aberto, se o seu corpo está sendo gerado (False se foi vetorizado)
+        self.__loops = []
+
     @staticmethod
-    def generate(tree, show_result=False):
+    def generate(tree, show_result=False, buffered=False, flush_size=8192, backend='python'):
         """
         Gera código a partir de uma árvore sintática.
 
         Args:
             tree: A árvore sintática.
             show_result (bool, optional): Indica se o resultado deve ser exibido. Padrão é False.
+            buffered (bool, optional): Ativa o modo de saída com buffer. Padrão é False.
+            flush_size (int, optional): Quantidade de escritas acumuladas antes de cada envio. Padrão é 8192.
+            backend (str, optional): 'python' ou 'numpy'. Padrão é 'python'.
 
         Returns:
             str: O código gerado.
         """
-        generator = CodeGenerator()
-        generator.code = []
+        generator = CodeGenerator(buffered, flush_size, backend)
+        code = generator.generate_code(tree)
+
+        if show_result:
+            print("Código Gerado:\n", code)
+
+        return code
+
+    @staticmethod
+    def generate_with_diagnostics(tree, show_result=False, buffered=False, flush_size=8192, backend='python') -> Tuple[str, List[Diagnostic]]:
+        """
+        Gera código sem parar no primeiro erro: uma entrada cuja geração falha é registrada como
+        diagnóstico e descartada, e as demais formam um único módulo.
+
+        Args:
+            tree: A árvore sintática.
+            show_result (bool, optional): Indica se o resultado deve ser exibido. Padrão é False.
+            buffered (bool, optional): Ativa o modo de saída com buffer. Padrão é False.
+            flush_size (int, optional): Quantidade de escritas acumuladas antes de cada envio. Padrão é 8192.
+            backend (str, optional): 'python' ou 'numpy'. Padrão é 'python'.
+
+        Returns:
+            Tuple[str, List[Diagnostic]]: O código gerado e os erros encontrados.
+        """
+        generator = CodeGenerator(buffered, flush_size, backend)
+        diagnostics = []
+        code = generator.generate_code(tree, diagnostics)
+
+        if show_result:
+            print("Código Gerado:\n", code)
+
+        return code, diagnostics
+
+    def generate_code(self, tree, diagnostics: Optional[List[Diagnostic]] = None):
+        """
+        Gera código usando esta instância. O escritor de código é reaproveitado entre as
+        chamadas, o que evita recriá-lo ao gerar código para muitas árvores seguidas.
+
+        Args:
+            tree: A árvore sintática.
+            diagnostics (List[Diagnostic], optional): Se fornecida, uma entrada cuja geração
+                falha é registrada nesta lista e descartada, em vez de interromper a geração.
+
+        Returns:
+            str: O código gerado.
+        """
+        self.code.clear()
+        self.__loops.clear()
+        self.vectorized = False
 
         # Verifica se tree é uma lista de dicionários
         if not isinstance(tree, list) or not all(isinstance(entry, dict) for entry in tree):
@@ -28,14 +132,119 @@ class CodeGenerator:
 
         # Gera o código para cada entrada na lista de dicionários
         for entry in tree:
-            generator.__generate_entry(entry)
+            if diagnostics is None:
+                self.__generate_entry(entry)
+                continue
+
+            # As linhas já escritas pela entrada com erro são descartadas
+            size = len(self.code.lines)
+            try:
+                self.__generate_entry(entry)
+            except SemanticException as e:
+                self.code.truncate(size)
+                self.__loops.clear()
+                diagnostics.append(Diagnostic('Geração de código', e.message))
+
+        if self.vectorized:
+            self.__generate_vector_format()
 
-        code = '\n'.join(generator.code)
+        if self.buffered and self.code:
+            self.__generate_buffer()
+
+        return self.code.getvalue()
+
+    @staticmethod
+    def generate_ast(tree, show_result=False) -> ast.Module:
+        """
+        Gera diretamente a árvore sintática do Python (módulo `ast`) a partir de uma árvore
+        sintática, sem passar por código-fonte. O resultado pode ser entregue diretamente a
+        `compile` ou a `Compiler.run`, evitando a etapa de `ast.parse`.
+
+        Args:
+            tree: A árvore sintática.
+            show_result (bool, optional): Indica se o resultado deve ser exibido. Padrão é False.
+
+        Returns:
+            ast.Module: O módulo Python gerado.
+        """
+        generator = CodeGenerator()
+
+        # Verifica se tree é uma lista de dicionários
+        if not isinstance(tree, list) or not all(isinstance(entry, dict) for entry in tree):
+            raise SemanticException("A árvore fornecida para o CodeGenerator deve ser uma lista de dicionários.")
+
+        body = []
+        generator.__bodies = [body]
+        for line, entry in enumerate(tree, start=1):
+            # A posição é atribuída na construção de cada nó, o que evita percorrer
+            # a árvore novamente com ast.fix_missing_locations
+            generator.position = {'lineno': line, 'col_offset': 0}
+            generator.__build_entry(entry)
+
+        module = ast.Module(body=body, type_ignores=[])
 
         if show_result:
-            print("Código Gerado:\n", code)
+            print("Código Gerado:\n", ast.unparse(module))
 
-        return code
+        return module
+
+    def __build_entry(self, entry) -> None:
+        """
+        Acrescenta à lista de declarações em construção os nós Python correspondentes a uma
+        entrada da árvore sintática.
+
+        Args:
+            entry (dict): A entrada da árvore sintática.
+        """
+        if 'type' not in entry:
+            raise SemanticException("Cada entrada na lista de dicionários deve ter uma chave 'type' para indicar o tipo.")
+
+        if entry['type'] == 'for_loop':
+            self.__generate_loop(CodeGenerator.__loop_target(entry), entry['iterable'], entry['body'])
+        elif entry['type'] == 'write':
+            call = ast.Call(
+                func=ast.Name(id='print', ctx=ast.Load(), **self.position),
+                args=[ast.Constant(entry['text'], **self.position)],
+                keywords=[ast.keyword(arg='end', value=ast.Constant('', **self.position), **self.position)],
+                **self.position)
+            self.__bodies[-1].append(ast.Expr(call, **self.position))
+        elif entry['type'] == 'unrolled_loop':
+            for value in entry['values']:
+                self.__bodies[-1].append(ast.Assign(
+                    targets=[ast.Name(id=CodeGenerator.__loop_target(entry), ctx=ast.Store(), **self.position)],
+                    value=ast.Constant(value, **self.position),
+                    **self.position))
+                self.visit(entry['body'])
+        else:
+            raise SemanticException(f"Tipo de entrada não suportado: {entry['type']}")
+
+    def __build_expression(self, expression_node) -> ast.expr:
+        """
+        Gera o nó Python correspondente a uma expressão.
+
+        Args:
+            expression_node: O nó correspondente à expressão.
+
+        Returns:
+            ast.expr: O nó Python gerado.
+        """
+        # O início implícito de 'intervalo(n)' é um ASTNode genérico, por isso a verificação usa node_type
+        node_type = getattr(expression_node, 'node_type', None)
+
+        if node_type == 'IDENTIFIER':
+            return ast.Name(id=CodeGenerator.__identifier_target(expression_node), ctx=ast.Load(), **self.position)
+        elif node_type == 'INTEGER':
+            return ast.Constant(int(expression_node.value), **self.position)
+        elif node_type == 'STRING':
+            return ast.Constant(CodeGenerator.string_value(expression_node), **self.position)
+        elif isinstance(expression_node, RangeNode):
+            return ast.Call(
+                func=ast.Name(id='range', ctx=ast.Load(), **self.position),
+                args=[self.__build_expression(expr) for expr in expression_node.children],
+                keywords=[],
+                **self.position)
+        else:
+            raise SemanticException(f"Tipo de expressão não suportado: {type(expression_node).__name__}")
 
     def __generate_entry(self, entry):
         """
@@ -51,6 +260,10 @@ class CodeGenerator:
         # Chama o método de geração correspondente com base no tipo da entrada
         if entry['type'] == 'for_loop':
             self.__generate_for_loop(entry)
+        elif entry['type'] == 'write':
+            self.__generate_write(entry)
+        elif entry['type'] == 'unrolled_loop':
+            self.__generate_unrolled_loop(entry)
         else:
             raise SemanticException(f"Tipo de entrada não suportado: {entry['type']}")
 
@@ -61,24 +274,266 @@ class CodeGenerator:
         Args:
             for_loop_entry (dict): A entrada correspondente ao loop 'for'.
         """
-        variable = for_loop_entry['variable']
-        iterable = for_loop_entry['iterable']
+        self.__generate_loop(CodeGenerator.__loop_target(for_loop_entry), for_loop_entry['iterable'], for_loop_entry['body'])
+
+    def __generate_loop(self, target, iterable, body):
+        """
+        Gera um loop do nível superior, cujo corpo é percorrido pelo `NodeVisitor`.
+
+        Args:
+            target (str): O nome da variável do loop no código gerado.
+            iterable: O iterável do loop.
+            body: O corpo do loop.
+        """
+        if self.__enter_loop(target, iterable, body):
+            self.visit(body)
+        self.__leave_loop()
+
+    def visit_for_loop(self, for_loop_node: ForLoopNode) -> List[ASTNode]:
+        """
+        Gera o cabeçalho de um loop aninhado.
+
+        Args:
+            for_loop_node (ForLoopNode): O nó do loop.
+
+        Returns:
+            List[ASTNode]: O corpo do loop, ou nenhum nó se o loop foi vetorizado.
+        """
+        iterable, body = for_loop_node.children
+        return self.__enter_loop(CodeGenerator.__identifier_target(for_loop_node), iterable, body)
 
-        # Gera o código para o cabeçalho do loop
-        self.code.append(f"for {variable} in {self.__generate_expression(iterable)}:")
+    def leave_for_loop(self, for_loop_node: ForLoopNode) -> None:
+        """
+        Encerra um loop aninhado depois que o seu corpo foi gerado.
 
-        # Gera o código para o corpo do loop
-        self.__generate_statement(for_loop_entry)
+        Args:
+            for_loop_node (ForLoopNode): O nó do loop.
+        """
+        self.__leave_loop()
 
-    def __generate_print_statement(self, print_entry):
+    def visit_block(self, block_node: BlockNode) -> List[ASTNode]:
         """
-        Gera código para uma declaração 'print' na árvore sintática.
+        Gera as declarações de um bloco, em sequência.
 
         Args:
-            print_entry (dict): A entrada correspondente à declaração 'print'.
+            block_node (BlockNode): O nó do bloco.
+
+        Returns:
+            List[ASTNode]: As declarações do bloco.
         """
-        expression = print_entry['body']
-        self.code.append(f"{' ' * 4}print({self.__generate_expression(expression)})")
+        return block_node.children
+
+    def visit_print(self, print_node: PrintNode) -> None:
+        """
+        Gera uma declaração 'escreva'.
+
+        Args:
+            print_node (PrintNode): O nó da declaração.
+        """
+        if self.__bodies is None:
+            self.__emit_print(self.__generate_expression(print_node))
+            return
+
+        call = ast.Call(
+            func=ast.Name(id='print', ctx=ast.Load(), **self.position),
+            args=[self.__build_expression(expr) for expr in print_node.children],
+            keywords=[],
+            **self.position)
+        self.__bodies[-1].append(ast.Expr(call, **self.position))
+
+    def generic_visit(self, node: ASTNode) -> None:
+        """
+        Rejeita um nó que não pode ocupar a posição de uma declaração.
+
+        Args:
+            node (ASTNode): O nó encontrado.
+        """
+        raise SemanticException(f"Tipo de declaração não suportado: {node}")
+
+    def __enter_loop(self, target, iterable, body) -> List[ASTNode]:
+        """
+        Abre um loop: emite o seu cabeçalho e aumenta a indentação ou, em `generate_ast`, cria o
+        nó `ast.For` e passa a construir o seu corpo. Um loop vetorizado pelo backend 'numpy' é
+        gerado por completo, e o seu corpo não é percorrido.
+
+        Args:
+            target (str): O nome da variável do loop no código gerado.
+            iterable: O iterável do loop.
+            body: O corpo do loop.
+
+        Returns:
+            List[ASTNode]: O corpo a ser percorrido, ou nenhum nó.
+        """
+        if self.__bodies is not None:
+            loop = ast.For(
+                target=ast.Name(id=target, ctx=ast.Store(), **self.position),
+                iter=self.__build_expression(iterable),
+                body=[],
+                orelse=[],
+                **self.position)
+            self.__bodies[-1].append(loop)
+            self.__bodies.append(loop.body)
+        elif self.backend == 'numpy' and numpy is not None and self.__is_vectorizable(target, iterable, body):
+            self.__generate_vectorized_loop(iterable)
+            self.__loops.append(False)
+            return []
+        else:
+            self.code.write(f"for {target} in {self.__generate_expression(iterable)}:")
+            self.code.indent()
+
+        self.__loops.append(True)
+        return [body]
+
+    def __leave_loop(self) -> None:
+        """
+        Fecha o loop aberto mais interno, restaurando a indentação (ou a lista de declarações
+        em construção) anterior a ele.
+        """
+        if self.__loops.pop():
+            if self.__bodies is not None:
+                self.__bodies.pop()
+            else:
+                self.code.dedent()
+
+    @staticmethod
+    def __is_vectorizable(target, iterable, body):
+        """
+        Verifica se um loop pode ser gerado pelo backend 'numpy': o iterável deve ser um
+        intervalo e o corpo deve apenas escrever a variável do loop.
+
+        Args:
+            target (str): O nome da variável do loop no código gerado.
+            iterable: O iterável do loop.
+            body: O corpo do loop.
+
+        Returns:
+            bool: True se o loop puder ser vetorizado.
+        """
+        return (isinstance(iterable, RangeNode)
+                and len(iterable.children) == 2
+                and isinstance(body, PrintNode)
+                and len(body.children) == 1
+                and isinstance(body.children[0], IdentifierNode)
+                and CodeGenerator.__identifier_target(body.children[0]) == target)
+
+    def __generate_vectorized_loop(self, range_node):
+        """
+        Gera código para um loop vetorizado com NumPy. Os valores do intervalo são percorridos em
+        blocos de `VECTOR_CHUNK` valores, e cada bloco é formatado de uma vez pela função auxiliar
+        gerada por `__generate_vector_format` e escrito em uma única chamada.
+
+        Args:
+            range_node (RangeNode): O intervalo percorrido pelo loop.
+        """
+        start, end = (self.__generate_atom(expr) for expr in range_node.children)
+        chunk = self.VECTOR_CHUNK
+        self.vectorized = True
+
+        self.code.write(f"_escreva_end = {end}")
+        self.code.write(f"for _escreva_start in range({start}, _escreva_end, {chunk}):")
+        self.code.indent()
+        text = f"{self.FORMAT_NAME}(_escreva_start, min(_escreva_start + {chunk}, _escreva_end))"
+
+        if self.buffered:
+            self.__emit_write(text)
+        else:
+            self.code.write(f"_escreva_sys.stdout.write({text})")
+        self.code.dedent()
+
+    def __generate_vector_format(self):
+        """
+        Insere no início do código a função que formata um intervalo de inteiros, um por linha.
+
+        Os dígitos de todos os valores são calculados com operações do NumPy em uma matriz de
+        bytes, da qual são removidas as posições não usadas por cada valor (zeros à esquerda e o
+        sinal dos positivos). Valores fora do alcance de int64 são formatados com `str`.
+        """
+        self.code.prepend([
+            "import numpy as _escreva_numpy",
+            "import sys as _escreva_sys",
+            f"def {self.FORMAT_NAME}(start, stop):",
+            "    limit = max(abs(start), abs(stop - 1))",
+            "    if limit >= 10 ** 18:",
+            "        return ''.join(f'{value}\\n' for value in range(start, stop))",
+            "    values = _escreva_numpy.arange(start, stop, dtype=_escreva_numpy.int64)",
+            "    magnitude = _escreva_numpy.abs(values)",
+            "    width = len(str(limit))",
+            "    powers = 10 ** _escreva_numpy.arange(width - 1, -1, -1, dtype=_escreva_numpy.int64)",
+            "    digits = _escreva_numpy.maximum(_escreva_numpy.searchsorted(powers[::-1], magnitude, side='right'), 1)",
+            "    text = _escreva_numpy.empty((len(values), width + 2), dtype=_escreva_numpy.uint8)",
+            "    text[:, 0] = 45",
+            "    text[:, 1:-1] = magnitude[:, None] // powers % 10 + 48",
+            "    text[:, -1] = 10",
+            "    keep = _escreva_numpy.arange(width + 2) > (width - digits)[:, None]",
+            "    keep[:, 0] = values < 0",
+            "    return text[keep].tobytes().decode('ascii')",
+        ])
+
+    def __generate_write(self, write_entry):
+        """
+        Gera código para uma escrita em bloco, produzida pelo `Optimizer`.
+
+        Args:
+            write_entry (dict): A entrada com o texto a ser escrito.
+        """
+        if self.buffered:
+            self.__emit_write(repr(write_entry['text']))
+        else:
+            self.code.write(f"print({write_entry['text']!r}, end='')")
+
+    def __generate_unrolled_loop(self, unrolled_entry):
+        """
+        Gera código para um loop desenrolado pelo `Optimizer`: uma atribuição da variável
+        seguida do corpo para cada valor.
+
+        Args:
+            unrolled_entry (dict): A entrada correspondente ao loop desenrolado.
+        """
+        variable = CodeGenerator.__loop_target(unrolled_entry)
+
+        for value in unrolled_entry['values']:
+            self.code.write(f"{variable} = {value!r}")
+            self.visit(unrolled_entry['body'])
+
+    def __emit_print(self, expression):
+        """
+        Emite a escrita de uma expressão seguida de quebra de linha, como faz `print`.
+
+        Args:
+            expression (str): O código da expressão a ser escrita.
+        """
+        if self.buffered:
+            # '%s' converte o valor com str(), exatamente como print
+            self.__emit_write(f"'%s\\n' % ({expression},)")
+        else:
+            self.code.write(f"print({expression})")
+
+    def __emit_write(self, text):
+        """
+        Emite o acúmulo de um texto no buffer de saída, enviando o buffer quando ele atinge
+        o tamanho configurado.
+
+        Args:
+            text (str): O código da expressão que produz o texto.
+        """
+        self.code.write(f"{self.BUFFER_NAME}.append({text})")
+        self.code.write(f"if len({self.BUFFER_NAME}) >= {self.flush_size}:")
+        self.code.indent()
+        self.code.write(f"{self.FLUSH_NAME}()")
+        self.code.dedent()
+
+    def __generate_buffer(self):
+        """
+        Envolve o código gerado com a criação do buffer de saída e o envio final do que restou nele.
+        """
+        self.code.prepend([
+            "import sys as _escreva_sys",
+            f"{self.BUFFER_NAME} = []",
+            f"def {self.FLUSH_NAME}():",
+            f"    _escreva_sys.stdout.write(''.join({self.BUFFER_NAME}))",
+            f"    {self.BUFFER_NAME}.clear()",
+        ])
+        self.code.write(f"{self.FLUSH_NAME}()")
 
     def __generate_expression(self, expression_node):
         """
@@ -92,27 +547,67 @@ class CodeGenerator:
         """
         if isinstance(expression_node, IdentifierNode) or isinstance(expression_node, IntegerNode) or isinstance(
                 expression_node, StringNode):
-            return expression_node.value
+            return self.__generate_atom(expression_node)
 
         elif isinstance(expression_node, PrintNode):
-            return ', '.join([expr.value for expr in expression_node.children])
+            return ', '.join([self.__generate_atom(expr) for expr in expression_node.children])
 
         elif isinstance(expression_node, RangeNode):
-            return f"range({', '.join([expr.value for expr in expression_node.children])})"
+            return f"range({', '.join([self.__generate_atom(expr) for expr in expression_node.children])})"
         else:
             raise SemanticException(f"Tipo de expressão não suportado: {type(expression_node).__name__}")
 
-    def __generate_statement(self, entry):
+    @staticmethod
+    def string_value(node) -> str:
         """
-        Gera código para uma declaração na árvore sintática.
+        Decodifica um literal de string como o Python faria com o código gerado, incluindo as
+        sequências de escape. Sem barra invertida não há escapes, e basta remover as aspas.
 
         Args:
-            entry (dict): A entrada correspondente à declaração.
+            node: O nó do literal de string.
+
+        Returns:
+            str: O valor da string.
         """
-        if isinstance(entry['body'], PrintNode):
-            self.__generate_print_statement(entry)
-        else:
-            raise SemanticException(f"Tipo de declaração não suportado: {entry['body']}")
+        if '\\' in node.value:
+            return ast.literal_eval(node.value)
+        return node.value[1:-1]
+
+    @staticmethod
+    def __generate_atom(node):
+        """
+        Gera código para um literal ou identificador. Os identificadores usam o nome
+        do símbolo resolvido pela análise semântica.
+
+        Args:
+            node: O nó do literal ou identificador.
+
+        Returns:
+            str: O código gerado.
+        """
+        if not isinstance(node, ASTNode):
+            raise SemanticException(f"Tipo de expressão não suportado: {type(node).__name__}")
+        if node.node_type == 'IDENTIFIER':
+            return CodeGenerator.__identifier_target(node)
+        return node.value
+
+    @staticmethod
+    def __identifier_target(node) -> str:
+        """
+        Retorna o nome de um identificador no código gerado, reaproveitando o símbolo
+        resolvido pela análise semântica (ou o próprio nome, se o nó não foi analisado).
+        """
+        binding = getattr(node, 'binding', None)
+        return node.value if binding is None else binding.target
+
+    @staticmethod
+    def __loop_target(entry) -> str:
+        """
+        Retorna o nome da variável de um loop no código gerado, reaproveitando o símbolo
+        declarado pela análise semântica (ou o próprio nome, se a entrada não o possuir).
+        """
+        binding = entry.get('binding')
+        return entry['variable'] if binding is None else binding.target
 
     def __repr__(self):
         """
@@ -121,4 +616,4 @@ class CodeGenerator:
         Returns:
             str: O código gerado.
         """
-        return '\n'.join(self.code)
+        return self.code.getvalue()
@@ -0,0 +1,128 @@
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from utils.syntax_tree import ASTNode
+from utils.token import Token
+from itertools import accumulate
+from typing import List
+
+class IncrementalParser:
+    """
+    Mantém a análise léxica e sintática de um programa e a atualiza de forma incremental.
+
+    Os tokens e as declarações de cada linha são guardados separadamente. Ao editar um trecho,
+    apenas as linhas alteradas são analisadas novamente, e as declarações resultantes são
+    inseridas no lugar das antigas no nó PROGRAM já existente.
+
+    A posição, em PROGRAM, da primeira declaração de cada linha fica guardada. Uma edição que
+    mantém a quantidade de declarações (como trocar uma declaração por outra) não altera as
+    posições das linhas seguintes; uma que a altera as invalida, e elas só são recalculadas
+    quando uma edição posterior precisar delas.
+
+    Attributes:
+        lines (List[str]): As linhas do programa.
+        tokens (List[List[Token]]): Os tokens de cada linha.
+        statements (List[List[ASTNode]]): As declarações de cada linha.
+        program (ASTNode): O nó PROGRAM com as declarações de todas as linhas.
+    """
+
+    def __init__(self, source: str = ''):
+        """
+        Inicializa o analisador com o programa fornecido, analisando todas as linhas.
+
+        Parameters:
+            source (str, optional): O código-fonte do programa. Padrão é um programa vazio.
+
+        Raises:
+            TokenException: Se alguma linha contiver um erro léxico ou sintático.
+        """
+        self.parser = Syntactic()
+        self.lines: List[str] = []
+        self.tokens: List[List[Token]] = []
+        self.statements: List[List[ASTNode]] = []
+        self.program = ASTNode("PROGRAM", children=[])
+
+        # Posição da primeira declaração de cada linha (e, ao final, o total de declarações),
+        # válida até o índice self.__valid
+        self.__offsets: List[int] = [0]
+        self.__valid = 0
+
+        self.update(0, 0, source.split('\n'))
+
+    def update(self, start: int, end: int, new_lines: List[str]) -> ASTNode:
+        """
+        Substitui as linhas no intervalo [start, end) pelas linhas fornecidas.
+
+        Apenas as novas linhas são analisadas. Com as posições das declarações já conhecidas,
+        o custo da atualização é proporcional ao tamanho da edição, mais a cópia (em C) das
+        listas de linhas e de declarações quando as suas quantidades mudam. Se a quantidade de
+        declarações mudar, a próxima edição em uma linha posterior recalcula as posições até
+        ela, também em C. Se alguma das novas linhas tiver erro, o estado não é alterado.
+
+        Parameters:
+            start (int): O índice (a partir de 0) da primeira linha substituída.
+            end (int): O índice da linha seguinte à última substituída.
+            new_lines (List[str]): As novas linhas.
+
+        Returns:
+            ASTNode: O nó PROGRAM atualizado.
+
+        Raises:
+            IndexError: Se o intervalo for inválido.
+            TokenException: Se alguma das novas linhas contiver um erro léxico ou sintático.
+        """
+        if not 0 <= start <= end <= len(self.lines):
+            raise IndexError(f"Intervalo de linhas inválido: [{start}, {end})")
+
+        # Analisa as novas linhas antes de alterar qualquer estado
+        new_tokens = [Lexer.tokenize(line) for line in new_lines]
+        new_statements = [self.parser.parse_tokens(tokens).children for tokens in new_tokens]
+
+        # Posições, em PROGRAM, das declarações do trecho editado
+        offset = self.__offset(start)
+        removed = self.__offset(end) - offset
+        new_offsets = list(accumulate(map(len, new_statements), initial=offset))
+
+        self.program.children[offset:offset + removed] = [statement for statements in new_statements for statement in statements]
+        self.lines[start:end] = new_lines
+        self.tokens[start:end] = new_tokens
+        self.statements[start:end] = new_statements
+
+        # As posições das linhas seguintes continuam válidas se a quantidade de declarações não mudou
+        self.__offsets[start:end + 1] = new_offsets
+        if new_offsets[-1] - offset == removed:
+            self.__valid += len(new_lines) - (end - start)
+        else:
+            self.__valid = start + len(new_lines)
+
+        return self.program
+
+    def __offset(self, line: int) -> int:
+        """
+        Retorna a posição, em PROGRAM, da primeira declaração da linha (ou o total de declarações,
+        se `line` for a quantidade de linhas), recalculando as posições invalidadas até ela.
+        """
+        if line > self.__valid:
+            valid = self.__valid
+            self.__offsets[valid:line + 1] = accumulate(map(len, self.statements[valid:line]), initial=self.__offsets[valid])
+            self.__valid = line
+        return self.__offsets[line]
+
+    def replace_line(self, line_number: int, text: str) -> ASTNode:
+        """
+        Substitui uma única linha.
+
+        Parameters:
+            line_number (int): O índice (a partir de 0) da linha.
+            text (str): O novo conteúdo da linha.
+
+        Returns:
+            ASTNode: O nó PROGRAM atualizado.
+        """
+        return self.update(line_number, line_number + 1, [text])
+
+    @property
+    def source(self) -> str:
+        """
+        Retorna o código-fonte atual do programa.
+        """
+        return '\n'.join(self.lines)
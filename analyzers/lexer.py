@@ -1,11 +1,25 @@
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional, TextIO, Tuple
 from utils.token import Token
+from utils.token_buffer import TokenBuffer
+from utils.diagnostic import Diagnostic
 from utils.token_type import TokenType
 from utils.token_patterns import TokenPatterns
 from exceptions.token_exception import TokenException
 
 class Lexer:
+    # Cache da expressão regular combinada, compilada sob demanda
+    _regex: Optional[re.Pattern] = None
+
+    # Versão binária da expressão combinada, usada em textos bytes ou mapeados em memória
+    _bytes_regex: Optional[re.Pattern] = None
+
+    # Tabela que associa o índice de cada grupo da expressão combinada ao tipo do token
+    _token_types: Optional[List[Optional[TokenType]]] = None
+
+    # Índice do grupo dos comentários, que não geram tokens
+    _comment_group: Optional[int] = None
+
     @staticmethod
     def scanner(expression: str, show_result: bool = False) -> List[Token]:
         """
@@ -20,23 +34,12 @@ class Lexer:
         """
         tokens = []
 
-        # Combina os padrões de expressões regulares para formar um padrão combinado
-        combined_pattern = '|'.join('(?P<%s_%s>%s)' % (name, i, pattern) for i, (pattern, name) in enumerate(TokenPatterns.get_patterns(), start=1))
-        regex = re.compile(combined_pattern)
-
         try:
-            # Itera sobre todas as correspondências na expressão
-            for match in regex.finditer(expression):
-                for name, value in match.groupdict().items():
-                    if value is not None:
-                        # Verifica se o token é desconhecido
-                        if name.startswith('UNKNOWN'):
-                            raise TokenException(f"Token não reconhecido '{value}'")
-
-                        # Obtém o tipo do token com base no nome e cria um objeto Token
-                        token_type = TokenType[name.split('_')[0].upper()]  
-                        tokens.append(Token(token_type, value))
-                        break
+            for token_type, match in Lexer.__scan(expression):
+                if token_type is None:
+                    raise TokenException(f"Token não reconhecido '{match.group()}'")
+
+                tokens.append(Token(token_type, match.group()))
         except TokenException as e:
             print(f"Erro Léxico: {e.message}")
         except Exception as e:
@@ -50,3 +53,226 @@ class Lexer:
             print()
 
         return tokens
+
+    @staticmethod
+    def tokenize(expression: str) -> List[Token]:
+        """
+        Realiza a análise léxica da expressão fornecida sem exibir resultados, propagando
+        os erros ao chamador em vez de interromper a análise com uma mensagem.
+
+        Args:
+            expression (str): A expressão a ser analisada.
+
+        Returns:
+            List[Token]: Lista de tokens gerados pela análise léxica.
+
+        Raises:
+            TokenException: Se um caractere desconhecido for encontrado.
+        """
+        tokens = []
+
+        for token_type, match in Lexer.__scan(expression):
+            if token_type is None:
+                raise TokenException(f"Token não reconhecido '{match.group()}'")
+
+            tokens.append(Token(token_type, match.group()))
+
+        return tokens
+
+    @staticmethod
+    def scan_with_diagnostics(source: str, show_result: bool = False) -> Tuple[List[Token], List[Diagnostic]]:
+        """
+        Realiza a análise léxica de um código com várias linhas sem parar no primeiro erro:
+        cada caractere desconhecido é registrado como diagnóstico e ignorado.
+
+        Args:
+            source (str): O código a ser analisado.
+            show_result (bool, optional): Se True, exibe os resultados da análise léxica.
+
+        Returns:
+            Tuple[List[Token], List[Diagnostic]]: Os tokens reconhecidos, com linha e coluna,
+            e os erros encontrados.
+        """
+        tokens = []
+        diagnostics = []
+
+        for line_number, line in enumerate(source.split('\n'), start=1):
+            for token_type, match in Lexer.__scan(line):
+                if token_type is None:
+                    diagnostics.append(Diagnostic('Léxico', f"Token não reconhecido '{match.group()}'", line_number, match.start() + 1))
+                else:
+                    tokens.append(Token(token_type, match.group(), line_number, match.start() + 1))
+
+        if show_result:
+            print("Resultados da análise Léxica: ")
+            for token in tokens:
+                print(token.__repr__(level=1))
+            print()
+
+        return tokens, diagnostics
+
+    @staticmethod
+    def scanner_buffer(expression, lazy: bool = False) -> TokenBuffer:
+        """
+        Realiza a análise léxica da expressão fornecida armazenando os tokens em um
+        `TokenBuffer` compacto, adequado para entradas com muitos tokens.
+
+        A expressão pode ser uma str ou um texto binário (bytes ou o resultado de
+        `FileManager.map`); nesse caso as posições dos tokens são posições em bytes.
+
+        Args:
+            expression: A expressão a ser analisada.
+            lazy (bool, optional): Se True, os tokens guardam apenas suas posições e os valores
+                são extraídos somente quando acessados. Padrão é False.
+
+        Returns:
+            TokenBuffer: O buffer com os tokens reconhecidos.
+
+        Raises:
+            TokenException: Se um caractere desconhecido for encontrado.
+        """
+        buffer = TokenBuffer(expression, lazy)
+
+        for token_type, match in Lexer.__scan(expression):
+            if token_type is None:
+                value = match.group()
+                raise TokenException(f"Token não reconhecido '{value.decode(errors='backslashreplace') if isinstance(value, bytes) else value}'")
+
+            buffer.append(token_type, match.start(), match.end())
+
+        return buffer
+
+    @staticmethod
+    def iter_tokens(stream: TextIO, chunk_size: int = 65536) -> Iterator[Token]:
+        """
+        Realiza a análise léxica de um arquivo de forma incremental, produzindo os tokens
+        sob demanda à medida que o arquivo é lido em blocos.
+
+        Apenas o bloco atual e a linha incompleta do fim do bloco ficam em memória, de forma
+        que arquivos arbitrariamente grandes podem ser analisados com memória limitada.
+
+        Args:
+            stream (TextIO): O arquivo (ou objeto semelhante) aberto em modo texto.
+            chunk_size (int, optional): Quantidade de caracteres lidos por vez. Padrão é 65536.
+
+        Yields:
+            Token: Os tokens reconhecidos, com linha e coluna preenchidas.
+
+        Raises:
+            TokenException: Se um caractere desconhecido for encontrado.
+        """
+        line_number = 0
+        pending = ''
+
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+
+            # Somente as linhas completas do bloco são analisadas; o restante aguarda o próximo bloco
+            lines = (pending + chunk).split('\n')
+            pending = lines.pop()
+
+            for line in lines:
+                line_number += 1
+                yield from Lexer.__scan_line(line, line_number)
+
+        if pending:
+            yield from Lexer.__scan_line(pending, line_number + 1)
+
+    @staticmethod
+    def __scan_line(line: str, line_number: int) -> Iterator[Token]:
+        """
+        Produz os tokens de uma única linha, com a posição de cada um.
+
+        Args:
+            line (str): O conteúdo da linha.
+            line_number (int): O número da linha.
+
+        Yields:
+            Token: Os tokens da linha.
+        """
+        for token_type, match in Lexer.__scan(line):
+            if token_type is None:
+                raise TokenException(f"Token não reconhecido '{match.group()}' (linha {line_number}, coluna {match.start() + 1})")
+
+            yield Token(token_type, match.group(), line_number, match.start() + 1)
+
+    @staticmethod
+    def __scan(text) -> Iterator[Tuple[Optional[TokenType], re.Match]]:
+        """
+        Percorre as correspondências da expressão combinada em um texto, com o tipo de cada
+        token. É o único laço de análise léxica: as demais variantes apenas decidem o que fazer
+        com cada token e com os caracteres desconhecidos.
+
+        Args:
+            text: O texto a ser analisado (str, bytes ou um arquivo mapeado em memória).
+
+        Yields:
+            Tuple[Optional[TokenType], re.Match]: O tipo do token (None para um caractere
+            desconhecido) e a correspondência. Os comentários são ignorados.
+        """
+        regex = Lexer.get_regex() if isinstance(text, str) else Lexer.get_bytes_regex()
+        token_types = Lexer._token_types
+        comment_group = Lexer._comment_group
+
+        for match in regex.finditer(text):
+            # O índice do grupo que casou determina diretamente o tipo do token
+            token_type = token_types[match.lastindex]
+            if token_type is None and match.lastindex == comment_group:
+                continue
+            yield token_type, match
+
+    @staticmethod
+    def get_regex() -> re.Pattern:
+        """
+        Retorna a expressão regular combinada de todos os padrões de tokens.
+
+        A expressão é compilada apenas na primeira chamada e reutilizada nas seguintes,
+        até que o cache seja invalidado com `Lexer.invalidate_cache()`. Junto dela é
+        montada a tabela que associa o índice de cada grupo ao respectivo `TokenType`.
+
+        Returns:
+            re.Pattern: A expressão regular combinada.
+        """
+        if Lexer._regex is None:
+            patterns = TokenPatterns.get_patterns()
+
+            # Combina os padrões de expressões regulares para formar um padrão combinado
+            combined_pattern = '|'.join('(?P<%s_%s>%s)' % (name, i, pattern) for i, (pattern, name) in enumerate(patterns, start=1))
+            regex = re.compile(combined_pattern)
+
+            # Os padrões não possuem grupos próprios, então o grupo i corresponde ao i-ésimo padrão.
+            # O índice 0 (correspondência inteira) nunca é usado como lastindex. Desconhecidos e
+            # comentários não têm tipo, e só são diferenciados no caminho (raro) sem tipo.
+            names = [name for _, name in patterns]
+            Lexer._token_types = [None] + [None if name in ('UNKNOWN', 'COMMENT') else TokenType[name] for name in names]
+            Lexer._comment_group = names.index('COMMENT') + 1 if 'COMMENT' in names else None
+            Lexer._regex = regex
+
+        return Lexer._regex
+
+    @staticmethod
+    def get_bytes_regex() -> re.Pattern:
+        """
+        Retorna a versão binária da expressão regular combinada, usada para analisar
+        textos do tipo bytes ou arquivos mapeados em memória sem decodificá-los.
+
+        Returns:
+            re.Pattern: A expressão regular combinada, compilada para bytes.
+        """
+        if Lexer._bytes_regex is None:
+            Lexer._bytes_regex = re.compile(Lexer.get_regex().pattern.encode())
+
+        return Lexer._bytes_regex
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Descarta a expressão regular em cache. Deve ser chamado sempre que os padrões
+        de `TokenPatterns` forem alterados, para que a próxima análise os recompile.
+        """
+        Lexer._regex = None
+        Lexer._bytes_regex = None
+        Lexer._token_types = None
+        Lexer._comment_group = None
@@ -0,0 +1,168 @@
+from utils.syntax_tree import ASTNode
+from utils.ast_nodes import PrintNode, RangeNode, IdentifierNode, IntegerNode, StringNode
+from analyzers.code_generator import CodeGenerator
+from typing import Dict, List, Optional
+
+class Optimizer:
+    """
+    Classe responsável por otimizar o resultado da análise semântica antes da geração de código.
+
+    As otimizações aplicadas são:
+        - Propagação de constantes: os limites inteiros de 'intervalo' são avaliados e normalizados.
+        - Escrita em bloco: um loop sobre um iterável constante cujo corpo escreve a variável do
+          loop ou uma constante é substituído por uma única escrita do texto já calculado.
+        - Desenrolamento: loops curtos sobre iteráveis constantes que não podem ser escritos em
+          bloco são substituídos por uma sequência de atribuições e execuções do corpo.
+    """
+
+    def __init__(self, fold_constants: bool = True, bulk_write: bool = True, bulk_write_limit: int = 100000, unroll_limit: int = 8):
+        """
+        Inicializa o otimizador com as heurísticas fornecidas.
+
+        Parameters:
+            fold_constants (bool, optional): Ativa a propagação de constantes. Padrão é True.
+            bulk_write (bool, optional): Ativa a escrita em bloco. Padrão é True.
+            bulk_write_limit (int, optional): Quantidade máxima de iterações escritas em bloco. Padrão é 100000.
+            unroll_limit (int, optional): Quantidade máxima de iterações de um loop desenrolado (0 desativa). Padrão é 8.
+        """
+        self.fold_constants = fold_constants
+        self.bulk_write = bulk_write
+        self.bulk_write_limit = bulk_write_limit
+        self.unroll_limit = unroll_limit
+        self.optimization_result = []
+
+    @staticmethod
+    def optimize(tree: List[Dict], show_result: bool = False, **options) -> List[Dict]:
+        """
+        Otimiza o resultado da análise semântica.
+
+        Args:
+            tree (List[Dict]): O resultado da análise semântica.
+            show_result (bool, optional): Indica se o resultado deve ser exibido. Padrão é False.
+            **options: As heurísticas aceitas pelo construtor de `Optimizer`.
+
+        Returns:
+            List[Dict]: As entradas otimizadas, no mesmo formato aceito pelo `CodeGenerator`.
+        """
+        instance = Optimizer(**options)
+        instance.optimization_result = [instance.__optimize_entry(entry) for entry in tree]
+
+        if show_result:
+            print(repr(instance))
+
+        return instance.optimization_result
+
+    def __optimize_entry(self, entry: Dict) -> Dict:
+        """
+        Otimiza uma entrada da análise semântica.
+
+        Args:
+            entry (Dict): A entrada a ser otimizada.
+
+        Returns:
+            Dict: A entrada otimizada (ou a própria entrada, se nada puder ser feito).
+        """
+        if entry.get('type') != 'for_loop':
+            return entry
+
+        iterable = entry['iterable']
+        if self.fold_constants and isinstance(iterable, RangeNode):
+            iterable = self.__fold_range(iterable)
+            entry = dict(entry, iterable=iterable)
+
+        values = self.__constant_values(iterable)
+        if values is None:
+            return entry
+
+        if self.bulk_write and len(values) <= self.bulk_write_limit:
+            text = self.__constant_output(entry['variable'], values, entry['body'])
+            if text is not None:
+                return {'type': 'write', 'text': text}
+
+        if len(values) <= self.unroll_limit:
+            return {'type': 'unrolled_loop', 'variable': entry['variable'], 'values': values, 'body': entry['body'], 'binding': entry.get('binding')}
+
+        return entry
+
+    def __fold_range(self, range_node: RangeNode) -> RangeNode:
+        """
+        Avalia os limites inteiros de um intervalo, normalizando a sua representação.
+
+        Args:
+            range_node (RangeNode): O intervalo.
+
+        Returns:
+            RangeNode: O intervalo com os limites constantes avaliados.
+        """
+        children = [IntegerNode(str(int(child.value))) if self.__is_integer(child) else child for child in range_node.children]
+        return RangeNode(*children)
+
+    def __constant_values(self, iterable: ASTNode) -> Optional[list]:
+        """
+        Calcula os valores percorridos por um iterável, quando ele é constante.
+
+        Args:
+            iterable (ASTNode): O iterável do loop.
+
+        Returns:
+            Optional[list]: Os valores percorridos, ou None se o iterável não for constante.
+        """
+        if isinstance(iterable, StringNode):
+            return list(CodeGenerator.string_value(iterable))
+
+        if isinstance(iterable, RangeNode) and all(self.__is_integer(child) for child in iterable.children):
+            bounds = [int(child.value) for child in iterable.children]
+            # Os valores só são materializados se o intervalo for pequeno o bastante para ser aproveitado
+            if len(range(*bounds)) <= max(self.bulk_write_limit if self.bulk_write else 0, self.unroll_limit):
+                return list(range(*bounds))
+
+        return None
+
+    def __constant_output(self, variable: str, values: list, body: ASTNode) -> Optional[str]:
+        """
+        Calcula o texto escrito por um loop cujo corpo escreve a variável do loop ou uma constante.
+
+        Args:
+            variable (str): A variável do loop.
+            values (list): Os valores percorridos pelo loop.
+            body (ASTNode): O corpo do loop.
+
+        Returns:
+            Optional[str]: O texto escrito pelo loop, ou None se o corpo não for suportado.
+        """
+        if not isinstance(body, PrintNode) or len(body.children) != 1:
+            return None
+
+        expression = body.children[0]
+        if isinstance(expression, IdentifierNode) and expression.value == variable:
+            return ''.join(f"{value}\n" for value in values)
+        if self.__is_integer(expression):
+            return f"{int(expression.value)}\n" * len(values)
+        if isinstance(expression, StringNode):
+            return f"{CodeGenerator.string_value(expression)}\n" * len(values)
+
+        return None
+
+    @staticmethod
+    def __is_integer(node) -> bool:
+        """
+        Indica se o nó é um literal inteiro (incluindo o início implícito de 'intervalo(n)').
+        """
+        return isinstance(node, ASTNode) and node.node_type == 'INTEGER'
+
+    def __repr__(self) -> str:
+        """
+        Retorna uma representação em string da otimização.
+
+        Returns:
+            str: Uma string representando as entradas otimizadas.
+        """
+        parts = ["Otimização:\n"]
+        for entry in self.optimization_result:
+            if entry['type'] == 'write':
+                parts.append(f"Tipo: write, Texto: {len(entry['text'])} caracteres\n")
+            elif entry['type'] == 'unrolled_loop':
+                parts.append(f"Tipo: unrolled_loop, Variável: {entry['variable']}, Valores: {entry['values']}\n")
+            else:
+                parts.append(f"Tipo: {entry['type']}, Variável: {entry['variable']}, Iteravél: {repr(entry['iterable'])}\n")
+        return ''.join(parts)
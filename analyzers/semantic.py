@@ -1,11 +1,23 @@
-from utils.syntax_tree import ASTNode
-from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode
+from utils.syntax_tree import ASTNode, NodeVisitor
+from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode, BlockNode
+from utils.symbol_table import SymbolTable
+from utils.diagnostic import Diagnostic
 from exceptions.semantic_exception import SemanticException
-from typing import List, Dict, Union
+from typing import List, Dict, Tuple, Union
 
-class Semantic:
+class Semantic(NodeVisitor):
     """
     Classe responsável pela análise semântica da árvore sintática gerada pelo parser.
+    A árvore é percorrida sem recursão, por meio de `NodeVisitor`.
+
+    Os nomes são resolvidos por uma `SymbolTable`: cada loop abre um escopo em que a sua
+    variável é declarada, visível apenas no corpo do loop. O símbolo resolvido é guardado no
+    atributo `binding` de cada `IdentifierNode` e na chave 'binding' de cada loop, para que as
+    etapas seguintes não precisem resolver os nomes novamente.
+
+    Apenas os loops do nível superior geram entradas no resultado; os loops aninhados fazem
+    parte do corpo do loop que os contém (um `ForLoopNode` ou um `BlockNode`), e o símbolo da
+    sua variável é guardado no atributo `binding` do próprio nó.
     """
 
     @staticmethod
@@ -21,16 +33,60 @@ class Semantic:
             List[Dict[str, Union[str, IdentifierNode, RangeNode]]]: Lista de informações semânticas.
         """
         instance = Semantic()
-        instance.declared_variables = set()
-        instance.analysis_result = []
-        instance.__analyze_program(tree)
-        tree = instance.analysis_result
+        tree = instance.analyze_tree(tree)
 
         if show_result:
             print(repr(instance))
 
         return tree
 
+    @staticmethod
+    def analyze_with_diagnostics(tree: ASTNode, show_result: bool = False) -> Tuple[List[Dict[str, Union[str, IdentifierNode, RangeNode]]], List[Diagnostic]]:
+        """
+        Analisa a árvore sintática sem parar no primeiro erro: cada declaração do nível superior
+        é analisada separadamente (elas não compartilham variáveis), e uma declaração com erro é
+        registrada como diagnóstico e descartada.
+
+        Args:
+            tree (ASTNode): A raiz da árvore sintática.
+            show_result (bool, optional): Indica se os resultados devem ser exibidos. Padrão é False.
+
+        Returns:
+            Tuple[List[Dict[str, Union[str, IdentifierNode, RangeNode]]], List[Diagnostic]]: As
+            informações semânticas das declarações válidas e os erros encontrados.
+        """
+        instance = Semantic()
+        result = []
+        diagnostics = []
+
+        for statement in tree.children:
+            try:
+                result.extend(instance.analyze_tree(ASTNode("PROGRAM", children=[statement])))
+            except SemanticException as e:
+                diagnostics.append(Diagnostic('Semântico', e.message))
+
+        instance.analysis_result = result
+        if show_result:
+            print(repr(instance))
+
+        return result, diagnostics
+
+    def analyze_tree(self, tree: ASTNode) -> List[Dict[str, Union[str, IdentifierNode, RangeNode]]]:
+        """
+        Analisa a árvore sintática usando esta instância, o que permite reaproveitar
+        o mesmo analisador ao processar muitas árvores seguidas.
+
+        Args:
+            tree (ASTNode): A raiz da árvore sintática.
+
+        Returns:
+            List[Dict[str, Union[str, IdentifierNode, RangeNode]]]: Lista de informações semânticas.
+        """
+        self.symbols = SymbolTable()
+        self.analysis_result = []
+        self.__analyze_program(tree)
+        return self.analysis_result
+
     def __analyze_program(self, program_node: ASTNode) -> None:
         """
         Analisa um nó do programa na árvore sintática.
@@ -38,83 +94,115 @@ class Semantic:
         Args:
             program_node (ASTNode): O nó do programa a ser analisado.
         """
-        for statement in program_node.children:
-            self.__analyze_statement(statement)
+        self.visit(program_node)
 
-    def __analyze_statement(self, statement: Union[ForLoopNode, PrintNode]) -> None:
+    def visit_program(self, program_node: ASTNode) -> List[ASTNode]:
         """
-        Analisa um nó de declaração na árvore sintática.
+        Visita o nó do programa, verificando se cada filho é uma declaração suportada.
 
         Args:
-            statement (Union[ForLoopNode, PrintNode]): O nó de declaração a ser analisado.
+            program_node (ASTNode): O nó do programa.
+
+        Returns:
+            List[ASTNode]: As declarações a serem analisadas.
         """
-        if isinstance(statement, ForLoopNode):
-            self.__analyze_for_loop(statement)
-        elif isinstance(statement, PrintNode):
-            self.__analyze_print_statement(statement)
-        else:
-            raise SemanticException(f"Tipo de declaração não suportado: {type(statement).__name__}")
+        for statement in program_node.children:
+            self.__check_statement(statement)
+        return program_node.children
 
-    def __analyze_for_loop(self, for_loop_node: ForLoopNode) -> None:
+    def visit_for_loop(self, for_loop_node: ForLoopNode) -> List[ASTNode]:
         """
-        Analisa um nó de loop 'for' na árvore sintática.
+        Visita um nó de loop 'for' na árvore sintática. O iterável é analisado no escopo
+        atual; em seguida é aberto o escopo do loop, com a declaração da sua variável.
 
         Args:
             for_loop_node (ForLoopNode): O nó de loop 'for' a ser analisado.
+
+        Returns:
+            List[ASTNode]: O corpo do loop, a ser analisado no escopo do loop.
         """
-        variable = for_loop_node.value
-        if not self.__variable_declared(variable):
-            raise SemanticException(f"Variável '{variable}' não declarada antes do loop.")
+        iterable, body = for_loop_node.children
+        if not isinstance(iterable, ASTNode):
+            raise SemanticException(f"Iterável não suportado no loop '{for_loop_node.value}': {type(iterable).__name__}")
+        self.visit(iterable)
 
-        loop_info = {
-            'type': 'for_loop',
-            'variable': variable,
-            'iterable': for_loop_node.children[0],
-            'body': for_loop_node.children[1]
-        }
-        self.analysis_result.append(loop_info)
+        top_level = self.symbols.depth == 0
+        self.symbols.enter_scope()
+        binding = self.symbols.declare(for_loop_node.value, for_loop_node)
+        for_loop_node.binding = binding
 
-        self.__analyze_expression(for_loop_node.children[0])
-        self.__analyze_statement(for_loop_node.children[1])
+        if top_level:
+            loop_info = {
+                'type': 'for_loop',
+                'variable': binding.name,
+                'iterable': iterable,
+                'body': body,
+                'binding': binding
+            }
+            self.analysis_result.append(loop_info)
 
-    def __analyze_print_statement(self, print_node: PrintNode) -> None:
+        self.__check_statement(body)
+        return [body]
+
+    def leave_for_loop(self, for_loop_node: ForLoopNode) -> None:
         """
-        Analisa um nó de declaração 'print' na árvore sintática.
+        Fecha o escopo do loop depois que o seu corpo foi analisado.
 
         Args:
-            print_node (PrintNode): O nó de declaração 'print' a ser analisado.
+            for_loop_node (ForLoopNode): O nó de loop 'for'.
         """
-        self.__analyze_expression(print_node.children[0])
+        self.symbols.exit_scope()
 
-    def __analyze_expression(self, expression_node: Union[IdentifierNode, RangeNode]) -> None:
+    def visit_block(self, block_node: BlockNode) -> List[ASTNode]:
         """
-        Analisa um nó de expressão na árvore sintática.
+        Visita um bloco de declarações do corpo de um loop, verificando cada uma delas.
 
         Args:
-            expression_node (Union[IdentifierNode, RangeNode]): O nó de expressão a ser analisado.
+            block_node (BlockNode): O nó do bloco.
+
+        Returns:
+            List[ASTNode]: As declarações do bloco, analisadas no escopo do loop.
         """
-        if isinstance(expression_node, IdentifierNode):
-            variable = expression_node.value
-            if not self.__variable_declared(variable):
-                raise SemanticException(f"Variável '{variable}' não declarada.")
-        elif isinstance(expression_node, RangeNode):
-            for node in expression_node.children:
-                self.__analyze_expression(node)
+        for statement in block_node.children:
+            self.__check_statement(statement)
+        return block_node.children
 
-    def __variable_declared(self, variable: str) -> bool:
+    def visit_print(self, print_node: PrintNode) -> List[ASTNode]:
         """
-        Verifica se uma variável foi declarada.
+        Visita um nó de declaração 'print' na árvore sintática. Os analisadores sintáticos
+        aceitam uma lista entre parênteses, mas 'escreva' recebe uma única expressão.
 
         Args:
-            variable (str): O nome da variável.
+            print_node (PrintNode): O nó de declaração 'print' a ser analisado.
 
         Returns:
-            bool: True se a variável foi declarada, False caso contrário.
+            List[ASTNode]: A expressão a ser impressa.
+        """
+        if not isinstance(print_node.children[0], ASTNode):
+            raise SemanticException("'escreva' recebe uma única expressão.")
+        return print_node.children[:1]
+
+    def visit_identifier(self, identifier_node: IdentifierNode) -> None:
+        """
+        Visita um identificador, resolvendo-o para a declaração visível mais interna.
+
+        Args:
+            identifier_node (IdentifierNode): O nó do identificador.
+        """
+        binding = self.symbols.resolve(identifier_node.value)
+        if binding is None:
+            raise SemanticException(f"Variável '{identifier_node.value}' não declarada.")
+        identifier_node.binding = binding
+
+    def __check_statement(self, statement: ASTNode) -> None:
         """
-        if not self.declared_variables:
-            self.declared_variables.add(variable)
+        Verifica se o nó pode ocupar a posição de uma declaração.
 
-        return variable in self.declared_variables
+        Args:
+            statement (ASTNode): O nó a ser verificado.
+        """
+        if not isinstance(statement, (ForLoopNode, PrintNode, BlockNode)):
+            raise SemanticException(f"Tipo de declaração não suportado: {type(statement).__name__}")
 
     def __repr__(self) -> str:
         """
@@ -123,7 +211,7 @@ class Semantic:
         Returns:
             str: Uma string representando a análise semântica.
         """
-        ret = "Análise Semântica:\n"
+        parts = ["Análise Semântica:\n"]
         for analysis_info in self.analysis_result:
-            ret += f"Tipo: {analysis_info['type']}, Variável: {analysis_info['variable']}, Iteravél: {repr(analysis_info['iterable'])} Corpo: {repr(analysis_info['body'])}\n"
-        return ret
+            parts.append(f"Tipo: {analysis_info['type']}, Variável: {analysis_info['variable']}, Iteravél: {repr(analysis_info['iterable'])} Corpo: {repr(analysis_info['body'])}\n")
+        return ''.join(parts)
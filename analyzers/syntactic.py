@@ -1,9 +1,11 @@
 from utils.syntax_tree import ASTNode
-from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode, IntegerNode, StringNode
+from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode, IntegerNode, StringNode, BlockNode
 from utils.token_type import TokenType
 from utils.token import Token
+from utils.diagnostic import Diagnostic
 from exceptions.token_exception import TokenException
-from typing import List, Union, Tuple
+from itertools import groupby
+from typing import Iterable, Iterator, List, Union, Tuple
 
 class Syntactic:
     """
@@ -22,16 +24,114 @@ class Syntactic:
         Returns:
             ASTNode: A raiz da árvore sintática.
         """
+        syntax_tree = Syntactic().parse_tokens(tokens)
+
+        if show_result:
+            print('Resultados da análise Sintática: (AST)')
+            print(syntax_tree.__repr__(level=1))
+
+        return syntax_tree
+
+    def parse_tokens(self, tokens: List[Token]) -> ASTNode:
+        """
+        Analisa a sequência de tokens usando esta instância, o que permite reaproveitar
+        o mesmo analisador ao processar muitas sequências seguidas.
+
+        Args:
+            tokens (List[Token]): A sequência de tokens gerada pelo lexer.
+
+        Returns:
+            ASTNode: A raiz da árvore sintática.
+        """
+        self.tokens = tokens
+        self.current_token_index = 0
+        return self.__parse_program()
+
+    @staticmethod
+    def parse_with_recovery(tokens: List[Token], show_result: bool = False) -> Tuple[ASTNode, List[Diagnostic]]:
+        """
+        Analisa a sequência de tokens sem parar no primeiro erro (recuperação em modo pânico).
+
+        Quando uma declaração contém um erro, ele é registrado e os tokens são descartados até
+        um token de sincronização: o primeiro token da linha seguinte à do início da declaração
+        ou, quando os tokens não possuem linha, o próximo 'para'. A análise então continua a
+        partir dele.
+
+        Args:
+            tokens (List[Token]): A sequência de tokens gerada pelo lexer.
+            show_result (bool, optional): Indica se os resultados devem ser exibidos. Padrão é False.
+
+        Returns:
+            Tuple[ASTNode, List[Diagnostic]]: A árvore parcial, apenas com as declarações
+            válidas, e os erros encontrados.
+        """
         instance = Syntactic()
         instance.tokens = tokens
         instance.current_token_index = 0
-        syntax_tree = instance.__parse_program()
+        program_node = ASTNode("PROGRAM", children=[])
+        diagnostics = []
+
+        while instance.current_token_index < len(tokens):
+            start = instance.current_token_index
+            try:
+                program_node.children.append(instance.__parse_statement())
+            except TokenException as e:
+                error_index = min(instance.current_token_index, len(tokens) - 1)
+                error_token = tokens[error_index]
+                diagnostics.append(Diagnostic('Sintático', e.message, error_token.line, error_token.column))
+                instance.current_token_index = instance.__synchronize(start)
 
         if show_result:
             print('Resultados da análise Sintática: (AST)')
-            print(syntax_tree.__repr__(level=1))
+            print(program_node.__repr__(level=1))
 
-        return syntax_tree
+        return program_node, diagnostics
+
+    def __synchronize(self, start: int) -> int:
+        """
+        Encontra o próximo token a partir do qual a análise pode continuar após um erro.
+
+        Args:
+            start (int): A posição do primeiro token da declaração que contém o erro.
+
+        Returns:
+            int: A posição do token de sincronização (ou o fim da sequência).
+        """
+        line = self.tokens[start].line
+        index = start + 1
+
+        while index < len(self.tokens):
+            token = self.tokens[index]
+            if line is not None and token.line != line:
+                break
+            if line is None and token.type == TokenType.FOR:
+                break
+            index += 1
+        return index
+
+    @staticmethod
+    def parse_stream(tokens: Iterable[Token]) -> Iterator[ASTNode]:
+        """
+        Analisa uma sequência de tokens produzida sob demanda (por exemplo, por `Lexer.iter_tokens`)
+        e produz as declarações à medida que cada linha é concluída.
+
+        Como cada declaração ocupa uma única linha, os tokens são agrupados pelo número da linha
+        e apenas os tokens da linha atual ficam em memória.
+
+        Args:
+            tokens (Iterable[Token]): Os tokens, com o número da linha preenchido.
+
+        Yields:
+            ASTNode: Os nós das declarações, na ordem em que aparecem.
+        """
+        instance = Syntactic()
+
+        for _, line_tokens in groupby(tokens, key=lambda token: token.line):
+            instance.tokens = list(line_tokens)
+            instance.current_token_index = 0
+
+            while instance.current_token_index < len(instance.tokens):
+                yield instance.__parse_statement()
 
     def __parse_program(self) -> ASTNode:
         """
@@ -55,7 +155,7 @@ class Syntactic:
         Returns:
             Union[ForLoopNode, RangeNode, PrintNode]: O nó correspondente à declaração na árvore sintática.
         """
-        current_token = self.tokens[self.current_token_index]
+        current_token = self.__current()
 
         if current_token.type == TokenType.FOR:
             return self.__parse_for_loop()
@@ -66,6 +166,20 @@ class Syntactic:
         else:
             raise TokenException(f"Token não esperado: {current_token}")
 
+    def __current(self) -> Token:
+        """
+        Retorna o token atual, sem avançar o índice.
+
+        Returns:
+            Token: O token atual.
+
+        Raises:
+            TokenException: Se a sequência de tokens já terminou.
+        """
+        if self.current_token_index >= len(self.tokens):
+            raise TokenException("Fim inesperado da sequência de tokens")
+        return self.tokens[self.current_token_index]
+
     def __match(self, expected_type: TokenType) -> Token:
         """
         Compara o tipo do token atual com um tipo esperado e avança o índice do token.
@@ -76,7 +190,7 @@ class Syntactic:
         Returns:
             Token: O token atual.
         """
-        current_token = self.tokens[self.current_token_index]
+        current_token = self.__current()
 
         if current_token.type == expected_type:
             self.current_token_index += 1
@@ -88,9 +202,49 @@ class Syntactic:
         """
         Analisa um loop 'for' na sequência de tokens e gera o nó correspondente na árvore sintática.
 
+        O corpo é uma declaração ou uma sequência de declarações separadas por ';' (um `BlockNode`),
+        e pode conter outros loops. Os loops aninhados são analisados com uma pilha explícita, sem
+        recursão; um ';' sempre pertence ao loop aberto mais interno.
+
         Returns:
             ForLoopNode: O nó correspondente ao loop 'for' na árvore sintática.
         """
+        # Loops abertos: a variável, o iterável e as declarações do corpo de cada um
+        loops = []
+
+        while True:
+            if self.__current().type == TokenType.FOR:
+                variable, iterable = self.__parse_for_header()
+                loops.append((variable, iterable, []))
+                continue
+
+            loops[-1][2].append(self.__parse_statement())
+
+            if self.current_token_index < len(self.tokens) and self.tokens[self.current_token_index].type == TokenType.SEMICOLON:
+                self.current_token_index += 1
+                # Um ';' no fim da entrada deixaria o corpo incompleto
+                if self.current_token_index >= len(self.tokens):
+                    raise TokenException("Fim inesperado da sequência de tokens")
+            else:
+                break
+
+        # Fecha os loops do mais interno para o mais externo; cada um é a última declaração do anterior
+        loop = None
+        while loops:
+            variable, iterable, statements = loops.pop()
+            if loop is not None:
+                statements.append(loop)
+            loop = ForLoopNode(variable, iterable, statements[0] if len(statements) == 1 else BlockNode(statements))
+
+        return loop
+
+    def __parse_for_header(self) -> Tuple[str, ASTNode]:
+        """
+        Analisa o cabeçalho de um loop 'for', até os dois pontos.
+
+        Returns:
+            Tuple[str, ASTNode]: A variável e o iterável do loop.
+        """
         self.__match(TokenType.FOR)
         variable = self.__match(TokenType.IDENTIFIER).value
         self.__match(TokenType.IN)
@@ -98,33 +252,31 @@ class Syntactic:
         start = None
         end = None
 
-        if self.tokens[self.current_token_index].type == TokenType.RANGE:
+        if self.__current().type == TokenType.RANGE:
             self.__match(TokenType.RANGE)
-            start = self.__parse_expression()
-
-            if isinstance(start, IntegerNode):
-                end = start
-                start = ASTNode(
-                    node_type=TokenType.INTEGER.name,
-                    value='0',
-                    children=None,
-                    expression=None)
-
-            elif len(start) < 2:  # 2 argumentos no range
-                self.__match(TokenType.COMMA)
+            arguments = self.__parse_expression()
+
+            # 'intervalo(fim)' ou 'intervalo(início, fim)', com inteiros ou variáveis
+            if not isinstance(arguments, tuple):
+                arguments = (arguments,)
+            for argument in arguments:
+                if not isinstance(argument, (IntegerNode, IdentifierNode)):
+                    raise TokenException(f"Argumento não suportado em 'intervalo': {getattr(argument, 'value', argument)}")
+
+            if len(arguments) == 1:
+                start = ASTNode(node_type=TokenType.INTEGER.name, value='0', children=None, expression=None)
+                end = arguments[0]
             else:
-                end = start[1]
-                start = start[0]
+                start, end = arguments
         else:
             iterable = self.__parse_expression()
 
         self.__match(TokenType.COLON)
-        body = self.__parse_statement()
 
         if start is not None and end is not None:
-            return ForLoopNode(variable, RangeNode(start, end), body)
+            return variable, RangeNode(start, end)
         else:
-            return ForLoopNode(variable, iterable, body)
+            return variable, iterable
 
     def __parse_range_statement(self) -> RangeNode:
         """
@@ -157,7 +309,7 @@ class Syntactic:
         Returns:
             Union[ASTNode, Tuple[ASTNode, ASTNode]]: O nó correspondente à expressão na árvore sintática.
         """
-        current_token = self.tokens[self.current_token_index]
+        current_token = self.__current()
 
         if current_token.type == TokenType.LPAREN:
             return self.__parse_parenthesized_expression()
@@ -185,7 +337,7 @@ class Syntactic:
         expression = self.__parse_expression()
 
         # Adicione a lógica para lidar com uma possível vírgula
-        if self.tokens[self.current_token_index].type == TokenType.COMMA:
+        if self.__current().type == TokenType.COMMA:
             self.__match(TokenType.COMMA)
             # Se houver uma vírgula, espera-se mais uma expressão
             second_expression = self.__parse_expression()
@@ -0,0 +1,253 @@
+from utils.syntax_tree import ASTNode
+from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode, IntegerNode, StringNode, BlockNode
+from utils.token_type import TokenType
+from utils.token import Token
+from utils.grammar import Grammar
+from exceptions.token_exception import TokenException
+from typing import List
+
+# Gramática da linguagem 'para/no/intervalo/escreva'. As ações (iniciadas por '@') constroem
+# os mesmos nós gerados pelo analisador recursivo `Syntactic`. O ';' só aparece no corpo de
+# um loop e por isso não pertence ao FOLLOW de `body_tail`: a gramática continua LL(1), e um
+# ';' sempre continua o corpo do loop aberto mais interno.
+GRAMMAR = """
+program    -> statement @statement program | ε
+statement  -> loop | simple
+loop       -> FOR IDENTIFIER IN iterable COLON @body body @for_loop
+body       -> loop | simple body_tail
+body_tail  -> SEMICOLON body | ε
+simple     -> PRINT expression @print | RANGE expression COLON expression @range
+iterable   -> RANGE expression @range_arguments | atom
+expression -> RANGE expression COLON expression @range | atom
+atom       -> LPAREN expression pair RPAREN | INTEGER @integer | STRING @string | IDENTIFIER @identifier | PRINT expression @print
+pair       -> COMMA expression @pair | ε
+"""
+
+# Tipos de símbolo na pilha de análise
+_TERMINAL = 0
+_VALUE_TERMINAL = 1
+_NONTERMINAL = 2
+_ACTION = 3
+
+# Códigos das ações semânticas
+_STATEMENT = 0
+_FOR_LOOP = 1
+_PRINT = 2
+_RANGE = 3
+_RANGE_ARGUMENTS = 4
+_INTEGER = 5
+_STRING = 6
+_IDENTIFIER = 7
+_PAIR = 8
+_BODY = 9
+
+_ACTIONS = {
+    '@statement': _STATEMENT,
+    '@for_loop': _FOR_LOOP,
+    '@print': _PRINT,
+    '@range': _RANGE,
+    '@range_arguments': _RANGE_ARGUMENTS,
+    '@integer': _INTEGER,
+    '@string': _STRING,
+    '@identifier': _IDENTIFIER,
+    '@pair': _PAIR,
+    '@body': _BODY,
+}
+
+# Terminais cujo valor é empilhado para uso pelas ações
+_VALUE_TERMINALS = frozenset((TokenType.IDENTIFIER, TokenType.INTEGER, TokenType.STRING))
+
+class TableSyntactic:
+    """
+    Analisador sintático dirigido por tabela LL(1), alternativo ao analisador recursivo `Syntactic`.
+
+    A tabela é gerada a partir da descrição da gramática em `GRAMMAR` e a análise usa uma
+    pilha explícita, sem uma chamada de função por produção. A árvore produzida é a mesma
+    do `Syntactic`, que continua sendo o analisador padrão: este tem vazão próxima à dele,
+    mas não faz recuperação de erros. Ele é mantido como a forma executável da gramática,
+    cuja tabela é verificada contra conflitos, e serve de referência para o `Syntactic`
+    (`benchmarks/bench_parser.py` compara as árvores dos dois).
+    """
+
+    # Tabela compilada, gerada na primeira análise
+    _table = None
+
+    @staticmethod
+    def parse(tokens: List[Token], show_result: bool = False) -> ASTNode:
+        """
+        Analisa a sequência de tokens e gera a árvore sintática (AST).
+
+        Args:
+            tokens (List[Token]): A sequência de tokens gerada pelo lexer.
+            show_result (bool, optional): Indica se os resultados devem ser exibidos. Padrão é False.
+
+        Returns:
+            ASTNode: A raiz da árvore sintática.
+
+        Raises:
+            TokenException: Se a sequência de tokens não pertencer à linguagem.
+        """
+        start = TableSyntactic.get_table()
+        program_node = ASTNode("PROGRAM", children=[])
+        statements = program_node.children
+        values = []
+        stack = [start]
+
+        # Posição em `values` onde começa o corpo de cada loop aberto
+        bodies = []
+
+        # Tipos dos tokens em uma lista simples, terminada por None (fim da entrada)
+        types = [token.type for token in tokens]
+        types.append(None)
+        index = 0
+        lookahead = types[0]
+
+        pop = stack.pop
+        push = stack.extend
+
+        while stack:
+            kind, payload = pop()
+
+            if kind <= _VALUE_TERMINAL:
+                if lookahead is not payload:
+                    TableSyntactic.__unexpected(tokens, index)
+                if kind:
+                    values.append(tokens[index].value)
+
+                index += 1
+                lookahead = types[index]
+
+            elif kind == _NONTERMINAL:
+                entry = payload.get(lookahead)
+                if entry is None:
+                    TableSyntactic.__unexpected(tokens, index)
+
+                # O primeiro terminal da produção é o próprio lookahead e é consumido aqui
+                first, production = entry
+                if first >= 0:
+                    if first:
+                        values.append(tokens[index].value)
+                    index += 1
+                    lookahead = types[index]
+                push(production)
+
+            # Ações semânticas, tratadas no próprio laço para evitar chamadas de função
+            elif payload == _STATEMENT:
+                statements.append(values.pop())
+            elif payload == _IDENTIFIER:
+                values.append(IdentifierNode(values.pop()))
+            elif payload == _INTEGER:
+                values.append(IntegerNode(values.pop()))
+            elif payload == _STRING:
+                values.append(StringNode(values.pop()))
+            elif payload == _PRINT:
+                values.append(PrintNode(expression=values.pop()))
+            elif payload == _RANGE:
+                end = values.pop()
+                values.append(RangeNode(values.pop(), end))
+            elif payload == _PAIR:
+                second = values.pop()
+                values.append((values.pop(), second))
+            elif payload == _RANGE_ARGUMENTS:
+                values.append(TableSyntactic.__range_arguments(values.pop()))
+            elif payload == _BODY:
+                bodies.append(len(values))
+            elif payload == _FOR_LOOP:
+                start_of_body = bodies.pop()
+                body = values[start_of_body:]
+                del values[start_of_body:]
+                body = body[0] if len(body) == 1 else BlockNode(body)
+                iterable = values.pop()
+                values.append(ForLoopNode(values.pop(), iterable, body))
+
+        if show_result:
+            print('Resultados da análise Sintática: (AST)')
+            print(program_node.__repr__(level=1))
+
+        return program_node
+
+    @staticmethod
+    def get_table():
+        """
+        Retorna a tabela LL(1) compilada para a análise, gerando-a na primeira chamada.
+
+        Na tabela compilada cada símbolo é um par (tipo, conteúdo) e as produções já estão
+        invertidas, prontas para serem empilhadas. Uma produção que começa por um não terminal
+        já traz a produção que ele teria com o mesmo lookahead (e assim por diante), de modo
+        que as cadeias como `statement -> loop -> FOR ...` são expandidas de uma só vez, e o
+        terminal inicial de uma produção é consumido na própria expansão, sem ser empilhado.
+
+        Returns:
+            Tuple[int, dict]: O símbolo inicial da gramática, já compilado.
+        """
+        if TableSyntactic._table is None:
+            grammar = Grammar(GRAMMAR)
+            table = grammar.table()
+            rows = {head: {} for head in table}
+
+            def compile_symbol(symbol):
+                if grammar.is_action(symbol):
+                    return (_ACTION, _ACTIONS[symbol])
+                if grammar.is_terminal(symbol):
+                    token_type = TokenType[symbol]
+                    return (_VALUE_TERMINAL if token_type in _VALUE_TERMINALS else _TERMINAL, token_type)
+                return (_NONTERMINAL, rows[symbol])
+
+            for head, row in table.items():
+                for lookahead, symbols in row.items():
+                    rows[head][lookahead] = tuple(compile_symbol(symbol) for symbol in reversed(symbols))
+
+            # Como a gramática é LL(1), o mesmo lookahead escolhe a produção do primeiro símbolo
+            for row in rows.values():
+                for lookahead, production in row.items():
+                    while production and production[-1][0] == _NONTERMINAL:
+                        production = production[:-1] + production[-1][1][lookahead]
+                    row[lookahead] = production
+
+            # Se a produção começa por um terminal, ele é o próprio lookahead e é consumido na
+            # expansão: cada entrada é um par (tipo do terminal consumido ou -1, produção restante)
+            for row in rows.values():
+                for lookahead, production in row.items():
+                    if production and production[-1][0] <= _VALUE_TERMINAL:
+                        row[lookahead] = (production[-1][0], production[:-1])
+                    else:
+                        row[lookahead] = (-1, production)
+
+            TableSyntactic._table = (_NONTERMINAL, rows[grammar.start])
+
+        return TableSyntactic._table
+
+    @staticmethod
+    def __range_arguments(arguments) -> RangeNode:
+        """
+        Constrói o intervalo de um loop 'para' a partir dos argumentos de 'intervalo'.
+
+        Args:
+            arguments: O fim do intervalo ou um par (início, fim), com inteiros ou variáveis.
+
+        Returns:
+            RangeNode: O nó do intervalo.
+        """
+        if not isinstance(arguments, tuple):
+            arguments = (arguments,)
+        for argument in arguments:
+            if not isinstance(argument, (IntegerNode, IdentifierNode)):
+                raise TokenException(f"Argumento não suportado em 'intervalo': {getattr(argument, 'value', argument)}")
+
+        if len(arguments) == 1:
+            start = ASTNode(
+                node_type=TokenType.INTEGER.name,
+                value='0',
+                children=None,
+                expression=None)
+            return RangeNode(start, arguments[0])
+        return RangeNode(arguments[0], arguments[1])
+
+    @staticmethod
+    def __unexpected(tokens: List[Token], index: int) -> None:
+        """
+        Lança o erro correspondente a um token não esperado pela gramática.
+        """
+        if index >= len(tokens):
+            raise TokenException("Fim inesperado da sequência de tokens")
+        raise TokenException(f"Token não esperado: {tokens[index].value}")
@@ -0,0 +1,51 @@
+import ast
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+
+# Programas com sequências de escape, que o backend AST deve decodificar como o Python
+ESCAPED = [
+    r"para i no intervalo(2): escreva('a\tb')",
+    r'para c no "a\\n": escreva(c)',
+]
+
+def measure(function, trees):
+    """
+    Mede o tempo médio por programa da geração e compilação.
+    """
+    start = time.perf_counter()
+    for tree in trees:
+        function(tree)
+    return (time.perf_counter() - start) / len(trees)
+
+def through_source(tree):
+    """
+    Caminho atual: gera o código-fonte e o analisa novamente antes de compilar.
+    """
+    return compile(ast.parse(CodeGenerator.generate(tree)), "<string>", 'exec')
+
+def through_ast(tree):
+    """
+    Caminho direto: gera a árvore Python e a compila.
+    """
+    return compile(CodeGenerator.generate_ast(tree), "<string>", 'exec')
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    trees = [Semantic.analyze(Syntactic.parse(Lexer.scanner(line))) for line in ProgramGenerator().lines(count)]
+
+    # Os dois caminhos devem produzir a mesma árvore Python
+    for tree in trees[:1000] + [Semantic.analyze(Syntactic.parse(Lexer.scanner(line))) for line in ESCAPED]:
+        assert ast.dump(ast.parse(CodeGenerator.generate(tree))) == ast.dump(CodeGenerator.generate_ast(tree))
+
+    source = measure(through_source, trees)
+    direct = measure(through_ast, trees)
+
+    print(f"Programas: {count}")
+    print(f"Código-fonte + ast.parse: {source * 1e6:7.2f} us/programa")
+    print(f"AST direta:               {direct * 1e6:7.2f} us/programa")
+    print(f"Economia:                 {(source - direct) * 1e6:7.2f} us/programa")
@@ -0,0 +1,76 @@
+import sys
+import time
+import tracemalloc
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from utils.ast_arena import ASTArena
+
+class DictNode:
+    """
+    Reproduz o layout anterior do ASTNode, com dicionário por instância e tipo como string.
+    """
+
+    def __init__(self, node_type, value=None, children=None, expression=None):
+        self.node_type = node_type
+        self.value = value
+        self.children = children or []
+        self.expression = expression
+
+def to_dict_nodes(node):
+    """
+    Copia uma árvore para o layout anterior, sem recursão.
+    """
+    root = DictNode(node.node_type, node.value)
+    stack = [(node, root)]
+    while stack:
+        source, target = stack.pop()
+        for child in source.children:
+            copy = DictNode(child.node_type, child.value)
+            target.children.append(copy)
+            stack.append((child, copy))
+    return root
+
+def retained(function):
+    """
+    Retorna a memória (em bytes) mantida pelo resultado da função, junto com o resultado.
+    """
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+def walk_objects(root):
+    """
+    Percorre uma árvore de objetos em pré-ordem, sem recursão.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(reversed(node.children))
+    return count
+
+def timed(function, argument):
+    start = time.perf_counter()
+    function(argument)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tokens = Lexer.scanner_buffer(' '.join(ProgramGenerator().lines(count)))
+
+    slots_memory, tree = retained(lambda: Syntactic.parse(tokens))
+    dict_memory, dict_tree = retained(lambda: to_dict_nodes(tree))
+    arena_memory, arena = retained(lambda: ASTArena.from_tree(tree))
+    nodes = len(arena)
+
+    print(f"Declarações: {count}, nós: {nodes}")
+    for label, memory in (("ASTNode com __dict__", dict_memory), ("ASTNode com __slots__", slots_memory), ("ASTArena", arena_memory)):
+        print(f"{label:<22} {memory / 2 ** 20:8.1f} MiB  ({memory / nodes:6.1f} bytes/nó)")
+
+    print(f"Percurso (__dict__):  {timed(walk_objects, dict_tree) * 1e3:8.1f} ms")
+    print(f"Percurso (__slots__): {timed(walk_objects, tree) * 1e3:8.1f} ms")
+    print(f"Percurso (ASTArena):  {timed(lambda a: sum(1 for _ in a.walk()), arena) * 1e3:8.1f} ms")
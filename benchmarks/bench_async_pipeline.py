@@ -0,0 +1,61 @@
+import asyncio
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+from compilers.async_pipeline import AsyncPipeline
+
+def sequential(lines, latency):
+    """
+    Lê, compila e executa cada programa estritamente em sequência. A latência simula a
+    espera pela chegada de cada programa (por exemplo, por um socket).
+    """
+    for line in lines:
+        time.sleep(latency)
+        tokens = Lexer.tokenize(line)
+        syntax_tree = Syntactic.parse(tokens)
+        semantic_tree = Semantic.analyze(syntax_tree)
+        Compiler.run(CodeGenerator.generate(semantic_tree))
+
+async def drain(source):
+    """
+    Consome a entrada sem compilar nada, medindo o limite imposto pela própria entrada.
+    """
+    async for _ in source:
+        pass
+
+async def slow_source(lines, latency):
+    """
+    Entrega os programas com a mesma latência, sem bloquear o laço de eventos.
+    """
+    for line in lines:
+        await asyncio.sleep(latency)
+        yield line
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines = ProgramGenerator().lines(count)
+
+    for latency in (0, 0.002):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            sequential(lines, latency)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            AsyncPipeline.process(slow_source(lines, latency) if latency else lines)
+            pipeline = time.perf_counter() - start
+
+        print(f"Programas: {count}, latência da entrada: {latency * 1e3:.1f} ms")
+        if latency:
+            start = time.perf_counter()
+            asyncio.run(drain(slow_source(lines, latency)))
+            print(f"  Só a entrada: {count / (time.perf_counter() - start):10.0f} programas/s")
+        print(f"  Em sequência: {count / single:10.0f} programas/s")
+        print(f"  Pipeline:     {count / pipeline:10.0f} programas/s")
@@ -0,0 +1,46 @@
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+
+def compile_one_by_one(lines):
+    """
+    Compila as expressões uma a uma, criando novos analisadores a cada linha, como em `main.py`.
+    """
+    for line in lines:
+        tokens = Lexer.scanner(line)
+        syntax_tree = Syntactic.parse(tokens)
+        semantic_tree = Semantic.analyze(syntax_tree)
+        code = CodeGenerator.generate(semantic_tree)
+        compile(code, "<string>", 'exec')
+
+def best_rate(function, lines, repeat=5):
+    """
+    Retorna a melhor taxa, em programas por segundo, de `repeat` execuções da função.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(lines)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lines = ProgramGenerator().lines(count)
+    results = Compiler.compile_many(lines)
+    print(f"Programas: {count} (distintos: {len(set(lines))}, erros no lote: {sum(not result.ok for result in results)})")
+
+    # As repetições do gerador favorecem o lote; sem elas, só resta o reaproveitamento dos analisadores
+    unique = list(dict.fromkeys(lines))
+    for label, corpus in (("Com repetições", lines), ("Sem repetições", unique)):
+        compile_one_by_one(corpus[:100])  # aquecimento
+        single = best_rate(compile_one_by_one, corpus)
+        batch = best_rate(Compiler.compile_many, corpus)
+        print(f"{label} ({len(corpus)} programas):")
+        print(f"  Um a um:   {single:10.0f} programas/s")
+        print(f"  Em lote:   {batch:10.0f} programas/s ({batch / single:.2f}x)")
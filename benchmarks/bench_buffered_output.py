@@ -0,0 +1,68 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+
+class CountingSink:
+    """
+    Saída que descarta o texto e conta as chamadas de escrita, que correspondem às
+    chamadas de sistema feitas por uma saída sem buffer.
+    """
+
+    def __init__(self):
+        self.writes = 0
+        self.size = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.size += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+def output_of(code):
+    """
+    Executa o código gerado com `Compiler.run` e retorna a saída produzida.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        Compiler.run(code)
+    return output.getvalue()
+
+def measure(code):
+    """
+    Executa o código gerado e retorna o tempo, a quantidade de escritas e o tamanho da saída.
+    """
+    sink = CountingSink()
+    code_object = compile(code, "<string>", 'exec')
+    with redirect_stdout(sink):
+        start = time.perf_counter()
+        exec(code_object, {})
+        elapsed = time.perf_counter() - start
+    return elapsed, sink.writes, sink.size
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    # O modo com buffer deve produzir a mesma saída pelo executor do próprio compilador
+    for program in ("para i no intervalo(3): escreva(i)", "para i no intervalo(20): escreva('x')"):
+        tree = Semantic.analyze(Syntactic.parse(Lexer.scanner(program)))
+        expected = output_of(CodeGenerator.generate(tree))
+        for flush_size in (1, 7, 8192):
+            assert output_of(CodeGenerator.generate(tree, buffered=True, flush_size=flush_size)) == expected, program
+
+    semantic_tree = Semantic.analyze(Syntactic.parse(Lexer.scanner(f"para i no intervalo({size}): escreva(i)")))
+
+    print(f"para i no intervalo({size}): escreva(i)")
+    elapsed, writes, output = measure(CodeGenerator.generate(semantic_tree))
+    print(f"print por iteração:    {elapsed * 1e3:9.1f} ms  {writes:>9} escritas  {output} caracteres")
+
+    for flush_size in (1024, 8192, 65536):
+        elapsed, writes, output = measure(CodeGenerator.generate(semantic_tree, buffered=True, flush_size=flush_size))
+        print(f"buffer de {flush_size:>6}:      {elapsed * 1e3:9.1f} ms  {writes:>9} escritas  {output} caracteres")
@@ -0,0 +1,34 @@
+import shutil
+import sys
+import tempfile
+import time
+from benchmarks.generator import ProgramGenerator
+from compilers.compiler import Compiler
+from compilers.compilation_cache import CompilationCache
+
+def measure(lines, cache=None):
+    """
+    Retorna a vazão (programas/s) de `Compiler.compile_many` com o cache fornecido.
+    """
+    start = time.perf_counter()
+    Compiler.compile_many(lines, cache=cache)
+    return len(lines) / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    # Repete um conjunto pequeno de programas distintos, como em cargas reais com muitas repetições
+    programs = ProgramGenerator().lines(distinct)
+    lines = [programs[i % distinct] for i in range(count)]
+    directory = tempfile.mkdtemp()
+
+    try:
+        print(f"Programas: {count} ({distinct} distintos)")
+        print(f"Sem cache:          {measure(lines):10.0f} programas/s")
+        print(f"Cache em memória:   {measure(lines, CompilationCache()):10.0f} programas/s")
+
+        measure(programs, CompilationCache(directory=directory))
+        print(f"Cache em disco:     {measure(programs, CompilationCache(directory=directory)):10.0f} programas/s (primeira leitura)")
+    finally:
+        shutil.rmtree(directory)
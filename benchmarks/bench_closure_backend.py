@@ -0,0 +1,99 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.optimizer import Optimizer
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+from compilers.closure_compiler import ClosureCompiler
+
+# Programas com loops aninhados, blocos, sequências de escape e '%', além das linhas do gerador
+NESTED = [
+    "para i no intervalo(3): para j no intervalo(0, i): escreva(i); escreva(j)",
+    "para i no intervalo(2): escreva('a'); escreva(i); para x no 'xy': escreva(x); escreva(i)",
+    "para i no intervalo(4): para j no intervalo(i, 5): para k no intervalo(j, 6): escreva(k)",
+    r"para i no intervalo(2): escreva('a\tb'); escreva(i)",
+    r'para c no "a\\n\t": escreva(c)',
+    r"para i no intervalo(3): escreva('\u00e9\\')",
+    "para i no intervalo(3): escreva('%d 100%'); escreva(i); escreva(i)",
+    "para i no intervalo(2): escreva(i); para j no intervalo(i, 3): escreva(i); escreva(j); escreva('%s')",
+    "para x no 'a%b': escreva(x); escreva(x)",
+    "para i no intervalo(3, 3): escreva(i); escreva('-')",
+    "para i no intervalo(4): para j no intervalo(i): escreva(j); escreva('.')",
+]
+
+def analyze(source):
+    """
+    Passa um programa pelas etapas léxica, sintática e semântica.
+    """
+    return Semantic.analyze(Syntactic.parse(Lexer.tokenize(source)))
+
+def source_path(tree):
+    """
+    O caminho atual: gera o código-fonte e o executa com `Compiler.run` (ast.parse, compile e exec).
+    """
+    Compiler.run(CodeGenerator.generate(tree))
+
+def closure_path(tree):
+    """
+    O backend de closures: compila o programa e o executa.
+    """
+    ClosureCompiler.compile(tree)()
+
+def output_of(function, tree):
+    """
+    Executa um caminho e retorna a saída produzida.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        function(tree)
+    return output.getvalue()
+
+def best_time(function, trees, repeat=5):
+    """
+    Retorna o melhor tempo de `repeat` execuções do caminho sobre todos os programas.
+    """
+    best = float('inf')
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for tree in trees:
+                function(tree)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    generator = ProgramGenerator(42)
+
+    # As saídas dos dois caminhos devem ser idênticas, com e sem o Optimizer
+    sources = generator.lines(count) + NESTED
+    trees = [analyze(source) for source in sources]
+    for source, tree in zip(sources, trees):
+        for entries in (tree, Optimizer.optimize(tree)):
+            assert output_of(source_path, entries) == output_of(closure_path, entries), source
+    print(f"Saídas idênticas em {len(sources)} programas")
+
+    # Programas curtos: a compilação domina o tempo total
+    short = trees[:count]
+    source_time = best_time(source_path, short)
+    closure_time = best_time(closure_path, short)
+    print(f"Programas curtos ({count}):")
+    print(f"  CodeGenerator + Compiler.run  {source_time / count * 1e6:8.1f} µs/programa")
+    print(f"  ClosureCompiler               {closure_time / count * 1e6:8.1f} µs/programa ({source_time / closure_time:.1f}x)")
+
+    # Programas longos: a execução domina, e o corpo com um loop paga uma chamada por iteração
+    for source in ("para i no intervalo(200000): escreva(i)",
+                   "para i no intervalo(20000): escreva(i); escreva('-')",
+                   "para i no intervalo(20000): escreva(i); para j no intervalo(2): escreva(j)",
+                   "para i no intervalo(500): para j no intervalo(200): escreva(j)"):
+        tree = [analyze(source)]
+        source_time = best_time(source_path, tree, repeat=3)
+        closure_time = best_time(closure_path, tree, repeat=3)
+        print(f"{source}:")
+        print(f"  CodeGenerator + Compiler.run  {source_time * 1e3:8.1f} ms")
+        print(f"  ClosureCompiler               {closure_time * 1e3:8.1f} ms ({source_time / closure_time:.1f}x)")
@@ -0,0 +1,30 @@
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.incremental_parser import IncrementalParser
+
+if __name__ == "__main__":
+    generator = ProgramGenerator()
+    edit = generator.line()
+
+    for count in (1_000, 10_000, 100_000) if len(sys.argv) < 2 else (int(sys.argv[1]),):
+        lines = generator.lines(count)
+        incremental = IncrementalParser('\n'.join(lines))
+
+        start = time.perf_counter()
+        Syntactic.parse(Lexer.scanner(' '.join(lines)))
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        incremental.replace_line(count // 2, edit)
+        partial = time.perf_counter() - start
+
+        # Uma linha nova desloca as listas e muda a quantidade de declarações
+        start = time.perf_counter()
+        incremental.update(count // 4, count // 4, [edit])
+        insertion = time.perf_counter() - start
+
+        print(f"Linhas: {count:>7}  análise completa: {full * 1e3:9.2f} ms  edição de uma linha: {partial * 1e3:7.3f} ms"
+              f"  inserção de uma linha: {insertion * 1e3:7.3f} ms")
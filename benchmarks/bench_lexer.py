@@ -0,0 +1,43 @@
+import re
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from utils.token import Token
+from utils.token_type import TokenType
+from utils.token_patterns import TokenPatterns
+
+def uncached_scanner(expression):
+    """
+    Reproduz o comportamento anterior do Lexer, recompilando o padrão a cada chamada.
+    """
+    tokens = []
+    combined_pattern = '|'.join('(?P<%s_%s>%s)' % (name, i, pattern) for i, (pattern, name) in enumerate(TokenPatterns.get_patterns(), start=1))
+    regex = re.compile(combined_pattern)
+    for match in regex.finditer(expression):
+        for name, value in match.groupdict().items():
+            if value is not None:
+                tokens.append(Token(TokenType[name.split('_')[0].upper()], value))
+                break
+    return tokens
+
+def measure(function, lines):
+    """
+    Mede o tempo médio por chamada de uma função de análise léxica.
+    """
+    start = time.perf_counter()
+    for line in lines:
+        function(line)
+    return (time.perf_counter() - start) / len(lines)
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = ProgramGenerator().lines(count)
+
+    before = measure(uncached_scanner, lines)
+    after = measure(Lexer.scanner, lines)
+
+    print(f"Linhas: {count}")
+    print(f"Sem cache: {before * 1e6:.2f} us/chamada")
+    print(f"Com cache: {after * 1e6:.2f} us/chamada")
+    print(f"Ganho:     {before / after:.2f}x")
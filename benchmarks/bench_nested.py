@@ -0,0 +1,80 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from utils.ast_nodes import ForLoopNode, BlockNode
+
+# O Python não compila mais de 20 blocos aninhados
+MAX_EXECUTABLE_DEPTH = 20
+
+def nested_program(depth, statements=1):
+    """
+    Gera um programa com `depth` loops aninhados; o loop mais interno escreve a sua variável
+    `statements` vezes, em declarações separadas por ';'.
+    """
+    headers = ''.join(f"para v{level} no intervalo(2): " for level in range(depth))
+    return headers + '; '.join([f"escreva(v{depth - 1})"] * statements)
+
+def reindent_generate(node):
+    """
+    Geração recursiva em que o código de cada corpo é gerado à parte e reindentado pelo loop
+    que o contém: cada linha é copiada uma vez por nível, o que é quadrático na profundidade.
+    """
+    if isinstance(node, ForLoopNode):
+        iterable, body = node.children
+        start, end = (child.value for child in iterable.children)
+        lines = reindent_generate(body).split('\n')
+        return f"for {node.binding.target} in range({start}, {end}):\n" + '\n'.join('    ' + line for line in lines)
+    if isinstance(node, BlockNode):
+        return '\n'.join(reindent_generate(child) for child in node.children)
+    return f"print({node.children[0].binding.target})"
+
+def best_time(function, argument, repeat=5):
+    """
+    Retorna o melhor tempo de `repeat` execuções da função.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def output_of(code):
+    """
+    Executa o código e retorna a sua saída.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        exec(compile(code, "<string>", 'exec'), {})
+    return output.getvalue()
+
+if __name__ == "__main__":
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    # As saídas dos backends devem ser idênticas em todas as profundidades executáveis
+    for depth in range(1, MAX_EXECUTABLE_DEPTH + 1, 3):
+        tree = Semantic.analyze(Syntactic.parse(Lexer.tokenize(nested_program(depth, statements))))
+        outputs = {output_of(CodeGenerator.generate(tree)),
+                   output_of(CodeGenerator.generate(tree, buffered=True)),
+                   output_of(CodeGenerator.generate_ast(tree))}
+        assert len(outputs) == 1, f"Saídas diferentes na profundidade {depth}"
+    print(f"Saídas idênticas até a profundidade {MAX_EXECUTABLE_DEPTH}")
+
+    print(f"Declarações no loop mais interno: {statements}")
+    for depth in (10, 100, 400, 1600, 6400):
+        tree = Semantic.analyze(Syntactic.parse(Lexer.tokenize(nested_program(depth, statements))))
+        generator = CodeGenerator()
+        generated = best_time(generator.generate_code, tree)
+
+        reindent = ''
+        if depth <= 400:  # a recursão de reindent_generate esbarra no limite do Python
+            reindented = best_time(reindent_generate, tree[0]['binding'].node)
+            reindent = f"   reindentação {reindented * 1e3:9.3f} ms"
+
+        print(f"Profundidade {depth:>5}: CodeGenerator {generated * 1e3:9.3f} ms "
+              f"({generated / depth * 1e6:6.2f} µs/nível){reindent}")
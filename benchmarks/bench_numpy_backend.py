@@ -0,0 +1,78 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator, numpy
+from compilers.compiler import Compiler
+
+# Intervalos vazios, curtos e que atravessam os blocos de VECTOR_CHUNK valores
+CHECKED = ["intervalo(0)", "intervalo(5)", "intervalo(7, 2)", "intervalo(9, 1234)", f"intervalo(5, {2 * CodeGenerator.VECTOR_CHUNK + 5})"]
+
+class CountingSink:
+    """
+    Saída que descarta o texto, contando apenas as escritas e o tamanho da saída.
+    """
+
+    def __init__(self):
+        self.writes = 0
+        self.size = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.size += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+def output_of(code):
+    """
+    Executa o código gerado com `Compiler.run` e retorna a saída produzida.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        Compiler.run(code)
+    return output.getvalue()
+
+def measure(code):
+    """
+    Executa o código gerado e retorna o tempo, a quantidade de escritas e o tamanho da saída.
+    """
+    sink = CountingSink()
+    code_object = compile(code, "<string>", 'exec')
+    with redirect_stdout(sink):
+        start = time.perf_counter()
+        exec(code_object, {})
+        elapsed = time.perf_counter() - start
+    return elapsed, sink.writes, sink.size
+
+if __name__ == "__main__":
+    # Uso: bench_numpy_backend.py [maior expoente] [maior expoente do loop Python]
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    python_exponent = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    if numpy is None:
+        print("NumPy não instalado: o backend 'numpy' gera o mesmo loop Python")
+
+    # O backend deve produzir a mesma saída pelo executor do próprio compilador
+    for iterable in CHECKED:
+        tree = Semantic.analyze(Syntactic.parse(Lexer.scanner(f"para i no {iterable}: escreva(i)")))
+        expected = output_of(CodeGenerator.generate(tree))
+        for buffered in (False, True):
+            assert output_of(CodeGenerator.generate(tree, backend='numpy', buffered=buffered)) == expected, iterable
+
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        semantic_tree = Semantic.analyze(Syntactic.parse(Lexer.scanner(f"para i no intervalo({size}): escreva(i)")))
+        print(f"para i no intervalo({size}): escreva(i)")
+
+        if exponent <= python_exponent:
+            for name, options in (("python", {}), ("python com buffer", {'buffered': True, 'flush_size': 65536})):
+                elapsed, writes, output = measure(CodeGenerator.generate(semantic_tree, **options))
+                print(f"  {name:<18} {elapsed * 1e3:10.1f} ms  {writes:>10} escritas  {output} caracteres")
+
+        elapsed, writes, output = measure(CodeGenerator.generate(semantic_tree, backend='numpy'))
+        print(f"  {'numpy':<18} {elapsed * 1e3:10.1f} ms  {writes:>10} escritas  {output} caracteres")
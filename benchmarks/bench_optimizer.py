@@ -0,0 +1,54 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.optimizer import Optimizer
+from analyzers.code_generator import CodeGenerator
+
+PROGRAMS = [
+    "para i no intervalo(5): escreva(i)",
+    "para i no intervalo(5, 15): escreva(i)",
+    "para i no intervalo(1000): escreva(i)",
+    "para i no intervalo(100000): escreva(i)",
+    "para i no 'COMPILADORES': escreva(i)",
+    "para i no intervalo(50000): escreva('x')",
+    r"para i no intervalo(1000): escreva('a\tb')",
+    r"para c no 'a\tb': escreva(c)",
+]
+
+def output_of(code_object):
+    """
+    Executa o código e retorna a sua saída.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        exec(code_object, {})
+    return output.getvalue()
+
+def run_time(code_object, repeat):
+    """
+    Retorna o melhor tempo de execução do código, descartando a saída.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            exec(code_object, {})
+            best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for program in PROGRAMS:
+        semantic_tree = Semantic.analyze(Syntactic.parse(Lexer.scanner(program)))
+        plain = compile(CodeGenerator.generate(semantic_tree), "<string>", 'exec')
+        optimized = compile(CodeGenerator.generate(Optimizer.optimize(semantic_tree)), "<string>", 'exec')
+        assert output_of(plain) == output_of(optimized), f"Saídas diferentes: {program}"
+
+        before = run_time(plain, repeat)
+        after = run_time(optimized, repeat)
+        print(f"{program:<45} sem otimização: {before * 1e3:9.3f} ms  otimizado: {after * 1e3:9.3f} ms  ({before / after:7.1f}x)")
@@ -0,0 +1,26 @@
+import os
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from compilers.compiler import Compiler
+from compilers.parallel_compiler import ParallelCompiler
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = ProgramGenerator().lines(count)
+
+    start = time.perf_counter()
+    expected = Compiler.compile_many(lines)
+    sequential = time.perf_counter() - start
+
+    print(f"Programas: {count} (núcleos disponíveis: {os.cpu_count()})")
+    print(f"Sequencial: {sequential:7.2f} s")
+
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        results = ParallelCompiler.compile_many(lines, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        # Confere se a ordem e o conteúdo são os mesmos da compilação sequencial
+        assert [result.code for result in results] == [result.code for result in expected]
+        print(f"{workers} processo(s): {elapsed:7.2f} s  (aceleração {sequential / elapsed:.2f}x)")
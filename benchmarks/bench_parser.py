@@ -0,0 +1,28 @@
+import sys
+import time
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.table_syntactic import TableSyntactic
+
+def throughput(parse, tokens, repeat=5):
+    """
+    Retorna a melhor vazão (tokens/s) de uma função de análise sintática em algumas repetições.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(tokens)
+        best = min(best, time.perf_counter() - start)
+    return len(tokens) / best
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tokens = Lexer.scanner(' '.join(ProgramGenerator().lines(count)))
+
+    # Gera a tabela LL(1) antes da medição; os dois analisadores devem produzir a mesma árvore
+    assert repr(TableSyntactic.parse(tokens)) == repr(Syntactic.parse(tokens)), "Árvores diferentes"
+
+    print(f"Declarações: {count}, tokens: {len(tokens)}")
+    print(f"Descendente recursivo: {throughput(Syntactic.parse, tokens):12.0f} tokens/s")
+    print(f"Tabela LL(1):          {throughput(TableSyntactic.parse, tokens):12.0f} tokens/s")
@@ -0,0 +1,36 @@
+import sys
+import time
+from utils.symbol_table import SymbolTable
+
+def scan_resolve(scopes, name):
+    """
+    Resolução por busca na pilha de dicionários, do escopo mais interno para o global.
+    """
+    for scope in reversed(scopes):
+        if name in scope:
+            return scope[name]
+    return None
+
+if __name__ == "__main__":
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"Consultas por medição: {lookups}")
+    for depth in (1, 10, 100, 1000, 10000):
+        table = SymbolTable()
+        table.declare('global')
+        for level in range(depth):
+            table.enter_scope()
+            table.declare(f"v{level}")
+
+        # O pior caso para a busca na pilha: um nome declarado apenas no escopo global
+        start = time.perf_counter()
+        for _ in range(lookups):
+            table.resolve('global')
+        hashed = (time.perf_counter() - start) / lookups
+
+        start = time.perf_counter()
+        for _ in range(lookups // depth or 1):
+            scan_resolve(table.scopes, 'global')
+        scanned = (time.perf_counter() - start) / (lookups // depth or 1)
+
+        print(f"Profundidade {depth:>6}: tabela {hashed * 1e9:8.0f} ns   busca na pilha {scanned * 1e9:12.0f} ns")
@@ -0,0 +1,48 @@
+import io
+import sys
+import tracemalloc
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+
+class DictToken:
+    """
+    Reproduz a representação anterior do Token, com dicionário por instância.
+    """
+
+    def __init__(self, type, value):
+        self.type = type
+        self.value = value
+
+def measure(function):
+    """
+    Retorna o pico de memória alocada (em bytes) durante a execução da função,
+    junto com o resultado, que é mantido vivo até o fim da medição.
+    """
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, result
+
+if __name__ == "__main__":
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    generator = ProgramGenerator()
+
+    # Gera linhas até atingir a quantidade de tokens desejada
+    lines = []
+    count = 0
+    while count < target:
+        line = generator.line()
+        lines.append(line)
+        count += len(Lexer.scanner(line))
+    source = '\n'.join(lines)
+
+    dict_peak, dict_tokens = measure(lambda: [DictToken(token.type, token.value) for token in Lexer.iter_tokens(io.StringIO(source))])
+    del dict_tokens
+    slots_peak, slots_tokens = measure(lambda: Lexer.scanner(source))
+    del slots_tokens
+    buffer_peak, buffer = measure(lambda: Lexer.scanner_buffer(source))
+
+    print(f"Tokens: {len(buffer)}")
+    for label, peak in (("Token com __dict__", dict_peak), ("Token com __slots__", slots_peak), ("TokenBuffer", buffer_peak)):
+        print(f"{label:<20} {peak / 2 ** 20:8.1f} MiB  ({peak / len(buffer):6.1f} bytes/token)")
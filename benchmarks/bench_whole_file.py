@@ -0,0 +1,48 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+
+def compile_lines(lines):
+    """
+    Compila e executa cada linha como um módulo separado, como o `main.py` fazia com uma linha.
+    """
+    for line in lines:
+        tokens = Lexer.tokenize(line)
+        semantic_tree = Semantic.analyze(Syntactic.parse(tokens))
+        Compiler.run(CodeGenerator.generate(semantic_tree))
+
+def compile_file(source):
+    """
+    Compila e executa o arquivo inteiro como um único programa e um único módulo.
+    """
+    tokens, _ = Lexer.scan_with_diagnostics(source)
+    syntax_tree, _ = Syntactic.parse_with_recovery(tokens)
+    semantic_tree = Semantic.analyze(syntax_tree)
+    Compiler.run(CodeGenerator.generate(semantic_tree))
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    lines = ProgramGenerator().lines(count)
+    source = '\n'.join(lines)
+
+    with redirect_stdout(io.StringIO()) as per_line_output:
+        start = time.perf_counter()
+        compile_lines(lines)
+        per_line = time.perf_counter() - start
+
+    with redirect_stdout(io.StringIO()) as whole_file_output:
+        start = time.perf_counter()
+        compile_file(source)
+        whole_file = time.perf_counter() - start
+
+    print(f"Linhas: {count} (mesma saída: {per_line_output.getvalue() == whole_file_output.getvalue()})")
+    print(f"Um módulo por linha: {per_line * 1e3:9.1f} ms")
+    print(f"Arquivo inteiro:     {whole_file * 1e3:9.1f} ms")
+    print(f"Ganho:               {per_line / whole_file:9.2f}x")
@@ -0,0 +1,104 @@
+import random
+from typing import List
+
+# Palavras-chave da linguagem e as variantes em inglês, que o lexer não reconhece como
+# palavras-chave (são lidas como identificadores) e resultam em erro sintático
+KEYWORDS = {'pt': ('para', 'no', 'intervalo', 'escreva'), 'en': ('for', 'in', 'range', 'print')}
+
+class ProgramGenerator:
+    """
+    Gera programas sintéticos na linguagem 'para/no/intervalo/escreva' para benchmarks.
+    A geração é determinística para uma mesma semente.
+    """
+
+    def __init__(self, seed: int = 42):
+        """
+        Inicializa o gerador.
+
+        Parameters:
+            seed (int, optional): A semente do gerador pseudoaleatório. Padrão é 42.
+        """
+        self.random = random.Random(seed)
+
+    def line(self, language: str = 'pt') -> str:
+        """
+        Gera uma linha (declaração) válida.
+
+        Parameters:
+            language (str, optional): As palavras-chave usadas, 'pt' ou 'en'. Padrão é 'pt'.
+
+        Returns:
+            str: A linha gerada.
+        """
+        for_, in_, range_, print_ = KEYWORDS[language]
+        variable = self.random.choice('ijkxyz')
+        kind = self.random.randrange(3)
+
+        if kind == 0:
+            iterable = f"{range_}({self.random.randint(1, 50)})"
+        elif kind == 1:
+            start = self.random.randint(0, 25)
+            iterable = f"{range_}({start}, {start + self.random.randint(1, 25)})"
+        else:
+            iterable = f"'{''.join(self.random.choice('ABCDEFGHIJ') for _ in range(self.random.randint(1, 12)))}'"
+
+        return f"{for_} {variable} {in_} {iterable}: {print_}({variable})"
+
+    def invalid_line(self) -> str:
+        """
+        Gera uma linha inválida, a partir de uma linha válida com um erro léxico ou sintático:
+        um caractere desconhecido, um token removido ou uma declaração interrompida.
+
+        Returns:
+            str: A linha gerada.
+        """
+        line = self.line()
+        kind = self.random.randrange(3)
+
+        if kind == 0:
+            position = self.random.randrange(len(line))
+            return f"{line[:position]}{self.random.choice('@$?!=+')}{line[position:]}"
+        if kind == 1:
+            words = line.split(' ')
+            del words[self.random.randrange(len(words))]
+            return ' '.join(words)
+        return line[:self.random.randrange(1, len(line))]
+
+    def lines(self, count: int, invalid_ratio: float = 0.0, english_ratio: float = 0.0) -> List[str]:
+        """
+        Gera uma lista de linhas.
+
+        Parameters:
+            count (int): A quantidade de linhas.
+            invalid_ratio (float, optional): A fração de linhas inválidas. Padrão é 0.
+            english_ratio (float, optional): A fração de linhas com palavras-chave em inglês. Padrão é 0.
+
+        Returns:
+            List[str]: As linhas geradas.
+        """
+        if not invalid_ratio and not english_ratio:
+            return [self.line() for _ in range(count)]
+
+        lines = []
+        for _ in range(count):
+            draw = self.random.random()
+            if draw < invalid_ratio:
+                lines.append(self.invalid_line())
+            elif draw < invalid_ratio + english_ratio:
+                lines.append(self.line('en'))
+            else:
+                lines.append(self.line())
+        return lines
+
+    def program(self, count: int, **options) -> str:
+        """
+        Gera um programa com várias linhas.
+
+        Parameters:
+            count (int): A quantidade de linhas.
+            **options: As frações aceitas por `lines`.
+
+        Returns:
+            str: O programa, com uma declaração por linha.
+        """
+        return '\n'.join(self.lines(count, **options))
@@ -0,0 +1,132 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.generator import ProgramGenerator
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+
+# Arquivo padrão das medições de referência
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+def best_rate(function, items, repeat):
+    """
+    Executa a função sobre todos os itens `repeat` vezes e retorna a melhor taxa, em itens por segundo.
+    A saída padrão é descartada, pois algumas etapas exibem resultados ou erros.
+    """
+    best = float('inf')
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in items:
+                function(item)
+            best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+def end_to_end(line):
+    """
+    Passa uma linha por todas as etapas, como em `main.py`. Um erro em qualquer etapa
+    encerra apenas o processamento da linha, como em `Compiler.compile_many`.
+    """
+    try:
+        tokens = Lexer.tokenize(line)
+        syntax_tree = Syntactic.parse(tokens)
+        semantic_tree = Semantic.analyze(syntax_tree)
+        Compiler.run(CodeGenerator.generate(semantic_tree))
+    except Exception:
+        pass
+
+def run_suite(count, repeat, seed):
+    """
+    Executa os microbenchmarks de cada etapa e as medições de ponta a ponta.
+
+    Returns:
+        dict: As taxas medidas, por nome de medição.
+    """
+    generator = ProgramGenerator(seed)
+    lines = generator.lines(count)
+
+    # Entradas de cada etapa, preparadas antes das medições
+    tokens = [Lexer.tokenize(line) for line in lines]
+    syntax_trees = [Syntactic.parse(line_tokens) for line_tokens in tokens]
+    semantic_trees = [Semantic.analyze(tree) for tree in syntax_trees]
+    codes = [CodeGenerator.generate(tree) for tree in semantic_trees]
+    token_count = sum(map(len, tokens))
+
+    results = {
+        'Lexer.scanner': best_rate(Lexer.scanner, lines, repeat),
+        'Syntactic.parse': best_rate(Syntactic.parse, tokens, repeat),
+        'Semantic.analyze': best_rate(Semantic.analyze, syntax_trees, repeat),
+        'CodeGenerator.generate': best_rate(CodeGenerator.generate, semantic_trees, repeat),
+        'Compiler.run': best_rate(Compiler.run, codes, repeat),
+    }
+
+    # De ponta a ponta: programas válidos, e uma carga com programas inválidos e em inglês
+    programs = best_rate(end_to_end, lines, repeat)
+    results['end_to_end.programs'] = programs
+    results['end_to_end.tokens'] = programs * token_count / count
+
+    mixed = generator.lines(count, invalid_ratio=0.2, english_ratio=0.1)
+    results['end_to_end_mixed.programs'] = best_rate(end_to_end, mixed, repeat)
+
+    return results
+
+def compare(results, baseline, tolerance):
+    """
+    Compara as taxas com as de referência.
+
+    Returns:
+        List[str]: As medições que ficaram abaixo da referência além da tolerância.
+    """
+    regressions = []
+    for name, rate in results.items():
+        reference = baseline.get(name)
+        if reference and rate < reference * (1 - tolerance):
+            regressions.append(f"{name}: {rate:.0f}/s (referência {reference:.0f}/s, {rate / reference - 1:+.0%})")
+    return regressions
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Benchmarks de cada etapa e de ponta a ponta.")
+    arguments.add_argument('--count', type=int, default=5000, help="A quantidade de programas gerados.")
+    arguments.add_argument('--repeat', type=int, default=5, help="A quantidade de repetições de cada medição (vale a melhor).")
+    arguments.add_argument('--seed', type=int, default=42, help="A semente do gerador de programas.")
+    arguments.add_argument('--baseline', default=BASELINE, help="O arquivo de referência.")
+    arguments.add_argument('--save', action='store_true', help="Grava as medições como nova referência.")
+    arguments.add_argument('--check', action='store_true', help="Falha se alguma medição ficar abaixo da referência.")
+    arguments.add_argument('--tolerance', type=float, default=0.2, help="A queda tolerada em relação à referência. Padrão é 0.2 (20%%).")
+    options = arguments.parse_args()
+
+    results = run_suite(options.count, options.repeat, options.seed)
+
+    baseline = {}
+    if os.path.exists(options.baseline):
+        with open(options.baseline, 'r') as file:
+            baseline = json.load(file)
+
+    print(f"Programas: {options.count}, repetições: {options.repeat}, semente: {options.seed}")
+    for name, rate in results.items():
+        reference = baseline.get(name)
+        change = f"  ({rate / reference - 1:+.0%} em relação à referência)" if reference else ""
+        unit = 'tokens/s' if name.endswith('.tokens') else 'itens/s'
+        print(f"{name:<28} {rate:12.0f} {unit}{change}")
+
+    if options.save:
+        with open(options.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Referência gravada em {options.baseline}")
+
+    if options.check:
+        if not baseline:
+            print(f"Referência não encontrada: {options.baseline}")
+            sys.exit(2)
+
+        regressions = compare(results, baseline, options.tolerance)
+        for regression in regressions:
+            print(f"Regressão: {regression}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# Endereço padrão do servidor, o mesmo de compilers/compile_server.py. O cliente usa apenas a
+# biblioteca padrão, para não pagar a importação dos analisadores a cada execução.
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'project-compilers-a3.sock')
+
+def request(source: str, run: bool = True, path: str = DEFAULT_SOCKET) -> dict:
+    """
+    Envia um programa ao servidor de compilação e aguarda a resposta.
+
+    Args:
+        source (str): O programa.
+        run (bool, optional): Indica se o programa deve ser executado pelo servidor. Padrão é True.
+        path (str, optional): O caminho do socket Unix do servidor. Padrão é `DEFAULT_SOCKET`.
+
+    Returns:
+        dict: A resposta do servidor, com os campos 'ok', 'code', 'output' e 'error'.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps({'source': source, 'run': run}).encode() + b'\n')
+
+        with connection.makefile('rb') as reader:
+            return json.loads(reader.readline())
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Cliente do servidor de compilação (python -m compilers.compile_server).")
+    arguments.add_argument('file', nargs='?', help="O arquivo com o programa. Padrão é a entrada padrão.")
+    arguments.add_argument('--code', action='store_true', help="Exibe o código gerado em vez de executá-lo.")
+    arguments.add_argument('--socket', default=DEFAULT_SOCKET, help="O caminho do socket Unix do servidor.")
+    options = arguments.parse_args()
+
+    if options.file is None:
+        source = sys.stdin.read()
+    else:
+        with open(options.file, 'r') as file:
+            source = file.read()
+
+    response = request(source, run=not options.code, path=options.socket)
+
+    if not response['ok']:
+        print(f"Erro: {response['error']}", file=sys.stderr)
+        sys.exit(1)
+
+    sys.stdout.write(response['code'] + '\n' if options.code else response['output'])
@@ -0,0 +1,183 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, List, Union
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compiler import Compiler
+from compilers.compilation_result import CompilationResult
+
+# Marca o fim da sequência de programas em cada fila
+_DONE = object()
+
+class AsyncPipeline:
+    """
+    Pipeline assíncrono de compilação para sequências de programas.
+
+    Cada etapa (léxica, sintática, semântica, geração de código e execução) é uma tarefa
+    ligada à seguinte por uma fila limitada: quando uma etapa fica para trás, as anteriores
+    aguardam espaço na fila (contrapressão), e a memória usada não depende do tamanho da
+    entrada. A leitura de arquivos e a execução dos programas rodam em threads, sobrepostas à
+    compilação dos programas seguintes. A ordem dos programas é sempre preservada.
+
+    Um erro em um programa, na compilação ou na execução, é registrado no respectivo resultado
+    e não interrompe os demais.
+    """
+
+    def __init__(self, queue_size: int = 64, execute: bool = True, filename: str = "<string>"):
+        """
+        Inicializa o pipeline.
+
+        Parameters:
+            queue_size (int, optional): A capacidade de cada fila entre as etapas. Padrão é 64.
+            execute (bool, optional): Indica se os programas compilados devem ser executados. Padrão é True.
+            filename (str, optional): O nome do arquivo para fins de exibição de erros. Padrão é "<string>".
+        """
+        self.queue_size = queue_size
+        self.execute = execute
+        self.filename = filename
+        self.parser = Syntactic()
+        self.analyzer = Semantic()
+        self.generator = CodeGenerator()
+
+    @staticmethod
+    def process(sources: Union[Iterable[str], AsyncIterator[str]], **options) -> List[CompilationResult]:
+        """
+        Processa uma sequência de programas em um novo laço de eventos.
+
+        Args:
+            sources (Union[Iterable[str], AsyncIterator[str]]): Os programas.
+            **options: As opções aceitas pelo construtor de `AsyncPipeline`.
+
+        Returns:
+            List[CompilationResult]: Um resultado por programa, na mesma ordem da entrada.
+        """
+        return asyncio.run(AsyncPipeline(**options).run(sources))
+
+    @staticmethod
+    async def read_file(filepath: str) -> AsyncIterator[str]:
+        """
+        Lê os programas de um arquivo, um por linha, sem bloquear o laço de eventos.
+
+        Args:
+            filepath (str): O caminho do arquivo.
+
+        Yields:
+            str: Cada linha não vazia do arquivo.
+        """
+        with open(filepath, 'r') as file:
+            while line := await asyncio.to_thread(file.readline):
+                if line.strip():
+                    yield line.rstrip('\n')
+
+    @staticmethod
+    async def read_stream(reader: asyncio.StreamReader) -> AsyncIterator[str]:
+        """
+        Lê os programas de um stream (por exemplo, um socket), um por linha.
+
+        Args:
+            reader (asyncio.StreamReader): O stream.
+
+        Yields:
+            str: Cada linha não vazia do stream.
+        """
+        while line := await reader.readline():
+            if line.strip():
+                yield line.decode().rstrip('\n')
+
+    async def run(self, sources: Union[Iterable[str], AsyncIterator[str]]) -> List[CompilationResult]:
+        """
+        Processa uma sequência de programas.
+
+        Args:
+            sources (Union[Iterable[str], AsyncIterator[str]]): Os programas.
+
+        Returns:
+            List[CompilationResult]: Um resultado por programa, na mesma ordem da entrada.
+        """
+        stages = [Lexer.tokenize, self.parser.parse_tokens, self.analyzer.analyze_tree, self.generator.generate_code]
+        queues = [asyncio.Queue(self.queue_size) for _ in range(len(stages) + 1)]
+        results = []
+
+        tasks = [asyncio.create_task(self.__read(sources, queues[0]))]
+        tasks += [asyncio.create_task(self.__stage(stage, queues[i], queues[i + 1])) for i, stage in enumerate(stages)]
+        tasks.append(asyncio.create_task(self.__finish(queues[-1], results)))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return results
+
+    @staticmethod
+    async def __read(sources: Union[Iterable[str], AsyncIterator[str]], outbox: asyncio.Queue) -> None:
+        """
+        Coloca os programas da entrada na primeira fila.
+        """
+        if hasattr(sources, '__aiter__'):
+            async for source in sources:
+                await outbox.put((source, source, None))
+        else:
+            for source in sources:
+                await outbox.put((source, source, None))
+
+        await outbox.put(_DONE)
+
+    @staticmethod
+    async def __stage(function, inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+        """
+        Aplica uma etapa a cada programa da fila de entrada, repassando o resultado (ou o erro)
+        para a fila de saída.
+        """
+        while (item := await inbox.get()) is not _DONE:
+            source, value, error = item
+            if error is None:
+                try:
+                    value = function(value)
+                except Exception as e:
+                    error = e
+
+            await outbox.put((source, value, error))
+
+        await outbox.put(_DONE)
+
+    async def __finish(self, inbox: asyncio.Queue, results: List[CompilationResult]) -> None:
+        """
+        Registra o resultado de cada programa e, se solicitado, envia-o para execução em uma
+        única thread, que preserva a ordem dos programas. As etapas anteriores seguem compilando
+        enquanto os programas são executados, e no máximo `queue_size` execuções ficam pendentes.
+        """
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loop = asyncio.get_running_loop()
+
+            while (item := await inbox.get()) is not _DONE:
+                source, code, error = item
+                if error is not None:
+                    results.append(CompilationResult(source, error=error))
+                    continue
+
+                result = CompilationResult(source, code)
+                results.append(result)
+                if self.execute:
+                    if len(pending) >= self.queue_size:
+                        await AsyncPipeline.__wait(*pending.popleft())
+                    pending.append((result, loop.run_in_executor(executor, Compiler.run, code, 'exec', self.filename)))
+
+            for result, execution in pending:
+                await AsyncPipeline.__wait(result, execution)
+
+    @staticmethod
+    async def __wait(result: CompilationResult, execution: asyncio.Future) -> None:
+        """
+        Aguarda a execução de um programa, registrando no seu resultado o erro que ela lançar.
+        """
+        try:
+            await execution
+        except Exception as e:
+            result.error = e
@@ -0,0 +1,485 @@
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+from utils.syntax_tree import ASTNode, NodeVisitor
+from utils.ast_nodes import ForLoopNode, BlockNode, PrintNode, RangeNode
+from analyzers.code_generator import CodeGenerator
+from exceptions.semantic_exception import SemanticException
+
+class ClosureCompiler(NodeVisitor):
+    """
+    Backend alternativo ao `CodeGenerator` seguido de `Compiler.run`: em vez de gerar código
+    Python e passá-lo por `ast.parse`, `compile` e `exec`, transforma o resultado da análise
+    semântica (ou do `Optimizer`) em uma árvore de funções aninhadas (closures), já ligadas
+    às constantes, aos intervalos e às posições das variáveis, que é executada diretamente.
+
+    As variáveis dos loops ficam em uma lista (o quadro de execução), criada a cada execução
+    do programa, e cada uma ocupa uma posição fixa, definida na compilação. A saída é a mesma
+    do código gerado pelo `CodeGenerator`.
+
+    A compilação é mais barata que a do caminho por código-fonte, o que favorece programas de
+    execução curta. Na execução, as declarações 'escreva' seguidas de um corpo formam uma única
+    função, que escreve o texto de todas com uma única chamada de `print`, e um loop cujo corpo
+    apenas escreve constantes e a sua variável monta o texto de vários valores de uma vez. Nos
+    demais loops, cada iteração chama o corpo. A execução é recursiva no aninhamento dos loops,
+    mas a compilação não: os corpos são percorridos pelo `NodeVisitor`, e cada loop ou bloco é
+    compilado ao sair dele, a partir das funções já compiladas dos seus filhos.
+    """
+
+    # Quantidade máxima de valores escritos por uma única chamada de `print`
+    PRINT_CHUNK = 65536
+
+    def __init__(self):
+        """
+        Inicializa o compilador sem variáveis.
+        """
+        self.slots: Dict[str, int] = {}
+
+        # Funções já compiladas cujos loops ou blocos ainda não foram concluídos
+        self.__compiled: List[Callable] = []
+
+    @staticmethod
+    def compile(tree: List[Dict], show_result: bool = False) -> Callable[[], None]:
+        """
+        Compila o resultado da análise semântica em uma função que executa o programa.
+
+        Args:
+            tree (List[Dict]): As entradas da análise semântica ou do `Optimizer`.
+            show_result (bool, optional): Indica se as variáveis do programa devem ser exibidas. Padrão é False.
+
+        Returns:
+            Callable[[], None]: O programa compilado; cada chamada o executa uma vez.
+        """
+        instance = ClosureCompiler()
+        program = instance.compile_tree(tree)
+
+        if show_result:
+            print(repr(instance))
+
+        return program
+
+    @staticmethod
+    def run(tree: List[Dict]) -> None:
+        """
+        Compila e executa o resultado da análise semântica.
+
+        Args:
+            tree (List[Dict]): As entradas da análise semântica ou do `Optimizer`.
+        """
+        ClosureCompiler.compile(tree)()
+
+    def compile_tree(self, tree: List[Dict]) -> Callable[[], None]:
+        """
+        Compila o resultado da análise semântica usando esta instância.
+
+        Args:
+            tree (List[Dict]): As entradas da análise semântica ou do `Optimizer`.
+
+        Returns:
+            Callable[[], None]: O programa compilado.
+        """
+        self.slots = {}
+        self.__compiled = []
+
+        # Verifica se tree é uma lista de dicionários
+        if not isinstance(tree, list) or not all(isinstance(entry, dict) for entry in tree):
+            raise SemanticException("A árvore fornecida para o ClosureCompiler deve ser uma lista de dicionários.")
+
+        statements = tuple(self.__compile_entry(entry) for entry in tree)
+        size = len(self.slots)
+
+        def program():
+            frame = [None] * size
+            for statement in statements:
+                statement(frame)
+
+        return program
+
+    def __compile_entry(self, entry: Dict) -> Callable:
+        """
+        Compila uma entrada da análise semântica ou do `Optimizer`.
+
+        Args:
+            entry (Dict): A entrada.
+
+        Returns:
+            Callable: A função que executa a entrada, dado o quadro de execução.
+        """
+        if 'type' not in entry:
+            raise SemanticException("Cada entrada na lista de dicionários deve ter uma chave 'type' para indicar o tipo.")
+
+        if entry['type'] == 'for_loop':
+            target = ClosureCompiler.__loop_target(entry)
+            self.__slot(target)
+            return self.__compile_loop(target, entry['iterable'], entry['body'], self.__compile_statement(entry['body']))
+        elif entry['type'] == 'write':
+            text = entry['text']
+
+            def write(frame):
+                print(text, end='')
+
+            return write
+        elif entry['type'] == 'unrolled_loop':
+            slot = self.__slot(ClosureCompiler.__loop_target(entry))
+            values = tuple(entry['values'])
+            body = self.__compile_statement(entry['body'])
+
+            def unrolled_loop(frame):
+                for value in values:
+                    frame[slot] = value
+                    body(frame)
+
+            return unrolled_loop
+        else:
+            raise SemanticException(f"Tipo de entrada não suportado: {entry['type']}")
+
+    def __compile_statement(self, statement: ASTNode) -> Callable:
+        """
+        Compila uma declaração do corpo de um loop.
+
+        Args:
+            statement (ASTNode): A declaração (uma escrita, um loop ou um bloco).
+
+        Returns:
+            Callable: A função que executa a declaração, dado o quadro de execução.
+        """
+        self.visit(statement)
+        return self.__compiled.pop()
+
+    def visit_print(self, print_node: PrintNode) -> None:
+        """
+        Compila uma declaração 'escreva' isolada.
+
+        Args:
+            print_node (PrintNode): O nó da declaração.
+        """
+        self.__compiled.append(self.__compile_prints([print_node]))
+
+    def visit_for_loop(self, for_loop_node: ForLoopNode) -> List[ASTNode]:
+        """
+        Reserva a posição da variável de um loop aninhado, que precisa existir antes que o
+        corpo seja compilado.
+
+        Args:
+            for_loop_node (ForLoopNode): O nó do loop.
+
+        Returns:
+            List[ASTNode]: O corpo do loop.
+        """
+        self.__slot(ClosureCompiler.__identifier_target(for_loop_node))
+        return for_loop_node.children[1:]
+
+    def leave_for_loop(self, for_loop_node: ForLoopNode) -> None:
+        """
+        Compila um loop aninhado a partir do seu corpo, já compilado.
+
+        Args:
+            for_loop_node (ForLoopNode): O nó do loop.
+        """
+        iterable, body = for_loop_node.children
+        target = ClosureCompiler.__identifier_target(for_loop_node)
+        self.__compiled.append(self.__compile_loop(target, iterable, body, self.__compiled.pop()))
+
+    def visit_block(self, block_node: BlockNode) -> List[ASTNode]:
+        """
+        Inicia a compilação de um bloco. As declarações 'escreva' do início do bloco são
+        compiladas juntas ao sair dele; como um ';' sempre continua o loop mais interno,
+        depois delas só pode haver um loop, o único filho percorrido.
+
+        Args:
+            block_node (BlockNode): O nó do bloco.
+
+        Returns:
+            List[ASTNode]: As declarações do bloco que seguem as escritas iniciais.
+        """
+        return block_node.children[len(ClosureCompiler.__leading_prints(block_node)):]
+
+    def leave_block(self, block_node: BlockNode) -> None:
+        """
+        Compila um bloco a partir das suas escritas iniciais e das demais declarações, já compiladas.
+
+        Args:
+            block_node (BlockNode): O nó do bloco.
+        """
+        prints = ClosureCompiler.__leading_prints(block_node)
+        start = len(self.__compiled) - (len(block_node.children) - len(prints))
+        statements = ([self.__compile_prints(prints)] if prints else []) + self.__compiled[start:]
+        self.__compiled[start:] = [ClosureCompiler.__compile_block(tuple(statements))]
+
+    def generic_visit(self, node: ASTNode) -> None:
+        """
+        Rejeita um nó que não pode ocupar a posição de uma declaração.
+
+        Args:
+            node (ASTNode): O nó encontrado.
+        """
+        raise SemanticException(f"Tipo de declaração não suportado: {node}")
+
+    def __compile_loop(self, target: str, iterable: ASTNode, body_node: ASTNode, body: Callable) -> Callable:
+        """
+        Compila um loop. Um loop cujo corpo apenas escreve constantes e a sua variável monta o
+        texto de vários valores de uma vez, com uma chamada de `print` por bloco de valores, sem
+        uma chamada de função por iteração.
+
+        Args:
+            target (str): O nome da variável do loop.
+            iterable (ASTNode): O iterável do loop.
+            body_node (ASTNode): O corpo do loop.
+            body (Callable): O corpo do loop, já compilado.
+
+        Returns:
+            Callable: A função que executa o loop, dado o quadro de execução.
+        """
+        slot = self.__slot(target)
+        constant, values = self.__compile_expression(iterable)
+
+        prints = self.__print_body(body_node)
+        if prints is not None:
+            form, arguments = self.__print_format(prints)
+            if all(argument == slot for argument in arguments):
+                return self.__compile_print_loop(constant, values, form, len(arguments))
+
+        if constant:
+            def loop(frame):
+                for frame[slot] in values:
+                    body(frame)
+        else:
+            def loop(frame):
+                for frame[slot] in values(frame):
+                    body(frame)
+
+        return loop
+
+    def __compile_print_loop(self, constant: bool, values, form: str, count: int) -> Callable:
+        """
+        Compila um loop cujo corpo apenas escreve constantes e a variável do loop. O texto de
+        cada bloco de `PRINT_CHUNK` valores é montado de uma vez e escrito por um único `print`.
+        Nenhuma declaração lê a variável depois do loop (um ';' sempre continua o loop mais
+        interno), e por isso ela não precisa ser guardada no quadro.
+
+        Args:
+            constant (bool): Indica se o iterável é constante.
+            values: O iterável, ou a função que o calcula a partir do quadro de execução.
+            form (str): O formato do texto de uma iteração.
+            count (int): Quantas vezes a variável aparece no formato.
+
+        Returns:
+            Callable: A função que executa o loop, dado o quadro de execução.
+        """
+        chunk = self.PRINT_CHUNK
+
+        if count == 0:
+            text = form % ()
+
+            def render(items):
+                return text * len(items)
+        elif count == 1:
+            render_value = form.__mod__
+
+            def render(items):
+                return ''.join(map(render_value, items))
+        else:
+            def render(items):
+                return ''.join([form % ((value,) * count) for value in items])
+
+        def print_loop(frame):
+            items = values if constant else values(frame)
+            for start in range(0, len(items), chunk):
+                print(render(items[start:start + chunk]), end='')
+
+        return print_loop
+
+    @staticmethod
+    def __compile_block(statements: tuple) -> Callable:
+        """
+        Compila um bloco de declarações, executadas em sequência. Um bloco tem no máximo um
+        grupo de declarações 'escreva' seguido de um loop, que são chamados diretamente.
+        """
+        if len(statements) == 1:
+            return statements[0]
+
+        if len(statements) == 2:
+            first, second = statements
+
+            def pair(frame):
+                first(frame)
+                second(frame)
+
+            return pair
+
+        def block(frame):
+            for statement in statements:
+                statement(frame)
+
+        return block
+
+    def __compile_prints(self, print_nodes: List[PrintNode]) -> Callable:
+        """
+        Compila uma sequência de declarações 'escreva', executadas por uma única chamada de
+        `print` com o texto de todas elas. As expressões constantes são convertidas em texto na
+        compilação.
+
+        Args:
+            print_nodes (List[PrintNode]): Os nós das declarações.
+
+        Returns:
+            Callable: A função que executa as declarações, dado o quadro de execução.
+        """
+        form, arguments = self.__print_format(print_nodes)
+
+        if not arguments:
+            text = form % ()
+
+            def print_constant(frame):
+                print(text, end='')
+
+            return print_constant
+
+        if all(isinstance(argument, int) for argument in arguments):
+            if len(arguments) == 1:
+                slot = arguments[0]
+
+                def print_variable(frame):
+                    print(form % (frame[slot],), end='')
+
+                return print_variable
+
+            variables = itemgetter(*arguments)
+
+            def print_variables(frame):
+                print(form % variables(frame), end='')
+
+            return print_variables
+
+        getters = tuple(itemgetter(argument) if isinstance(argument, int) else argument for argument in arguments)
+
+        def print_values(frame):
+            print(form % tuple([getter(frame) for getter in getters]), end='')
+
+        return print_values
+
+    def __print_format(self, print_nodes: List[PrintNode]) -> Tuple[str, list]:
+        """
+        Monta o formato do texto escrito por uma sequência de declarações 'escreva': as
+        constantes entram no próprio formato, e cada expressão não constante é um '%s'.
+
+        Args:
+            print_nodes (List[PrintNode]): Os nós das declarações.
+
+        Returns:
+            Tuple[str, list]: O formato e as expressões não constantes, na ordem do formato:
+                a posição da variável no quadro de execução ou a função que calcula o valor.
+        """
+        parts = []
+        arguments = []
+
+        for print_node in print_nodes:
+            expression = print_node.children[0]
+            constant, value = self.__compile_expression(expression)
+
+            if constant:
+                parts.append(str(value).replace('%', '%%'))
+            else:
+                parts.append('%s')
+                if expression.node_type == 'IDENTIFIER':
+                    arguments.append(self.slots[ClosureCompiler.__identifier_target(expression)])
+                else:
+                    arguments.append(value)
+            parts.append('\n')
+
+        return ''.join(parts), arguments
+
+    def __compile_expression(self, expression_node: ASTNode) -> tuple:
+        """
+        Compila uma expressão: um literal, um identificador ou um intervalo.
+
+        Args:
+            expression_node (ASTNode): O nó da expressão.
+
+        Returns:
+            tuple: (True, valor) se a expressão for constante, ou (False, função que calcula o
+                valor a partir do quadro de execução).
+        """
+        # O início implícito de 'intervalo(n)' é um ASTNode genérico, por isso a verificação usa node_type
+        node_type = getattr(expression_node, 'node_type', None)
+
+        if node_type == 'IDENTIFIER':
+            name = ClosureCompiler.__identifier_target(expression_node)
+            if name not in self.slots:
+                raise SemanticException(f"Variável '{expression_node.value}' não declarada.")
+            slot = self.slots[name]
+            return False, lambda frame: frame[slot]
+        elif node_type == 'INTEGER':
+            return True, int(expression_node.value)
+        elif node_type == 'STRING':
+            return True, CodeGenerator.string_value(expression_node)
+        elif isinstance(expression_node, RangeNode):
+            arguments = [self.__compile_expression(child) for child in expression_node.children]
+            if all(constant for constant, _ in arguments):
+                return True, range(*(value for _, value in arguments))
+
+            (start_constant, start), (end_constant, end) = arguments
+            if start_constant:
+                return False, lambda frame: range(start, end(frame))
+            if end_constant:
+                return False, lambda frame: range(start(frame), end)
+            return False, lambda frame: range(start(frame), end(frame))
+        else:
+            raise SemanticException(f"Tipo de expressão não suportado: {type(expression_node).__name__}")
+
+    @staticmethod
+    def __leading_prints(block: BlockNode) -> List[PrintNode]:
+        """
+        Retorna as declarações 'escreva' do início de um bloco.
+        """
+        count = 0
+        while count < len(block.children) and isinstance(block.children[count], PrintNode):
+            count += 1
+        return block.children[:count]
+
+    @staticmethod
+    def __print_body(body: ASTNode) -> Optional[List[PrintNode]]:
+        """
+        Retorna as declarações do corpo de um loop, se todas forem 'escreva', ou None.
+        """
+        if isinstance(body, PrintNode):
+            return [body]
+        if isinstance(body, BlockNode) and all(isinstance(child, PrintNode) for child in body.children):
+            return body.children
+        return None
+
+    def __slot(self, name: str) -> int:
+        """
+        Retorna a posição da variável no quadro de execução, reservando-a no primeiro uso.
+        Os loops com o mesmo nome compartilham a posição, como as variáveis do código gerado.
+        """
+        return self.slots.setdefault(name, len(self.slots))
+
+    @staticmethod
+    def __identifier_target(node: ASTNode) -> str:
+        """
+        Retorna o nome de um identificador ou da variável de um `ForLoopNode`, reaproveitando o
+        símbolo resolvido pela análise semântica (ou o próprio nome, se o nó não foi analisado).
+        """
+        binding = getattr(node, 'binding', None)
+        return node.value if binding is None else binding.target
+
+    @staticmethod
+    def __loop_target(entry: Dict) -> str:
+        """
+        Retorna o nome da variável de um loop, reaproveitando o símbolo declarado pela análise
+        semântica (ou o próprio nome, se a entrada não o possuir).
+        """
+        binding = entry.get('binding')
+        return entry['variable'] if binding is None else binding.target
+
+    def __repr__(self) -> str:
+        """
+        Retorna uma representação em string da compilação.
+
+        Returns:
+            str: As variáveis do programa e as suas posições no quadro de execução.
+        """
+        parts = ["Compilação em closures:\n"]
+        for name, slot in self.slots.items():
+            parts.append(f"Variável: {name}, Posição: {slot}\n")
+        return ''.join(parts)
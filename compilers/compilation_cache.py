@@ -0,0 +1,151 @@
+import hashlib
+import marshal
+import os
+import sys
+from collections import OrderedDict
+from types import CodeType
+from typing import Optional, Tuple
+
+class CompilationCache:
+    """
+    Cache de compilações endereçado pelo conteúdo da expressão de origem.
+
+    Guarda o código Python gerado e o código compilado de cada expressão em um cache em
+    memória com descarte LRU e, opcionalmente, em um diretório no disco, serializados com
+    `marshal` (como o `__pycache__`). Uma expressão repetida dispensa todas as etapas.
+
+    Attributes:
+        version (str): A versão do compilador, que faz parte da chave de cada entrada.
+        maxsize (int): A quantidade máxima de entradas mantidas em memória.
+        directory (str): O diretório do cache em disco, ou None se desativado.
+        hits (int): A quantidade de consultas atendidas pelo cache.
+        misses (int): A quantidade de consultas não atendidas pelo cache.
+    """
+
+    def __init__(self, maxsize: int = 4096, directory: Optional[str] = None, version: Optional[str] = None):
+        """
+        Inicializa o cache.
+
+        Parameters:
+            maxsize (int, optional): A quantidade máxima de entradas em memória. Padrão é 4096.
+            directory (str, optional): O diretório do cache em disco. Padrão é None (desativado).
+            version (str, optional): A versão do compilador. Padrão é `Compiler.VERSION`.
+        """
+        if version is None:
+            # Importado aqui para evitar a importação circular com compilers.compiler
+            from compilers.compiler import Compiler
+            version = Compiler.VERSION
+
+        self.version = version
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict = OrderedDict()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, source: str, filename: str = "<string>") -> str:
+        """
+        Calcula a chave de uma expressão. A chave inclui a versão do compilador e a versão
+        do interpretador, de modo que entradas antigas são ignoradas após uma atualização.
+
+        Parameters:
+            source (str): A expressão de origem.
+            filename (str, optional): O nome do arquivo registrado no código compilado.
+
+        Returns:
+            str: A chave, em hexadecimal.
+        """
+        content = '\0'.join((self.version, sys.implementation.cache_tag, filename, source))
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, source: str, filename: str = "<string>") -> Optional[Tuple[str, CodeType]]:
+        """
+        Consulta o cache, primeiro em memória e depois no disco.
+
+        Parameters:
+            source (str): A expressão de origem.
+            filename (str, optional): O nome do arquivo registrado no código compilado.
+
+        Returns:
+            Optional[Tuple[str, CodeType]]: O código gerado e o código compilado, ou None se ausente.
+        """
+        key = self.key(source, filename)
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            self.__entries.move_to_end(key)
+        elif self.directory is not None:
+            entry = self.__load(key)
+            if entry is not None:
+                self.__store(key, entry)
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return entry
+
+    def put(self, source: str, code: str, code_object: CodeType, filename: str = "<string>") -> None:
+        """
+        Armazena o resultado da compilação de uma expressão.
+
+        Parameters:
+            source (str): A expressão de origem.
+            code (str): O código Python gerado.
+            code_object (CodeType): O código compilado.
+            filename (str, optional): O nome do arquivo registrado no código compilado.
+        """
+        key = self.key(source, filename)
+        entry = (code, code_object)
+        self.__store(key, entry)
+
+        if self.directory is not None:
+            self.__save(key, entry)
+
+    def clear(self) -> None:
+        """
+        Remove todas as entradas em memória. O cache em disco é mantido.
+        """
+        self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __store(self, key: str, entry: Tuple[str, CodeType]) -> None:
+        """
+        Armazena uma entrada em memória, descartando a menos usada se o limite for excedido.
+        """
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+
+        if len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def __load(self, key: str) -> Optional[Tuple[str, CodeType]]:
+        """
+        Lê uma entrada do disco. Arquivos ausentes ou corrompidos são tratados como ausência.
+        """
+        try:
+            with open(self.__path(key), 'rb') as file:
+                return marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def __save(self, key: str, entry: Tuple[str, CodeType]) -> None:
+        """
+        Grava uma entrada no disco. A escrita é feita em um arquivo temporário e depois
+        renomeada, para que leitores concorrentes nunca vejam um arquivo incompleto.
+        """
+        path = self.__path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary, 'wb') as file:
+            marshal.dump(entry, file)
+        os.replace(temporary, path)
@@ -0,0 +1,42 @@
+from types import CodeType
+from typing import Optional
+
+class CompilationResult:
+    """
+    Representa o resultado da compilação de uma única expressão.
+
+    Attributes:
+        source (str): A expressão de origem.
+        code (str): O código Python gerado, ou None se houve erro.
+        code_object (CodeType): O código compilado, pronto para `exec`, ou None se houve erro.
+        error (Exception): O erro ocorrido em alguma das etapas, ou None em caso de sucesso.
+    """
+
+    __slots__ = ('source', 'code', 'code_object', 'error')
+
+    def __init__(self, source: str, code: Optional[str] = None, code_object: Optional[CodeType] = None, error: Optional[Exception] = None):
+        """
+        Inicializa um resultado de compilação.
+
+        Parameters:
+            source (str): A expressão de origem.
+            code (str, optional): O código Python gerado.
+            code_object (CodeType, optional): O código compilado.
+            error (Exception, optional): O erro ocorrido.
+        """
+        self.source = source
+        self.code = code
+        self.code_object = code_object
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Indica se a expressão foi compilada com sucesso.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"CompilationResult(source={self.source!r}, code={self.code!r})"
+        return f"CompilationResult(source={self.source!r}, error={self.error!r})"
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import signal
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import CodeType
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compilation_result import CompilationResult
+from compilers.compilation_cache import CompilationCache
+
+# Endereço padrão do servidor; deve ser o mesmo usado por client.py
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'project-compilers-a3.sock')
+
+class CompileServer:
+    """
+    Servidor de compilação de longa duração, acessado por um socket Unix.
+
+    O interpretador, os módulos dos analisadores e a expressão regular do lexer são
+    carregados uma única vez, e as instâncias de `Syntactic`, `Semantic` e `CodeGenerator`
+    são reaproveitadas entre as requisições, assim como um `CompilationCache` em memória.
+
+    O protocolo é de uma requisição JSON por linha, respondida também com uma linha JSON.
+    Uma mesma conexão pode enviar várias requisições, de até `LINE_LIMIT` bytes cada; uma
+    requisição maior é respondida com um erro e encerra a conexão. Cada requisição tem os campos:
+        - source (str): O programa.
+        - run (bool, opcional): Se True, o programa também é executado e a sua saída é devolvida.
+
+    E cada resposta tem os campos:
+        - ok (bool): Indica se o programa foi compilado (e executado) com sucesso.
+        - code (str): O código Python gerado.
+        - output (str): A saída da execução, se solicitada.
+        - error (str): A mensagem de erro, se houver.
+
+    A compilação ocorre no próprio laço de eventos, e a execução em um conjunto de threads,
+    para que um programa demorado não impeça o atendimento das demais conexões. A saída de
+    cada execução é capturada separadamente, sem redirecionar a saída padrão do processo. Um
+    programa em execução não pode ser interrompido, e ocupa uma das threads até terminar.
+    """
+
+    # Tamanho máximo de uma linha de requisição, em bytes
+    LINE_LIMIT = 16 * 1024 * 1024
+
+    def __init__(self, path: str = DEFAULT_SOCKET, cache: CompilationCache = None, workers: int = 4):
+        """
+        Inicializa o servidor.
+
+        Parameters:
+            path (str, optional): O caminho do socket Unix. Padrão é `DEFAULT_SOCKET`.
+            cache (CompilationCache, optional): O cache de compilações. Padrão é um cache em memória.
+            workers (int, optional): A quantidade de threads que executam os programas. Padrão é 4.
+        """
+        self.path = path
+        self.cache = cache if cache is not None else CompilationCache()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.parser = Syntactic()
+        self.analyzer = Semantic()
+        self.generator = CodeGenerator()
+        self.requests = 0
+
+        # Compila a expressão regular do lexer antes da primeira requisição
+        Lexer.get_regex()
+
+    @staticmethod
+    def start(path: str = DEFAULT_SOCKET) -> None:
+        """
+        Cria um servidor e atende as requisições até que o processo seja interrompido.
+
+        Args:
+            path (str, optional): O caminho do socket Unix. Padrão é `DEFAULT_SOCKET`.
+        """
+        server = CompileServer(path)
+        try:
+            asyncio.run(server.serve())
+        except KeyboardInterrupt:
+            pass
+        except FileExistsError as e:
+            raise SystemExit(f"Erro: {e}")
+
+    async def serve(self) -> None:
+        """
+        Abre o socket e atende as conexões até que a tarefa seja cancelada ou que o processo
+        receba SIGTERM. Em ambos os casos o socket é removido ao final.
+
+        Raises:
+            FileExistsError: Se o caminho já pertence a um servidor ativo ou não é um socket.
+        """
+        # Apenas um socket deixado por uma execução anterior, sem servidor, pode ser removido
+        if os.path.lexists(self.path):
+            if not stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                raise FileExistsError(f"O caminho {self.path} já existe e não é um socket")
+            if await self.__is_alive():
+                raise FileExistsError(f"Já existe um servidor ativo em {self.path}")
+            os.unlink(self.path)
+
+        server = await asyncio.start_unix_server(self.__handle_connection, path=self.path, limit=self.LINE_LIMIT)
+
+        # Sem um tratador, o SIGTERM encerraria o processo sem passar pelo bloco finally
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, stopped.set)
+        try:
+            async with server:
+                await stopped.wait()
+        finally:
+            loop.remove_signal_handler(signal.SIGTERM)
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __is_alive(self) -> bool:
+        """
+        Indica se algum servidor aceita conexões no socket.
+        """
+        try:
+            _, writer = await asyncio.open_unix_connection(self.path)
+        except OSError:
+            return False
+
+        writer.close()
+        return True
+
+    def compile(self, source: str) -> CompilationResult:
+        """
+        Compila um programa, consultando primeiro o cache.
+
+        Args:
+            source (str): O programa.
+
+        Returns:
+            CompilationResult: O resultado da compilação.
+        """
+        entry = self.cache.get(source)
+        if entry is not None:
+            return CompilationResult(source, *entry)
+
+        try:
+            tokens = Lexer.tokenize(source)
+            syntax_tree = self.parser.parse_tokens(tokens)
+            semantic_tree = self.analyzer.analyze_tree(syntax_tree)
+            code = self.generator.generate_code(semantic_tree)
+            code_object = compile(code, "<string>", 'exec')
+        except Exception as e:
+            return CompilationResult(source, error=e)
+
+        self.cache.put(source, code, code_object)
+        return CompilationResult(source, code, code_object)
+
+    async def handle_request(self, request: dict) -> dict:
+        """
+        Atende uma requisição já decodificada. A execução, se solicitada, ocorre no
+        conjunto de threads do servidor.
+
+        Args:
+            request (dict): A requisição.
+
+        Returns:
+            dict: A resposta.
+        """
+        self.requests += 1
+        source = request.get('source') if isinstance(request, dict) else None
+        if not isinstance(source, str):
+            return {'ok': False, 'error': "Requisição sem o campo 'source'"}
+
+        result = self.compile(source)
+        if not result.ok:
+            return {'ok': False, 'error': str(result.error)}
+
+        response = {'ok': True, 'code': result.code}
+        if request.get('run'):
+            try:
+                loop = asyncio.get_running_loop()
+                response['output'] = await loop.run_in_executor(self.executor, self.__execute, result.code_object)
+            except Exception as e:
+                response.update(ok=False, error=f"{type(e).__name__}: {e}")
+
+        return response
+
+    @staticmethod
+    def __execute(code_object: CodeType) -> str:
+        """
+        Executa um código compilado e retorna a sua saída. O código gerado escreve apenas com
+        `print`, que é substituído, no namespace da execução, por uma versão ligada a um buffer
+        próprio; assim várias execuções simultâneas não misturam as suas saídas.
+        """
+        output = io.StringIO()
+        exec(code_object, {'__name__': '__main__', 'print': partial(print, file=output)})
+        return output.getvalue()
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atende as requisições de uma conexão até que o cliente a encerre.
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # O restante da linha continua no stream, e por isso a conexão é encerrada
+                    error = {'ok': False, 'error': f"Requisição maior que o limite de {self.LINE_LIMIT} bytes"}
+                    writer.write(json.dumps(error).encode() + b'\n')
+                    await writer.drain()
+                    break
+
+                if not line:
+                    break
+
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"Requisição inválida: {e}"}
+
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(description="Servidor de compilação por socket Unix.")
+    arguments.add_argument('--socket', default=DEFAULT_SOCKET, help="O caminho do socket Unix.")
+    CompileServer.start(arguments.parse_args().socket)
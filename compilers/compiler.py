@@ -1,13 +1,25 @@
 import ast
+from typing import Iterable, List, Optional
+from analyzers.lexer import Lexer
+from analyzers.syntactic import Syntactic
+from analyzers.semantic import Semantic
+from analyzers.code_generator import CodeGenerator
+from compilers.compilation_result import CompilationResult
+from compilers.compilation_cache import CompilationCache
 
 class Compiler:
+    # Versão do compilador; faz parte da chave do CompilationCache e deve ser alterada
+    # sempre que o código gerado para uma mesma expressão mudar
+    VERSION = '1.1'
+
     @staticmethod
     def run(code, mode='exec', filename="<string>"):
         """
         Executa o código fornecido após compilá-lo usando o módulo ast.
 
         Args:
-            code (str): O código-fonte a ser compilado e executado.
+            code (Union[str, ast.AST]): O código-fonte a ser compilado e executado, ou uma árvore
+                já construída (por exemplo, por `CodeGenerator.generate_ast`), que é compilada sem nova análise.
             mode (str, optional): O modo de compilação ('exec', 'eval' ou 'single'). Padrão é 'exec'.
             filename (str, optional): O nome do arquivo para fins de exibição de erros. Padrão é "<string>".
 
@@ -15,7 +27,65 @@ class Compiler:
             SyntaxError: Se houver um erro de sintaxe no código.
         """
         try:
-            compiled_code = compile(source=ast.parse(code, mode=mode), filename=filename, mode=mode)
-            exec(compiled_code)
+            tree = code if isinstance(code, ast.AST) else ast.parse(code, mode=mode)
+            compiled_code = compile(source=tree, filename=filename, mode=mode)
+            # Um namespace próprio, para que as funções auxiliares definidas pelo código gerado
+            # (modo com buffer e backend 'numpy') enxerguem os nomes globais desse código
+            exec(compiled_code, {'__name__': '__main__'})
         except SyntaxError as e:
             print(f"Erro de sintaxe: {e}")
+
+    @staticmethod
+    def compile_many(lines: Iterable[str], filename="<string>", cache: Optional[CompilationCache] = None) -> List[CompilationResult]:
+        """
+        Compila um lote de expressões independentes, passando cada uma por todas as etapas
+        (léxica, sintática, semântica, geração de código e compilação).
+
+        As instâncias dos analisadores e a expressão regular do lexer são criadas uma única vez
+        e reaproveitadas em todo o lote, e as expressões repetidas no lote são compiladas uma
+        única vez: os seus resultados compartilham o mesmo código compilado (ou o mesmo erro).
+        Um erro em uma expressão é registrado no respectivo resultado e não interrompe as demais.
+
+        Sem repetições, não há ganho mensurável em relação a compilar as expressões uma a uma:
+        o custo está nas próprias etapas, e não na criação dos analisadores.
+
+        Se um cache for fornecido, as expressões já compiladas anteriormente são obtidas
+        dele sem passar por nenhuma etapa, e as novas compilações bem-sucedidas são armazenadas.
+
+        Args:
+            lines (Iterable[str]): As expressões a serem compiladas.
+            filename (str, optional): O nome do arquivo para fins de exibição de erros. Padrão é "<string>".
+            cache (CompilationCache, optional): O cache de compilações. Padrão é None.
+
+        Returns:
+            List[CompilationResult]: Um resultado por expressão, na mesma ordem da entrada.
+        """
+        tokenize = Lexer.tokenize
+        parse = Syntactic().parse_tokens
+        analyze = Semantic().analyze_tree
+        generate = CodeGenerator().generate_code
+        results = []
+
+        # Resultado de cada expressão já vista no lote: (código, código compilado, erro)
+        compiled = {}
+
+        for line in lines:
+            entry = compiled.get(line)
+            if entry is None and cache is not None:
+                cached = cache.get(line, filename)
+                if cached is not None:
+                    entry = compiled[line] = (*cached, None)
+
+            if entry is None:
+                try:
+                    code = generate(analyze(parse(tokenize(line))))
+                    entry = (code, compile(code, filename, 'exec'), None)
+                    if cache is not None:
+                        cache.put(line, entry[0], entry[1], filename)
+                except Exception as e:
+                    entry = (None, None, e)
+                compiled[line] = entry
+
+            results.append(CompilationResult(line, *entry))
+
+        return results
@@ -0,0 +1,60 @@
+import marshal
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+from compilers.compiler import Compiler
+from compilers.compilation_result import CompilationResult
+
+class ParallelCompiler:
+    """
+    Classe responsável por compilar lotes de expressões independentes em vários processos.
+    """
+
+    @staticmethod
+    def compile_many(lines: Sequence[str], workers: Optional[int] = None, chunk_size: int = 1000, filename="<string>") -> List[CompilationResult]:
+        """
+        Compila as expressões distribuindo blocos de linhas entre os processos de um
+        `ProcessPoolExecutor`. Cada processo usa `Compiler.compile_many` no seu bloco.
+
+        Os códigos compilados retornam serializados com `marshal`, que é mais compacto e
+        rápido que `pickle` e suporta objetos de código. A ordem dos resultados é sempre
+        a mesma da entrada, independentemente da quantidade de processos.
+
+        Args:
+            lines (Sequence[str]): As expressões a serem compiladas.
+            workers (int, optional): A quantidade de processos. Padrão é a quantidade de núcleos.
+            chunk_size (int, optional): A quantidade de linhas enviadas a cada processo por vez. Padrão é 1000.
+            filename (str, optional): O nome do arquivo para fins de exibição de erros. Padrão é "<string>".
+
+        Returns:
+            List[CompilationResult]: Um resultado por expressão, na mesma ordem da entrada.
+        """
+        chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        results = []
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # executor.map devolve os blocos na ordem de envio
+            for chunk, compiled_chunk in zip(chunks, executor.map(_compile_chunk, chunks, [filename] * len(chunks))):
+                for line, (code, code_object, error) in zip(chunk, compiled_chunk):
+                    if error is None:
+                        results.append(CompilationResult(line, code, marshal.loads(code_object)))
+                    else:
+                        results.append(CompilationResult(line, error=error))
+
+        return results
+
+def _compile_chunk(lines: Sequence[str], filename: str) -> List[Tuple[Optional[str], Optional[bytes], Optional[Exception]]]:
+    """
+    Compila um bloco de linhas em um processo auxiliar e retorna os resultados em forma compacta.
+
+    Args:
+        lines (Sequence[str]): As expressões do bloco.
+        filename (str): O nome do arquivo para fins de exibição de erros.
+
+    Returns:
+        List[Tuple[Optional[str], Optional[bytes], Optional[Exception]]]: Para cada linha, o código
+        gerado, o código compilado serializado com `marshal` e o erro ocorrido.
+    """
+    return [
+        (result.code, marshal.dumps(result.code_object), None) if result.ok else (None, None, result.error)
+        for result in Compiler.compile_many(lines, filename)
+    ]
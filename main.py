@@ -1,25 +1,76 @@
+import argparse
 from analyzers.lexer import Lexer
 from analyzers.syntactic import Syntactic
 from analyzers.semantic import Semantic
+from analyzers.optimizer import Optimizer
 from analyzers.code_generator import CodeGenerator
 from compilers.compiler import Compiler
 from utils.file_manager import FileManager
+from utils.profiler import Profiler
+
+def line_number(value: str) -> int:
+    """
+    Converte o argumento de --linha, que deve ser um inteiro a partir de 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"a linha deve ser maior ou igual a 1: {value}")
+    return number
 
 if __name__ == "__main__":
-    # Carregar o código-fonte de um arquivo
-    text = FileManager.process('expressions.txt').split('\n')
+    arguments = argparse.ArgumentParser()
+    arguments.add_argument('arquivo', nargs='?', default='expressions.txt', help="O arquivo com o programa. Padrão é expressions.txt.")
+    arguments.add_argument('--linha', type=line_number, metavar='N', help="Compila apenas a N-ésima linha (a partir de 1) em vez do arquivo inteiro.")
+    arguments.add_argument('--profile', nargs='?', const='', metavar='ARQUIVO',
+                           help="Mede cada etapa e exibe o resultado, ou grava-o no arquivo (JSON, ou pilhas agregadas se terminar em .folded).")
+    options = arguments.parse_args()
+
+    # Com o perfil desativado, cada etapa é chamada diretamente
+    profiler = Profiler(enabled=options.profile is not None)
+
+    # Carregar o código-fonte de um arquivo; todas as linhas formam um único programa
+    text = FileManager.process(options.arquivo)
+    if options.linha is not None:
+        lines = text.splitlines()
+        if options.linha > len(lines):
+            arguments.error(f"a linha {options.linha} não existe: {options.arquivo} tem {len(lines)} linhas")
+        text = lines[options.linha - 1]
 
     # Análise léxica
-    tokens = Lexer.scanner(text[2], show_result=True)
+    tokens, lexical_errors = profiler.run('Léxico', Lexer.scan_with_diagnostics, text, show_result=True)
+
+    # As declarações de uma linha com erro léxico são descartadas, como as demais com erro
+    if lexical_errors:
+        error_lines = {diagnostic.line for diagnostic in lexical_errors}
+        tokens = [token for token in tokens if token.line not in error_lines]
+
+    # Análise sintática; as declarações com erro são descartadas e as demais seguem adiante
+    syntax_tree, syntax_errors = profiler.run('Sintático', Syntactic.parse_with_recovery, tokens, show_result=True)
+
+    for diagnostic in lexical_errors + syntax_errors:
+        print(diagnostic)
+
+    # Análise semântica; as declarações com erro também são descartadas
+    semantic_tree, semantic_errors = profiler.run('Semântico', Semantic.analyze_with_diagnostics, syntax_tree, show_result=True)
+
+    for diagnostic in semantic_errors:
+        print(diagnostic)
+
+    # Otimização
+    optimized_tree = profiler.run('Otimização', Optimizer.optimize, semantic_tree, show_result=True)
 
-    # Análise sintática
-    syntax_tree = Syntactic.parse(tokens, show_result=True)
+    # Geração de código: um único módulo para todo o programa, sem as declarações com erro
+    generated_code, generation_errors = profiler.run('Geração de código', CodeGenerator.generate_with_diagnostics, optimized_tree, show_result=True)
 
-    # Análise semântica
-    semantic_tree = Semantic.analyze(syntax_tree, show_result=True)
+    for diagnostic in generation_errors:
+        print(diagnostic)
 
-    # Geração de código
-    generated_code = CodeGenerator.generate(semantic_tree, show_result=True)
+    # Compilação e execução, uma única vez por arquivo
+    profiler.run('Execução', Compiler.run, generated_code, filename=options.arquivo)
 
-    # Compilação e execução
-    Compiler.run(generated_code)
+    if profiler.enabled:
+        profiler.stop()
+        if options.profile:
+            profiler.save(options.profile)
+        else:
+            print(repr(profiler))
@@ -0,0 +1,185 @@
+from array import array
+from typing import Iterator, List, Optional, Tuple
+from utils.node_kind import NodeKind
+from utils.syntax_tree import ASTNode
+from utils.ast_nodes import ForLoopNode, PrintNode, RangeNode, IdentifierNode, IntegerNode, StringNode, BlockNode
+
+class ASTArena:
+    """
+    Representa uma árvore sintática abstrata (AST) de forma plana, em vetores paralelos,
+    em vez de um objeto por nó. Cada nó é identificado pela sua posição nos vetores; a raiz
+    ocupa a posição 0 e os nós são armazenados em pré-ordem.
+
+    Attributes:
+        kinds (array): O tipo (valor de `NodeKind`) de cada nó.
+        values (List[str]): O valor de cada nó (None quando o nó não possui valor).
+        first_child (array): A posição do primeiro filho de cada nó, ou -1 se não houver.
+        next_sibling (array): A posição do próximo irmão de cada nó, ou -1 se não houver.
+    """
+
+    __slots__ = ('kinds', 'values', 'first_child', 'next_sibling')
+
+    NONE = -1
+
+    # Classe usada para reconstruir cada tipo de nó em to_tree
+    _node_classes = {
+        NodeKind.FOR_LOOP: ForLoopNode,
+        NodeKind.PRINT: PrintNode,
+        NodeKind.RANGE: RangeNode,
+        NodeKind.IDENTIFIER: IdentifierNode,
+        NodeKind.INTEGER: IntegerNode,
+        NodeKind.STRING: StringNode,
+        NodeKind.BLOCK: BlockNode,
+    }
+
+    def __init__(self):
+        """
+        Inicializa uma arena vazia.
+        """
+        self.kinds = array('B')
+        self.values: List[Optional[str]] = []
+        self.first_child = array('q')
+        self.next_sibling = array('q')
+
+    @staticmethod
+    def from_tree(root: ASTNode) -> 'ASTArena':
+        """
+        Constrói uma arena a partir de uma árvore de objetos ASTNode. A construção usa uma
+        pilha explícita, portanto não depende da profundidade da árvore.
+
+        Parameters:
+            root (ASTNode): A raiz da árvore.
+
+        Returns:
+            ASTArena: A arena equivalente.
+
+        Raises:
+            TypeError: Se algum filho não for um ASTNode ou se o tipo do nó não estiver em `NodeKind`.
+        """
+        arena = ASTArena()
+        # Último filho inserido de cada nó, usado para ligar o próximo filho ao irmão anterior
+        last_child: List[int] = []
+        stack: List[Tuple[ASTNode, int]] = [(root, ASTArena.NONE)]
+
+        while stack:
+            node, parent = stack.pop()
+
+            if not isinstance(node, ASTNode) or node.kind is None:
+                raise TypeError(f"Nó não suportado pela ASTArena: {node!r}")
+
+            index = arena.add(node.kind, node.value)
+            last_child.append(ASTArena.NONE)
+
+            if parent != ASTArena.NONE:
+                if last_child[parent] == ASTArena.NONE:
+                    arena.first_child[parent] = index
+                else:
+                    arena.next_sibling[last_child[parent]] = index
+                last_child[parent] = index
+
+            # Os filhos são empilhados em ordem inversa para serem inseridos em pré-ordem
+            for child in reversed(node.children):
+                stack.append((child, index))
+
+        return arena
+
+    def add(self, kind: NodeKind, value: Optional[str] = None) -> int:
+        """
+        Adiciona um nó sem filhos à arena.
+
+        Parameters:
+            kind (NodeKind): O tipo do nó.
+            value (str, optional): O valor do nó.
+
+        Returns:
+            int: A posição do nó.
+        """
+        self.kinds.append(kind)
+        self.values.append(value)
+        self.first_child.append(ASTArena.NONE)
+        self.next_sibling.append(ASTArena.NONE)
+        return len(self.kinds) - 1
+
+    def kind(self, index: int) -> NodeKind:
+        """
+        Retorna o tipo do nó na posição fornecida.
+        """
+        return NodeKind(self.kinds[index])
+
+    def value(self, index: int) -> Optional[str]:
+        """
+        Retorna o valor do nó na posição fornecida.
+        """
+        return self.values[index]
+
+    def children(self, index: int) -> Iterator[int]:
+        """
+        Percorre os filhos diretos de um nó.
+
+        Parameters:
+            index (int): A posição do nó.
+
+        Yields:
+            int: A posição de cada filho, em ordem.
+        """
+        child = self.first_child[index]
+        while child != ASTArena.NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    def walk(self, index: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Percorre a subárvore de um nó em pré-ordem, sem recursão.
+
+        Parameters:
+            index (int, optional): A posição da raiz da subárvore. Padrão é 0 (a raiz da arena).
+
+        Yields:
+            Tuple[int, int]: A posição de cada nó e a sua profundidade relativa à raiz da subárvore.
+        """
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        stack = [(index, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+
+            # O irmão é empilhado antes do filho para que a subárvore do filho seja visitada primeiro
+            if depth > 0 and next_sibling[node] != ASTArena.NONE:
+                stack.append((next_sibling[node], depth))
+            if first_child[node] != ASTArena.NONE:
+                stack.append((first_child[node], depth + 1))
+
+    def to_tree(self, index: int = 0) -> ASTNode:
+        """
+        Reconstrói a árvore de objetos ASTNode a partir de uma posição da arena.
+
+        Parameters:
+            index (int, optional): A posição da raiz. Padrão é 0.
+
+        Returns:
+            ASTNode: A raiz da árvore reconstruída.
+        """
+        nodes = {}
+
+        for node, _ in self.walk(index):
+            kind = NodeKind(self.kinds[node])
+            # Recria o nó com a classe específica (ForLoopNode, PrintNode, ...) sem passar pelo
+            # construtor dela, cujos parâmetros variam de classe para classe
+            node_class = ASTArena._node_classes.get(kind, ASTNode)
+            tree_node = node_class.__new__(node_class)
+            ASTNode.__init__(tree_node, kind.name, value=self.values[node])
+            nodes[node] = tree_node
+
+        # Liga cada nó aos seus filhos, na ordem da arena
+        for node, tree_node in nodes.items():
+            tree_node.children = [nodes[child] for child in self.children(node)]
+
+        return nodes[index]
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __repr__(self) -> str:
+        return f"ASTArena(nodes={len(self)})"
@@ -7,9 +7,12 @@ class ForLoopNode(ASTNode):
     Attributes:
         variable (str): O nome da variável do loop.
         iterable: A expressão ou intervalo a ser iterado.
-        body: O corpo do loop.
+        body: O corpo do loop: uma declaração ou um `BlockNode`.
+        binding (Symbol): O símbolo da variável do loop, preenchido pela análise semântica.
     """
 
+    __slots__ = ('binding',)
+
     def __init__(self, variable: str, iterable, body):
         """
         Inicializa um nó ForLoopNode na AST.
@@ -20,6 +23,27 @@ class ForLoopNode(ASTNode):
             body: O corpo do loop.
         """
         super().__init__("FOR_LOOP", value=variable, children=[iterable, body])
+        self.binding = None
+
+class BlockNode(ASTNode):
+    """
+    Representa um nó específico na AST para uma sequência de declarações no corpo de um loop,
+    separadas por ';'.
+
+    Attributes:
+        children (list): As declarações, na ordem em que são executadas.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, statements):
+        """
+        Inicializa um nó BlockNode na AST.
+
+        Parameters:
+            statements (list): As declarações do bloco.
+        """
+        super().__init__("BLOCK", children=statements)
 
 class PrintNode(ASTNode):
     """
@@ -29,6 +53,8 @@ class PrintNode(ASTNode):
         expression: A expressão a ser impressa.
     """
 
+    __slots__ = ()
+
     def __init__(self, expression):
         """
         Inicializa um nó PrintNode na AST.
@@ -47,6 +73,8 @@ class RangeNode(ASTNode):
         end: O final do intervalo.
     """
 
+    __slots__ = ()
+
     def __init__(self, start, end):
         """
         Inicializa um nó RangeNode na AST.
@@ -63,8 +91,11 @@ class IdentifierNode(ASTNode):
 
     Attributes:
         name (str): O nome do identificador.
+        binding (Symbol): O símbolo ao qual o identificador se refere, preenchido pela análise semântica.
     """
 
+    __slots__ = ('binding',)
+
     def __init__(self, name: str):
         """
         Inicializa um nó IdentifierNode na AST.
@@ -73,6 +104,7 @@ class IdentifierNode(ASTNode):
             name (str): O nome do identificador.
         """
         super().__init__("IDENTIFIER", value=name)
+        self.binding = None
 
 class IntegerNode(ASTNode):
     """
@@ -82,6 +114,8 @@ class IntegerNode(ASTNode):
         value: O valor inteiro.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         """
         Inicializa um nó IntegerNode na AST.
@@ -99,6 +133,8 @@ class StringNode(ASTNode):
         value: O valor da string.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         """
         Inicializa um nó StringNode na AST.
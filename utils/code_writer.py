@@ -0,0 +1,90 @@
+from typing import List
+
+class CodeWriter:
+    """
+    Acumula as linhas de um código gerado, controlando o nível de indentação.
+
+    Cada linha é guardada já indentada em uma lista, e o código só é montado uma vez, em
+    `getvalue`, o que mantém a geração linear no tamanho do código. Os prefixos de cada nível
+    são calculados uma única vez e reaproveitados.
+
+    Attributes:
+        lines (List[str]): As linhas escritas.
+        level (int): O nível de indentação atual.
+    """
+
+    INDENT = '    '
+
+    def __init__(self):
+        """
+        Inicializa o escritor sem linhas, no nível 0.
+        """
+        self.lines: List[str] = []
+        self.level = 0
+        self.__prefixes = ['']
+
+    def write(self, text: str) -> None:
+        """
+        Escreve uma linha no nível de indentação atual.
+
+        Args:
+            text (str): O conteúdo da linha, sem indentação.
+        """
+        self.lines.append(self.__prefixes[self.level] + text)
+
+    def indent(self) -> None:
+        """
+        Aumenta o nível de indentação das próximas linhas.
+        """
+        self.level += 1
+        if self.level == len(self.__prefixes):
+            self.__prefixes.append(self.__prefixes[-1] + self.INDENT)
+
+    def dedent(self) -> None:
+        """
+        Diminui o nível de indentação das próximas linhas.
+        """
+        if self.level == 0:
+            raise IndexError("O nível de indentação já é 0.")
+        self.level -= 1
+
+    def prepend(self, lines: List[str]) -> None:
+        """
+        Insere linhas já indentadas no início do código.
+
+        Args:
+            lines (List[str]): As linhas a serem inseridas.
+        """
+        self.lines[:0] = lines
+
+    def truncate(self, size: int) -> None:
+        """
+        Descarta as linhas escritas depois das `size` primeiras e volta ao nível 0.
+
+        Args:
+            size (int): A quantidade de linhas mantidas.
+        """
+        del self.lines[size:]
+        self.level = 0
+
+    def clear(self) -> None:
+        """
+        Remove todas as linhas e volta ao nível 0.
+        """
+        self.lines.clear()
+        self.level = 0
+
+    def getvalue(self) -> str:
+        """
+        Retorna o código escrito.
+
+        Returns:
+            str: As linhas, separadas por quebras de linha.
+        """
+        return '\n'.join(self.lines)
+
+    def __bool__(self) -> bool:
+        """
+        Indica se alguma linha foi escrita.
+        """
+        return bool(self.lines)
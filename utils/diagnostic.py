@@ -0,0 +1,39 @@
+from typing import Optional
+
+class Diagnostic:
+    """
+    Classe que representa um erro encontrado durante a análise, com a sua posição no código.
+
+    Attributes:
+        stage (str): A etapa em que o erro foi encontrado ('Léxico', 'Sintático', 'Semântico' ou 'Geração de código').
+        message (str): A descrição do erro.
+        line (int): A linha (a partir de 1) do erro, se conhecida.
+        column (int): A coluna (a partir de 1) do erro, se conhecida.
+    """
+
+    __slots__ = ('stage', 'message', 'line', 'column')
+
+    def __init__(self, stage: str, message: str, line: Optional[int] = None, column: Optional[int] = None):
+        """
+        Inicializa um diagnóstico.
+
+        Parameters:
+            stage (str): A etapa em que o erro foi encontrado.
+            message (str): A descrição do erro.
+            line (int, optional): A linha do erro.
+            column (int, optional): A coluna do erro.
+        """
+        self.stage = stage
+        self.message = message
+        self.line = line
+        self.column = column
+
+    def __repr__(self) -> str:
+        """
+        Retorna uma representação de string do diagnóstico.
+
+        Returns:
+            str: Uma representação de string do diagnóstico.
+        """
+        position = f"linha {self.line}, coluna {self.column}: " if self.line is not None else ""
+        return f"Erro {self.stage}: {position}{self.message}"
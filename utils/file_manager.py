@@ -1,3 +1,6 @@
+import mmap
+import os
+
 class FileManager:
     """
     Uma classe utilitária para processar arquivos de texto.
@@ -26,3 +29,30 @@ class FileManager:
                 return content
         except FileNotFoundError:
             raise FileNotFoundError(f"Erro: Arquivo '{filepath}' não encontrado.")
+
+    @staticmethod
+    def map(filepath: str) -> mmap.mmap:
+        """
+        Mapeia um arquivo de texto em memória, somente para leitura.
+
+        O conteúdo não é copiado: as páginas do arquivo são carregadas sob demanda pelo
+        sistema operacional e podem ser compartilhadas entre processos que mapeiem o mesmo
+        arquivo. O resultado pode ser passado diretamente para `Lexer.scanner_buffer`.
+
+        Parameters:
+            filepath (str): O caminho do arquivo.
+
+        Returns:
+            mmap.mmap: O conteúdo do arquivo mapeado em memória.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado.
+            ValueError: Se o arquivo estiver vazio.
+        """
+        try:
+            with open(filepath, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    raise ValueError(f"Erro: Arquivo '{filepath}' está vazio.")
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Erro: Arquivo '{filepath}' não encontrado.")
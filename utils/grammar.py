@@ -0,0 +1,146 @@
+from typing import Dict, List, Optional, Set, Tuple
+from utils.token_type import TokenType
+
+class Grammar:
+    """
+    Representa uma gramática livre de contexto e gera a sua tabela de análise LL(1).
+
+    A gramática é descrita em texto, uma regra por linha, no formato
+    `nao_terminal -> simbolos | simbolos | ε`. Os não terminais são escritos em minúsculas,
+    os terminais são nomes de `TokenType` e os símbolos iniciados por '@' são ações
+    semânticas, que não participam do cálculo dos conjuntos FIRST e FOLLOW.
+
+    Attributes:
+        start (str): O não terminal inicial (o lado esquerdo da primeira regra).
+        productions (Dict[str, List[Tuple[str, ...]]]): As produções de cada não terminal.
+        first (Dict[str, Set[Optional[TokenType]]]): O conjunto FIRST de cada não terminal (None representa ε).
+        follow (Dict[str, Set[Optional[TokenType]]]): O conjunto FOLLOW de cada não terminal (None representa o fim da entrada).
+    """
+
+    EPSILON = 'ε'
+
+    def __init__(self, description: str):
+        """
+        Inicializa a gramática a partir da sua descrição textual.
+
+        Parameters:
+            description (str): A descrição da gramática.
+        """
+        self.productions: Dict[str, List[Tuple[str, ...]]] = {}
+        self.start = None
+
+        for line in description.strip().splitlines():
+            head, body = (part.strip() for part in line.split('->'))
+            self.start = self.start or head
+            for alternative in body.split('|'):
+                symbols = tuple(symbol for symbol in alternative.split() if symbol != Grammar.EPSILON)
+                self.productions.setdefault(head, []).append(symbols)
+
+        self.first = self.__compute_first()
+        self.follow = self.__compute_follow()
+
+    def is_terminal(self, symbol: str) -> bool:
+        """
+        Indica se o símbolo é um terminal (um tipo de token).
+        """
+        return symbol in TokenType.__members__
+
+    def is_action(self, symbol: str) -> bool:
+        """
+        Indica se o símbolo é uma ação semântica.
+        """
+        return symbol.startswith('@')
+
+    def first_of(self, symbols: Tuple[str, ...]) -> Set[Optional[TokenType]]:
+        """
+        Calcula o conjunto FIRST de uma sequência de símbolos.
+
+        Parameters:
+            symbols (Tuple[str, ...]): A sequência de símbolos.
+
+        Returns:
+            Set[Optional[TokenType]]: Os terminais que podem iniciar a sequência (None se ela pode ser vazia).
+        """
+        result = set()
+
+        for symbol in symbols:
+            if self.is_action(symbol):
+                continue
+            if self.is_terminal(symbol):
+                result.add(TokenType[symbol])
+                return result
+
+            result |= self.first[symbol] - {None}
+            if None not in self.first[symbol]:
+                return result
+
+        result.add(None)
+        return result
+
+    def table(self) -> Dict[str, Dict[Optional[TokenType], Tuple[str, ...]]]:
+        """
+        Gera a tabela de análise LL(1): para cada não terminal e cada terminal de entrada,
+        a produção a ser aplicada. O terminal None representa o fim da entrada.
+
+        Returns:
+            Dict[str, Dict[Optional[TokenType], Tuple[str, ...]]]: A tabela de análise.
+
+        Raises:
+            ValueError: Se a gramática não for LL(1).
+        """
+        table = {head: {} for head in self.productions}
+
+        for head, alternatives in self.productions.items():
+            for symbols in alternatives:
+                lookaheads = self.first_of(symbols)
+                if None in lookaheads:
+                    lookaheads = (lookaheads - {None}) | self.follow[head]
+
+                for lookahead in lookaheads:
+                    if lookahead in table[head]:
+                        raise ValueError(f"A gramática não é LL(1): conflito em '{head}' com {lookahead}")
+                    table[head][lookahead] = symbols
+
+        return table
+
+    def __compute_first(self) -> Dict[str, Set[Optional[TokenType]]]:
+        """
+        Calcula os conjuntos FIRST de todos os não terminais por ponto fixo.
+        """
+        self.first = {head: set() for head in self.productions}
+        changed = True
+
+        while changed:
+            changed = False
+            for head, alternatives in self.productions.items():
+                for symbols in alternatives:
+                    before = len(self.first[head])
+                    self.first[head] |= self.first_of(symbols)
+                    changed = changed or len(self.first[head]) != before
+
+        return self.first
+
+    def __compute_follow(self) -> Dict[str, Set[Optional[TokenType]]]:
+        """
+        Calcula os conjuntos FOLLOW de todos os não terminais por ponto fixo.
+        """
+        follow = {head: set() for head in self.productions}
+        follow[self.start].add(None)
+        changed = True
+
+        while changed:
+            changed = False
+            for head, alternatives in self.productions.items():
+                for symbols in alternatives:
+                    for position, symbol in enumerate(symbols):
+                        if self.is_action(symbol) or self.is_terminal(symbol):
+                            continue
+
+                        rest = self.first_of(symbols[position + 1:])
+                        before = len(follow[symbol])
+                        follow[symbol] |= rest - {None}
+                        if None in rest:
+                            follow[symbol] |= follow[head]
+                        changed = changed or len(follow[symbol]) != before
+
+        return follow
@@ -0,0 +1,16 @@
+from enum import IntEnum, auto
+
+class NodeKind(IntEnum):
+    """
+    Enumeração que define os tipos de nós da árvore sintática abstrata (AST) como inteiros,
+    permitindo armazená-los de forma compacta (por exemplo, em `ASTArena`).
+    """
+
+    PROGRAM = auto()    # Raiz do programa
+    FOR_LOOP = auto()   # Loop 'para'
+    PRINT = auto()      # Instrução 'escreva'
+    RANGE = auto()      # Expressão 'intervalo'
+    IDENTIFIER = auto() # Identificadores (nomes de variáveis)
+    INTEGER = auto()    # Números inteiros
+    STRING = auto()     # Strings
+    BLOCK = auto()      # Sequência de declarações no corpo de um loop
@@ -0,0 +1,151 @@
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+from utils.syntax_tree import ASTNode
+
+def _call(stage: str, function: Callable, *args, **kwargs) -> Any:
+    """
+    Executa uma etapa sem medição. Usada como `Profiler.run` quando o perfil está desativado.
+    """
+    return function(*args, **kwargs)
+
+class Profiler:
+    """
+    Registra, para cada etapa do pipeline, o tempo de execução, a quantidade de itens
+    produzidos (tokens, nós ou linhas de código) e o pico de memória alocada (via `tracemalloc`).
+
+    As medições de uma mesma etapa são acumuladas entre as chamadas. Quando desativado,
+    `run` apenas chama a etapa, sem medir nada e sem iniciar o `tracemalloc`.
+
+    Attributes:
+        enabled (bool): Indica se as medições estão ativas.
+        memory (bool): Indica se o pico de memória é medido.
+        stages (Dict[str, Dict]): As medições de cada etapa, na ordem da primeira execução.
+    """
+
+    def __init__(self, enabled: bool = True, memory: bool = True):
+        """
+        Inicializa o perfil.
+
+        Parameters:
+            enabled (bool, optional): Ativa as medições. Padrão é True.
+            memory (bool, optional): Mede o pico de memória de cada etapa. Padrão é True.
+        """
+        self.enabled = enabled
+        self.memory = enabled and memory
+        self.stages: Dict[str, Dict] = {}
+
+        if not enabled:
+            self.run = _call
+        elif self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def run(self, stage: str, function: Callable, *args, **kwargs) -> Any:
+        """
+        Executa uma etapa, registrando as suas medições.
+
+        Args:
+            stage (str): O nome da etapa.
+            function (Callable): A função da etapa.
+            *args, **kwargs: Os argumentos da função.
+
+        Returns:
+            Any: O resultado da etapa.
+        """
+        if self.memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        record = self.stages.setdefault(stage, {'calls': 0, 'time': 0.0, 'count': 0, 'peak': 0})
+        record['calls'] += 1
+        record['time'] += elapsed
+        record['count'] += Profiler.count(result)
+        if self.memory:
+            record['peak'] = max(record['peak'], tracemalloc.get_traced_memory()[1] - before)
+
+        return result
+
+    def stop(self) -> None:
+        """
+        Encerra o `tracemalloc`, se ele foi iniciado pelo perfil. As medições são mantidas.
+        """
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.memory = False
+
+    @staticmethod
+    def count(result: Any) -> int:
+        """
+        Conta os itens produzidos por uma etapa: os elementos de uma lista (tokens ou entradas
+        semânticas), os nós de uma árvore sintática ou as linhas de um código gerado. Para as
+        etapas que também retornam diagnósticos, conta o primeiro elemento do par.
+
+        Args:
+            result (Any): O resultado da etapa.
+
+        Returns:
+            int: A quantidade de itens (0 se o resultado não for reconhecido).
+        """
+        if isinstance(result, tuple) and result:
+            result = result[0]
+        if isinstance(result, ASTNode):
+            return sum(1 for _ in result.walk())
+        if isinstance(result, str):
+            return result.count('\n') + 1 if result else 0
+        if isinstance(result, list):
+            return len(result)
+        return 0
+
+    def to_json(self) -> str:
+        """
+        Exporta as medições em JSON. Os tempos estão em segundos e a memória em bytes.
+
+        Returns:
+            str: As medições em JSON.
+        """
+        stages = [{'stage': stage, **record} for stage, record in self.stages.items()]
+        return json.dumps({'stages': stages, 'total_time': sum(record['time'] for record in self.stages.values())}, ensure_ascii=False, indent=2)
+
+    def to_folded(self, root: str = 'pipeline') -> str:
+        """
+        Exporta os tempos no formato de pilhas agregadas ("folded stacks"), aceito por
+        ferramentas de flame graph como `flamegraph.pl` e speedscope. Os valores estão em microssegundos.
+
+        Args:
+            root (str, optional): O nome do quadro raiz. Padrão é 'pipeline'.
+
+        Returns:
+            str: Uma linha por etapa.
+        """
+        return ''.join(f"{root};{stage} {round(record['time'] * 1e6)}\n" for stage, record in self.stages.items())
+
+    def save(self, filepath: str) -> None:
+        """
+        Grava as medições em um arquivo: em pilhas agregadas se a extensão for '.folded'
+        ou '.txt', e em JSON nos demais casos.
+
+        Args:
+            filepath (str): O caminho do arquivo.
+        """
+        content = self.to_folded() if filepath.endswith(('.folded', '.txt')) else self.to_json()
+        with open(filepath, 'w') as file:
+            file.write(content)
+
+    def __repr__(self) -> str:
+        """
+        Retorna uma representação em string das medições.
+
+        Returns:
+            str: Uma tabela com as medições de cada etapa.
+        """
+        parts = ["Perfil:\n"]
+        total = sum(record['time'] for record in self.stages.values()) or 1.0
+        for stage, record in self.stages.items():
+            parts.append(f"Etapa: {stage}, Tempo: {record['time'] * 1e3:.3f} ms ({record['time'] / total:.0%}), "
+                         f"Itens: {record['count']}, Pico de memória: {record['peak']} bytes\n")
+        return ''.join(parts)
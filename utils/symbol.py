@@ -0,0 +1,54 @@
+import builtins
+import keyword
+
+class Symbol:
+    """
+    Representa uma variável declarada no programa, resolvida pela análise semântica.
+
+    Attributes:
+        name (str): O nome da variável (internado).
+        target (str): O nome usado para a variável no código Python gerado.
+        depth (int): A profundidade do escopo em que a variável foi declarada (0 é o escopo global).
+        node: O nó da AST que declarou a variável.
+    """
+
+    __slots__ = ('name', 'target', 'depth', 'node')
+
+    # Prefixo dos nomes renomeados no código gerado; nenhum nome auxiliar do CodeGenerator o usa
+    MANGLE_PREFIX = '_escreva_v_'
+
+    def __init__(self, name: str, depth: int, node=None):
+        """
+        Inicializa um símbolo.
+
+        Parameters:
+            name (str): O nome da variável (internado).
+            depth (int): A profundidade do escopo da declaração.
+            node (optional): O nó da AST que declarou a variável.
+        """
+        self.name = name
+        self.target = Symbol.target_for(name)
+        self.depth = depth
+        self.node = node
+
+    @staticmethod
+    def target_for(name: str) -> str:
+        """
+        Calcula o nome usado para uma variável no código Python gerado.
+
+        Nomes que são palavras reservadas ou funções embutidas do Python (como 'print' ou
+        'range', usados pelo próprio código gerado) e nomes iniciados por '_escreva' (reservados
+        aos nomes auxiliares do CodeGenerator) recebem um prefixo. Os demais são mantidos.
+
+        Args:
+            name (str): O nome da variável.
+
+        Returns:
+            str: O nome no código gerado.
+        """
+        if keyword.iskeyword(name) or hasattr(builtins, name) or name.startswith('_escreva'):
+            return f"{Symbol.MANGLE_PREFIX}{name}"
+        return name
+
+    def __repr__(self) -> str:
+        return f"Symbol(name={self.name!r}, target={self.target!r}, depth={self.depth})"
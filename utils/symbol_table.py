@@ -0,0 +1,92 @@
+import sys
+from typing import Dict, List, Optional
+from utils.symbol import Symbol
+
+class SymbolTable:
+    """
+    Tabela de símbolos com escopos aninhados.
+
+    Os escopos formam uma pilha de dicionários, um por escopo, com os símbolos declarados
+    nele. Além da pilha, uma tabela de dispersão única associa cada nome à cadeia das suas
+    declarações visíveis (a mais interna por último), de modo que a resolução de um nome
+    custa O(1) independentemente da profundidade do aninhamento e do tamanho do programa.
+    Os nomes são internados, o que torna as comparações e consultas de dicionário mais baratas.
+
+    Attributes:
+        scopes (List[Dict[str, Symbol]]): Os escopos abertos; o primeiro é o escopo global.
+    """
+
+    def __init__(self):
+        """
+        Inicializa a tabela apenas com o escopo global.
+        """
+        self.scopes: List[Dict[str, Symbol]] = [{}]
+        self.__visible: Dict[str, List[Symbol]] = {}
+
+    @property
+    def depth(self) -> int:
+        """
+        Retorna a profundidade do escopo atual (0 é o escopo global).
+        """
+        return len(self.scopes) - 1
+
+    def enter_scope(self) -> None:
+        """
+        Abre um novo escopo, aninhado no atual.
+        """
+        self.scopes.append({})
+
+    def exit_scope(self) -> None:
+        """
+        Fecha o escopo atual, tornando invisíveis os símbolos declarados nele.
+
+        Raises:
+            IndexError: Se o escopo atual for o global.
+        """
+        if len(self.scopes) == 1:
+            raise IndexError("O escopo global não pode ser fechado")
+
+        for name in self.scopes.pop():
+            chain = self.__visible[name]
+            chain.pop()
+            if not chain:
+                del self.__visible[name]
+
+    def declare(self, name: str, node=None) -> Symbol:
+        """
+        Declara uma variável no escopo atual. Uma declaração com o mesmo nome em um escopo
+        externo fica oculta até que o escopo atual seja fechado; no mesmo escopo, a nova
+        declaração substitui a anterior.
+
+        Args:
+            name (str): O nome da variável.
+            node (optional): O nó da AST que declarou a variável.
+
+        Returns:
+            Symbol: O símbolo declarado.
+        """
+        name = sys.intern(name)
+        scope = self.scopes[-1]
+        symbol = Symbol(name, self.depth, node)
+        chain = self.__visible.setdefault(name, [])
+
+        if name in scope:
+            chain[-1] = symbol
+        else:
+            chain.append(symbol)
+        scope[name] = symbol
+
+        return symbol
+
+    def resolve(self, name: str) -> Optional[Symbol]:
+        """
+        Resolve um nome para a sua declaração visível mais interna.
+
+        Args:
+            name (str): O nome da variável.
+
+        Returns:
+            Optional[Symbol]: O símbolo, ou None se o nome não estiver declarado.
+        """
+        chain = self.__visible.get(name)
+        return chain[-1] if chain else None
@@ -1,14 +1,21 @@
+from typing import Iterator, List, Tuple
+from utils.node_kind import NodeKind
+
 class ASTNode:
     """
     Representa um nó na árvore sintática abstrata (AST).
 
     Attributes:
         node_type (str): O tipo do nó na AST.
+        kind (NodeKind): O tipo do nó como inteiro, ou None se o tipo não estiver em `NodeKind`.
         value: O valor associado ao nó.
         children (list): Lista de nós filhos.
         expression: Expressão associada ao nó.
     """
 
+    # Evita o dicionário por instância; as subclasses declaram __slots__ vazio para manter o layout
+    __slots__ = ('node_type', 'kind', 'value', 'children', 'expression')
+
     def __init__(self, node_type: str, value=None, children=None, expression=None):
         """
         Inicializa um nó da AST.
@@ -20,24 +27,121 @@ class ASTNode:
             expression: Expressão associada ao nó.
         """
         self.node_type = node_type
+        self.kind = NodeKind.__members__.get(node_type)
         self.value = value
         self.children = children or []
         self.expression = expression
 
+    def walk(self) -> Iterator[Tuple['ASTNode', int]]:
+        """
+        Percorre o nó e seus descendentes em pré-ordem usando uma pilha explícita, de modo
+        que árvores muito profundas não esbarram no limite de recursão do Python.
+        Filhos que não são nós da AST são ignorados.
+
+        Yields:
+            Tuple[ASTNode, int]: Cada nó e a sua profundidade em relação a este nó.
+        """
+        stack = [(self, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+
+            # Os filhos são empilhados em ordem inversa para serem visitados na ordem original
+            children = node.children
+            for position in range(len(children) - 1, -1, -1):
+                if isinstance(children[position], ASTNode):
+                    stack.append((children[position], depth + 1))
+
     def __repr__(self, level=0):
         """
         Retorna uma representação visual do nó e de seus filhos, indentados de acordo com o nível.
 
+        A representação é montada em uma única lista de partes, unida ao final, o que mantém
+        o custo linear no tamanho da saída.
+
         Parameters:
-            level (int, optional): O nível de indentação. Usado recursivamente para indentar os filhos.
+            level (int, optional): O nível de indentação do nó.
         
         Returns:
             str: Representação visual do nó e de seus filhos.
         """
-        ret = "\t" * level + f"{self.node_type} "
-        if self.value is not None:
-            ret += f"({self.value})"
-        ret += "\n"
-        for child in self.children:
-            ret += child.__repr__(level + 1)
-        return ret
+        parts = []
+        for node, depth in self.walk():
+            parts.append("\t" * (level + depth) + f"{node.node_type} ")
+            if node.value is not None:
+                parts.append(f"({node.value})")
+            parts.append("\n")
+        return ''.join(parts)
+
+class _Leave:
+    """
+    Marca, na pilha de `NodeVisitor.visit`, a saída de um nó cujos filhos já foram visitados.
+    É uma classe própria para que nenhum valor da árvore (como uma tupla) seja confundido com ela.
+    """
+
+    __slots__ = ('method', 'node')
+
+    def __init__(self, method, node: ASTNode):
+        self.method = method
+        self.node = node
+
+class NodeVisitor:
+    """
+    Classe base para as etapas que percorrem a AST.
+
+    O percurso é feito em pré-ordem com uma pilha explícita. Para cada nó é chamado o método
+    `visit_<tipo>` (por exemplo, `visit_for_loop` para nós do tipo FOR_LOOP) ou, na falta dele,
+    `generic_visit`. O método retorna a lista de filhos que devem ser visitados em seguida.
+    Se existir um método `leave_<tipo>`, ele é chamado depois que todos esses filhos forem visitados.
+    """
+
+    def visit(self, root: ASTNode) -> None:
+        """
+        Percorre a árvore a partir do nó fornecido.
+
+        Parameters:
+            root (ASTNode): A raiz do percurso.
+        """
+        # Os métodos de cada tipo de nó são resolvidos uma única vez por instância
+        try:
+            methods = self.__methods
+        except AttributeError:
+            methods = self.__methods = {}
+        stack = [root]
+
+        while stack:
+            node = stack.pop()
+
+            # Saída de um nó cujos filhos já foram visitados
+            if node.__class__ is _Leave:
+                node.method(node.node)
+                continue
+
+            resolved = methods.get(node.node_type)
+            if resolved is None:
+                name = node.node_type.lower()
+                resolved = (getattr(self, f"visit_{name}", self.generic_visit), getattr(self, f"leave_{name}", None))
+                methods[node.node_type] = resolved
+
+            method, leave = resolved
+            if leave is not None:
+                stack.append(_Leave(leave, node))
+
+            children = method(node)
+            if children:
+                for position in range(len(children) - 1, -1, -1):
+                    if isinstance(children[position], ASTNode):
+                        stack.append(children[position])
+
+    def generic_visit(self, node: ASTNode) -> List[ASTNode]:
+        """
+        Visita um nó sem tratamento específico, seguindo para todos os seus filhos.
+
+        Parameters:
+            node (ASTNode): O nó visitado.
+
+        Returns:
+            List[ASTNode]: Os filhos a serem visitados.
+        """
+        return node.children
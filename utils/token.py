@@ -5,18 +5,27 @@ class Token:
     Attributes:
         type (TokenType): O tipo do token.
         value (str): O valor associado ao token.
+        line (int): A linha (a partir de 1) em que o token aparece, se conhecida.
+        column (int): A coluna (a partir de 1) em que o token começa, se conhecida.
     """
 
-    def __init__(self, type, value):
+    # Evita o dicionário por instância, reduzindo o custo de memória de longas sequências de tokens
+    __slots__ = ('type', 'value', 'line', 'column')
+
+    def __init__(self, type, value, line=None, column=None):
         """
         Inicializa uma instância de Token com o tipo e o valor fornecidos.
 
         Parameters:
             type (TokenType): O tipo do token.
             value (str): O valor associado ao token.
+            line (int, optional): A linha em que o token aparece.
+            column (int, optional): A coluna em que o token começa.
         """
         self.type = type
         self.value = value
+        self.line = line
+        self.column = column
 
     def __repr__(self, level=0) -> str:
         """
@@ -30,3 +39,46 @@ class Token:
         """
         ret = "\t" * level + f"Token(type={self.type.name}, value='{self.value}')"
         return ret
+
+class LazyToken(Token):
+    """
+    Token que guarda apenas a posição do seu valor no texto de origem, materializando
+    o valor somente quando ele é acessado.
+
+    Attributes:
+        source: O texto de origem (str, bytes ou um arquivo mapeado em memória).
+        start (int): A posição inicial do valor em `source`.
+        end (int): A posição final (exclusiva) do valor em `source`.
+    """
+
+    __slots__ = ('source', 'start', 'end')
+
+    def __init__(self, type, source, start, end, line=None, column=None):
+        """
+        Inicializa uma instância de LazyToken.
+
+        Parameters:
+            type (TokenType): O tipo do token.
+            source: O texto de origem.
+            start (int): A posição inicial do valor em `source`.
+            end (int): A posição final (exclusiva) do valor em `source`.
+            line (int, optional): A linha em que o token aparece.
+            column (int, optional): A coluna em que o token começa.
+        """
+        self.type = type
+        self.source = source
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+
+    @property
+    def value(self) -> str:
+        """
+        Materializa o valor do token a partir do texto de origem.
+
+        Returns:
+            str: O valor do token.
+        """
+        value = self.source[self.start:self.end]
+        return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,120 @@
+import sys
+from array import array
+from typing import Iterator, List
+from utils.token import Token, LazyToken
+from utils.token_type import TokenType
+
+class TokenBuffer:
+    """
+    Armazena uma sequência de tokens em colunas compactas, em vez de um objeto por token.
+
+    No modo preguiçoso (`lazy=True`) os valores não são copiados: cada token guarda apenas
+    suas posições em `source`, e o texto é extraído somente quando é acessado. Combinado com
+    `FileManager.map`, isso permite analisar arquivos grandes sem copiar o conteúdo e
+    compartilhar as mesmas páginas do arquivo entre vários processos.
+
+    Attributes:
+        source: O texto de onde os tokens foram extraídos (str, bytes ou arquivo mapeado em memória).
+        lazy (bool): Indica se os valores são materializados apenas sob demanda.
+        types (array): O código (valor de `TokenType`) de cada token.
+        starts (array): A posição inicial de cada token em `source`.
+        ends (array): A posição final (exclusiva) de cada token em `source`.
+        values (List[str]): O valor de cada token, internado para compartilhar valores repetidos.
+            Permanece vazia no modo preguiçoso.
+    """
+
+    # Tabela que converte o código armazenado de volta para o TokenType
+    _types_by_code = {token_type.value: token_type for token_type in TokenType}
+
+    __slots__ = ('source', 'lazy', 'types', 'starts', 'ends', 'values')
+
+    def __init__(self, source, lazy: bool = False):
+        """
+        Inicializa um buffer vazio associado ao texto fornecido.
+
+        Parameters:
+            source: O texto de onde os tokens serão extraídos.
+            lazy (bool, optional): Se True, os valores são materializados apenas sob demanda. Padrão é False.
+        """
+        self.source = source
+        self.lazy = lazy
+        self.types = array('B')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.values: List[str] = []
+
+    def append(self, token_type: TokenType, start: int, end: int) -> None:
+        """
+        Adiciona um token ao buffer.
+
+        Parameters:
+            token_type (TokenType): O tipo do token.
+            start (int): A posição inicial do token em `source`.
+            end (int): A posição final (exclusiva) do token em `source`.
+        """
+        self.types.append(token_type.value)
+        self.starts.append(start)
+        self.ends.append(end)
+
+        if not self.lazy:
+            self.values.append(sys.intern(self.__slice(start, end)))
+
+    def value_at(self, index: int) -> str:
+        """
+        Retorna o valor do token na posição fornecida, extraindo-o do texto de origem
+        quando o buffer está no modo preguiçoso.
+
+        Parameters:
+            index (int): A posição do token.
+
+        Returns:
+            str: O valor do token.
+        """
+        if self.lazy:
+            return self.__slice(self.starts[index], self.ends[index])
+        return self.values[index]
+
+    def __slice(self, start: int, end: int) -> str:
+        """
+        Extrai um trecho do texto de origem, decodificando-o quando a origem é binária.
+        """
+        value = self.source[start:end]
+        return value.decode() if isinstance(value, bytes) else value
+
+    def type_at(self, index: int) -> TokenType:
+        """
+        Retorna o tipo do token na posição fornecida sem materializar um objeto Token.
+
+        Parameters:
+            index (int): A posição do token.
+
+        Returns:
+            TokenType: O tipo do token.
+        """
+        return self._types_by_code[self.types[index]]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        """
+        Materializa o token na posição fornecida, permitindo que o buffer seja usado
+        no lugar de uma lista de tokens (por exemplo, em `Syntactic.parse`). No modo
+        preguiçoso é retornado um `LazyToken`, cujo valor só é extraído quando acessado.
+
+        Parameters:
+            index (int): A posição do token.
+
+        Returns:
+            Token: O token correspondente.
+        """
+        if self.lazy:
+            return LazyToken(self._types_by_code[self.types[index]], self.source, self.starts[index], self.ends[index])
+        return Token(self._types_by_code[self.types[index]], self.values[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"TokenBuffer(tokens={len(self)})"
@@ -26,5 +26,7 @@ class TokenPatterns(Enum):
             (r'\(', 'LPAREN'),                              # Padrão para o parêntese esquerdo
             (r'\)', 'RPAREN'),                              # Padrão para o parêntese direito
             (r':', 'COLON'),                                # Padrão para dois pontos
+            (r';', 'SEMICOLON'),                            # Padrão para o ponto e vírgula
+            (r'#[^\n]*', 'COMMENT'),                        # Padrão para comentários (ignorados pelo lexer)
             (r'[^a-zA-Z0-9_ \t\n,\'"]', 'UNKNOWN'),         # Padrão para caracteres desconhecidos
         ]
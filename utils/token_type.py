@@ -19,3 +19,4 @@ class TokenType(Enum):
     RPAREN = auto()     # Parêntese direito ')'
     COLON = auto()      # Dois pontos ':'
     COMMA = auto()      # Vírgula ','
+    SEMICOLON = auto()  # Ponto e vírgula ';', que separa as declarações do corpo de um loop